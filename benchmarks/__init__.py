@@ -0,0 +1 @@
+"""Benchmark harness replaying recorded API responses, see run_benchmarks.py."""
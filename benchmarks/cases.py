@@ -0,0 +1,188 @@
+"""Benchmark cases for the fetch, AI and render paths.
+
+Each case receives the stubbed services from stubs.stubbed_services and the
+workload size (number of videos or channels) and runs one hot path end to end.
+"""
+
+from types import SimpleNamespace
+from typing import Callable
+from unittest.mock import MagicMock, patch
+
+from benchmarks.stubs import bench_channel_id, bench_video_id
+
+BenchmarkCase = Callable[[SimpleNamespace, int], object]
+
+
+def trending_api(services: SimpleNamespace, size: int) -> object:
+    from src.helpers.youtube_helper import get_trending_videos
+
+    return get_trending_videos(services.youtube, "DE")
+
+
+def trending_dlp(services: SimpleNamespace, size: int) -> object:
+    from src.helpers.youtube_helper import get_trending_videos_dlp
+
+    return get_trending_videos_dlp("DE", max_results=size)
+
+
+def search_api(services: SimpleNamespace, size: int) -> object:
+    from src.helpers.youtube_helper import search_videos
+
+    return search_videos(services.youtube, "KI Trends", max_results=size)
+
+
+def search_dlp(services: SimpleNamespace, size: int) -> object:
+    from src.helpers.youtube_helper import search_videos_dlp
+
+    return search_videos_dlp("KI Trends", max_results=size)
+
+
+def search_pages_api(services: SimpleNamespace, size: int) -> object:
+    from src.helpers.search_helper import load_search_page
+
+    return [load_search_page("KI Trends", page, services.youtube) for page in (1, 2, 3)]
+
+
+def search_pages_dlp(services: SimpleNamespace, size: int) -> object:
+    from src.helpers.search_helper import load_search_page
+
+    return [load_search_page("KI Trends", page) for page in (1, 2, 3)]
+
+
+def search_dlp_enriched(services: SimpleNamespace, size: int) -> object:
+    from src.helpers.youtube_helper import enrich_videos_dlp, search_videos_dlp
+
+    return enrich_videos_dlp(search_videos_dlp("KI Trends", size), budget_s=30)
+
+
+def search_dlp_frame(services: SimpleNamespace, size: int) -> object:
+    from src.helpers.video_frame_helper import (
+        dedup_videos,
+        filter_by_duration,
+        sort_by_upload_date,
+        videos_to_frame,
+    )
+    from src.helpers.youtube_helper import search_videos_dlp
+
+    frame = dedup_videos(videos_to_frame(search_videos_dlp("KI Trends", size)))
+    return sort_by_upload_date(filter_by_duration(frame, max_seconds=600))
+
+
+def recent_videos_api(services: SimpleNamespace, size: int) -> object:
+    from src.helpers.youtube_helper import get_recent_videos_from_subscriptions
+
+    channel_ids = [bench_channel_id(i) for i in range(size)]
+    return get_recent_videos_from_subscriptions(services.youtube, channel_ids, 1)
+
+
+def recent_videos_rss(services: SimpleNamespace, size: int) -> object:
+    from src.helpers.youtube_helper import get_recent_videos_from_channels_RSS
+
+    channel_ids = [bench_channel_id(i) for i in range(size)]
+    return get_recent_videos_from_channels_RSS(channel_ids, max_videos=1)
+
+
+def poll_channel_feeds(services: SimpleNamespace, size: int) -> object:
+    from src.helpers.feed_helper import fetch_channel_video_ids
+
+    channel_ids = [bench_channel_id(i) for i in range(size)]
+    # The second poll finds every feed unchanged and is answered with 304.
+    for _ in range(2):
+        video_ids = [fetch_channel_video_ids(channel, 5) for channel in channel_ids]
+    return video_ids
+
+
+def subscriptions(services: SimpleNamespace, size: int) -> object:
+    from src.helpers.youtube_helper import get_subscriptions
+
+    return get_subscriptions(
+        bench_channel_id(0),
+        services.youtube,
+        csv_filename=str(services.workdir / "subscriptions.csv"),
+        gitignore_path=str(services.workdir / ".gitignore"),
+    )
+
+
+def video_data_dlp(services: SimpleNamespace, size: int) -> object:
+    from src.helpers.youtube_helper import get_video_data_dlp
+
+    return [get_video_data_dlp(bench_video_id(i)) for i in range(size)]
+
+
+def transcripts(services: SimpleNamespace, size: int) -> object:
+    from src.helpers.youtube_helper import get_transcript
+
+    return [get_transcript(bench_video_id(i)) for i in range(size)]
+
+
+def combine_transcripts(services: SimpleNamespace, size: int) -> object:
+    from src.helpers.gemini_helper import combine_video_id_title_and_transcript
+
+    videos = [
+        {"video_id": bench_video_id(i), "title": f"Video {i}"} for i in range(size)
+    ]
+    return combine_video_id_title_and_transcript(videos)
+
+
+def combine_digests(services: SimpleNamespace, size: int) -> object:
+    from src.helpers.digest_helper import combine_video_digests
+
+    videos = [
+        {"video_id": bench_video_id(i), "title": f"Video {i}"} for i in range(size)
+    ]
+    # The second run stands for a repeated recommendation.
+    combine_video_digests(videos)
+    return combine_video_digests(videos)
+
+
+def summaries(services: SimpleNamespace, size: int) -> object:
+    from src.helpers.gemini_helper import get_summary
+    from src.helpers.youtube_helper import get_transcript
+
+    return [
+        get_summary(False, get_transcript(bench_video_id(i)), f"Video {i}")
+        for i in range(size)
+    ]
+
+
+def _trend_recommendations(services: SimpleNamespace, search_method: str) -> object:
+    import src.helpers.dashboard_helper as dashboard_helper
+
+    with patch.object(dashboard_helper, "st", MagicMock()), patch.object(
+        dashboard_helper, "build_video_list"
+    ) as build_video_list:
+        dashboard_helper.build_trend_recommendations(
+            False, search_method, services.youtube, "KI, Fußball"
+        )
+    return build_video_list.call_args
+
+
+def trend_recommendations_api(services: SimpleNamespace, size: int) -> object:
+    return _trend_recommendations(services, "YouTube API")
+
+
+def trend_recommendations_dlp(services: SimpleNamespace, size: int) -> object:
+    return _trend_recommendations(services, "yt-dlp (Experimentell)")
+
+
+CASES: dict[str, BenchmarkCase] = {
+    "get_trending_videos": trending_api,
+    "get_trending_videos_dlp": trending_dlp,
+    "search_videos": search_api,
+    "search_videos_dlp": search_dlp,
+    "search_videos_dlp_frame": search_dlp_frame,
+    "load_search_page_api": search_pages_api,
+    "load_search_page_dlp": search_pages_dlp,
+    "enrich_videos_dlp": search_dlp_enriched,
+    "get_recent_videos_from_subscriptions": recent_videos_api,
+    "get_recent_videos_from_channels_RSS": recent_videos_rss,
+    "fetch_channel_video_ids": poll_channel_feeds,
+    "get_subscriptions": subscriptions,
+    "get_video_data_dlp": video_data_dlp,
+    "get_transcript": transcripts,
+    "combine_video_id_title_and_transcript": combine_transcripts,
+    "combine_video_digests": combine_digests,
+    "get_summary": summaries,
+    "build_trend_recommendations_api": trend_recommendations_api,
+    "build_trend_recommendations_dlp": trend_recommendations_dlp,
+}
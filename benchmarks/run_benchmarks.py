@@ -0,0 +1,274 @@
+"""Runs the benchmark cases against recorded responses and writes a JSON report.
+
+Usage:
+    python -m benchmarks.run_benchmarks --size 20 --latency 0.01 \
+        --service-latency gemini=0.3 --output benchmarks/reports/current.json \
+        --compare benchmarks/reports/baseline.json
+
+Every case runs twice per repetition: once against empty caches (cold) and
+once more against the caches filled by the first run (warm). Reports written
+with the same size and latency settings can be compared with --compare, which
+exits with status 1 if a case got slower or uses more calls or quota.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager, redirect_stdout
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterator
+from unittest.mock import patch
+
+# The helpers read their API keys on import. The stubs replace every client,
+# so placeholder keys are enough.
+os.environ.setdefault("YOUTUBE_API_KEY", "benchmark")
+os.environ.setdefault("TOKEN_GOOGLEAPI", "benchmark")
+
+from benchmarks.cases import CASES
+from benchmarks.stubs import SERVICES, Latency, stubbed_services
+
+REPORT_VERSION = 1
+DEFAULT_TOLERANCE = 0.25
+
+
+@contextmanager
+def isolated_caches(directory: Path) -> Iterator[None]:
+    """Points the persistent caches at a directory and empties the in-memory caches."""
+    import src.helpers.cache_helper as cache_helper
+    import src.helpers.search_index_helper as search_index_helper
+    import src.helpers.youtube_helper as youtube_helper
+
+    for cached_function in (
+        youtube_helper.search_videos_dlp,
+        youtube_helper.get_recent_videos_from_channels_RSS,
+    ):
+        cached_function.clear()
+
+    with patch.object(
+        cache_helper, "CACHE_DB", str(directory / "cache.db")
+    ), patch.object(search_index_helper, "INDEX_DB", str(directory / "search_index.db")):
+        yield
+
+
+def _summarize(durations: list[float]) -> dict[str, float]:
+    return {
+        "min": round(min(durations), 6),
+        "median": round(statistics.median(durations), 6),
+        "mean": round(statistics.fmean(durations), 6),
+        "max": round(max(durations), 6),
+    }
+
+
+def run_case(name: str, size: int, latency: Latency, repeat: int) -> dict[str, Any]:
+    """Runs one benchmark case cold and warm.
+
+    Args:
+        name (str): Key in benchmarks.cases.CASES.
+        size (int): Number of videos or channels of the workload.
+        latency (Latency): Simulated latency per service.
+        repeat (int): Number of repetitions.
+
+    Returns:
+        dict[str, Any]: Wall time statistics, call counts and quota units for
+                        the cold and the warm run.
+    """
+    case = CASES[name]
+    phases: dict[str, dict[str, Any]] = {"cold": {}, "warm": {}}
+    durations: dict[str, list[float]] = {"cold": [], "warm": []}
+
+    # Debug prints are part of the measured cost, but not of the output.
+    for _ in range(repeat):
+        with tempfile.TemporaryDirectory() as directory, isolated_caches(
+            Path(directory)
+        ), stubbed_services(latency, items_per_page=size) as services, open(
+            os.devnull, "w"
+        ) as devnull, redirect_stdout(devnull):
+            services.workdir = Path(directory)
+            for phase in ("cold", "warm"):
+                services.recorder.reset()
+                services.gemini.prompt_chars = 0
+                start = time.perf_counter()
+                case(services, size)
+                durations[phase].append(time.perf_counter() - start)
+                phases[phase] = {
+                    "calls": dict(sorted(services.recorder.calls.items())),
+                    "quota_units": services.recorder.quota_units,
+                    "gemini_prompt_chars": services.gemini.prompt_chars,
+                }
+
+    for phase in phases:
+        phases[phase]["wall_time_s"] = _summarize(durations[phase])
+    return phases
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], text=True, stderr=subprocess.DEVNULL
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(
+    cases: list[str] | None = None,
+    size: int = 20,
+    latency: Latency | None = None,
+    repeat: int = 3,
+) -> dict[str, Any]:
+    """Runs the selected benchmark cases and returns the report.
+
+    Args:
+        cases (list[str] | None, optional): Case names. Defaults to all cases.
+        size (int, optional): Number of videos or channels. Defaults to 20.
+        latency (Latency | None, optional): Simulated latency. Defaults to none.
+        repeat (int, optional): Repetitions per case. Defaults to 3.
+
+    Returns:
+        dict[str, Any]: The report with a 'meta' and a 'results' section.
+    """
+    latency = latency or Latency()
+    selected = cases or list(CASES)
+    unknown = [name for name in selected if name not in CASES]
+    if unknown:
+        raise ValueError(f"Unbekannte Benchmarks: {', '.join(unknown)}")
+
+    return {
+        "meta": {
+            "version": REPORT_VERSION,
+            "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "size": size,
+            "repeat": repeat,
+            "latency_s": latency.values,
+        },
+        "results": {name: run_case(name, size, latency, repeat) for name in selected},
+    }
+
+
+def compare_reports(
+    baseline: dict[str, Any],
+    current: dict[str, Any],
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> list[str]:
+    """Lists the regressions of a report against a baseline report.
+
+    A case regresses if its median wall time grows by more than the
+    tolerance, or if it needs more calls or quota units than before.
+
+    Args:
+        baseline (dict[str, Any]): The reference report.
+        current (dict[str, Any]): The new report.
+        tolerance (float, optional): Allowed relative slowdown. Defaults to 0.25.
+
+    Returns:
+        list[str]: One message per regression. Empty if nothing regressed.
+    """
+    regressions = []
+    for name, phases in current["results"].items():
+        baseline_phases = baseline["results"].get(name)
+        if not baseline_phases:
+            continue
+        for phase, result in phases.items():
+            before = baseline_phases.get(phase)
+            if not before:
+                continue
+
+            old_median = before["wall_time_s"]["median"]
+            new_median = result["wall_time_s"]["median"]
+            # Differences below a millisecond are timer noise.
+            slower = new_median - old_median > 0.001
+            if slower and new_median > old_median * (1 + tolerance):
+                regressions.append(
+                    f"{name} ({phase}): Laufzeit {old_median:.4f}s -> {new_median:.4f}s"
+                )
+            if result["quota_units"] > before["quota_units"]:
+                regressions.append(
+                    f"{name} ({phase}): Quota {before['quota_units']} -> "
+                    f"{result['quota_units']}"
+                )
+            old_calls = sum(before["calls"].values())
+            new_calls = sum(result["calls"].values())
+            if new_calls > old_calls:
+                regressions.append(
+                    f"{name} ({phase}): Aufrufe {old_calls} -> {new_calls}"
+                )
+    return regressions
+
+
+def _parse_service_latency(values: list[str]) -> dict[str, float]:
+    latencies = {}
+    for value in values:
+        service, _, seconds = value.partition("=")
+        if service not in SERVICES or not seconds:
+            raise argparse.ArgumentTypeError(
+                f"Ungültige Latenz '{value}', erwartet z.B. gemini=0.3 "
+                f"(Dienste: {', '.join(SERVICES)})"
+            )
+        latencies[service] = float(seconds)
+    return latencies
+
+
+def _print_summary(report: dict[str, Any]) -> None:
+    print(f"{'Benchmark':45} {'kalt (s)':>10} {'warm (s)':>10} {'Aufrufe':>8} {'Quota':>6}")
+    for name, phases in report["results"].items():
+        cold, warm = phases["cold"], phases["warm"]
+        print(
+            f"{name:45} {cold['wall_time_s']['median']:>10.4f} "
+            f"{warm['wall_time_s']['median']:>10.4f} "
+            f"{sum(cold['calls'].values()):>8} {cold['quota_units']:>6}"
+        )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cases", nargs="+", choices=sorted(CASES), help="Auswahl")
+    parser.add_argument("--size", type=int, default=20, help="Videos bzw. Kanäle")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="Latenz pro Aufruf in Sekunden"
+    )
+    parser.add_argument(
+        "--service-latency",
+        nargs="*",
+        default=[],
+        metavar="DIENST=SEKUNDEN",
+        help="Latenz für einzelne Dienste, z.B. gemini=0.3",
+    )
+    parser.add_argument("--output", type=Path, help="Pfad für den JSON-Report")
+    parser.add_argument("--compare", type=Path, help="Baseline-Report zum Vergleich")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    args = parser.parse_args(argv)
+
+    latency = Latency(args.latency, **_parse_service_latency(args.service_latency))
+    report = run_benchmarks(args.cases, args.size, latency, args.repeat)
+    _print_summary(report)
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"Report gespeichert: {args.output}")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        regressions = compare_reports(baseline, report, args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            return 1
+        print("Keine Regressionen gegenüber der Baseline.")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,450 @@
+"""Local stand-ins for YouTube, RSS, yt-dlp, the transcript API and Gemini.
+
+Every stub replays the recorded responses from benchmarks/fixtures, waits for
+a configurable latency to simulate the network and records each call in a
+shared CallRecorder. Nothing in here opens a network connection.
+"""
+
+import copy
+import hashlib
+import json
+import re
+import threading
+import time
+import zlib
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Iterator
+from unittest.mock import patch
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+# Quota costs of the YouTube Data API v3 methods used by the app.
+QUOTA_COSTS = {
+    "search.list": 100,
+    "videos.list": 1,
+    "subscriptions.list": 1,
+    "videoCategories.list": 1,
+}
+
+SERVICES = ("youtube", "rss", "ytdlp", "transcript", "gemini")
+
+SUBSCRIPTIONS_PAGE_SIZE = 50
+# The API stops paging search results after about 500 videos.
+SEARCH_RESULTS_LIMIT = 500
+
+_VIDEO_ID_IN_PROMPT = re.compile(r"Video-ID: ([\w-]+)")
+
+
+def load_fixture(name: str) -> Any:
+    """Loads a JSON fixture, or the raw text for other file types."""
+    path = FIXTURES_DIR / name
+    text = path.read_text(encoding="utf-8")
+    return json.loads(text) if path.suffix == ".json" else text
+
+
+def bench_video_id(number: int) -> str:
+    """Returns a deterministic 11 character video ID."""
+    return f"bench{number:06d}"
+
+
+def bench_channel_id(number: int) -> str:
+    """Returns a deterministic 24 character channel ID."""
+    return f"UCbench{number:017d}"
+
+
+class CallRecorder:
+    """Counts stub calls and YouTube quota units. Safe to use from worker threads."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.calls: Counter[str] = Counter()
+        self.quota_units = 0
+
+    def record(self, name: str, quota_units: int = 0) -> None:
+        with self._lock:
+            self.calls[name] += 1
+            self.quota_units += quota_units
+
+    def reset(self) -> None:
+        with self._lock:
+            self.calls.clear()
+            self.quota_units = 0
+
+
+class Latency:
+    """Simulated network latency per service in seconds."""
+
+    def __init__(self, default: float = 0.0, **per_service: float) -> None:
+        unknown = set(per_service) - set(SERVICES)
+        if unknown:
+            raise ValueError(f"Unbekannte Dienste: {', '.join(sorted(unknown))}")
+        self.values = {service: per_service.get(service, default) for service in SERVICES}
+
+    def wait(self, service: str) -> None:
+        seconds = self.values[service]
+        if seconds > 0:
+            time.sleep(seconds)
+
+
+class StubYouTube:
+    """Replays YouTube Data API responses. Mimics the googleapiclient Resource.
+
+    Args:
+        recorder (CallRecorder): Receives one call per executed request.
+        latency (Latency): Simulated latency.
+        items_per_page (int): Number of items returned by list calls without an id.
+    """
+
+    def __init__(
+        self, recorder: CallRecorder, latency: Latency, items_per_page: int = 50
+    ) -> None:
+        self.recorder = recorder
+        self.latency = latency
+        self.items_per_page = items_per_page
+        self._fixture = load_fixture("youtube_api.json")
+
+    def videos(self) -> "_StubCollection":
+        return _StubCollection(self, "videos")
+
+    def search(self) -> "_StubCollection":
+        return _StubCollection(self, "search")
+
+    def subscriptions(self) -> "_StubCollection":
+        return _StubCollection(self, "subscriptions")
+
+    def videoCategories(self) -> "_StubCollection":
+        return _StubCollection(self, "videoCategories")
+
+    def video_item(self, number: int, video_id: str | None = None) -> dict[str, Any]:
+        """Builds a videos.list item from the recorded templates."""
+        templates = self._fixture["video_templates"]
+        item = copy.deepcopy(templates[number % len(templates)])
+        item["kind"] = "youtube#video"
+        item["id"] = video_id or bench_video_id(number)
+        return item
+
+    def respond(self, method: str, params: dict[str, Any]) -> dict[str, Any]:
+        """Returns the recorded response for one API request."""
+        if method == "videos.list":
+            if params.get("chart") == "mostPopular":
+                count = min(params.get("maxResults", 5), self.items_per_page)
+                return {"items": [self.video_item(i) for i in range(count)]}
+            ids = str(params.get("id", "")).split(",")
+            return {
+                "items": [
+                    self.video_item(_number_from_id(video_id), video_id)
+                    for video_id in ids
+                    if video_id
+                ]
+            }
+
+        if method == "search.list":
+            count = min(params.get("maxResults", 5), self.items_per_page)
+            page = int(params.get("pageToken") or 0)
+            offset = _number_from_id(params.get("channelId", "")) * count
+            if "q" in params:
+                offset = page * count
+            items = []
+            for i in range(offset, offset + count):
+                video = self.video_item(i)
+                items.append(
+                    {
+                        "kind": "youtube#searchResult",
+                        "id": {"kind": "youtube#video", "videoId": video["id"]},
+                        "snippet": video["snippet"],
+                    }
+                )
+            response = {"items": items}
+            if "q" in params and offset + count < SEARCH_RESULTS_LIMIT:
+                response["nextPageToken"] = str(page + 1)
+            return response
+
+        if method == "subscriptions.list":
+            page = int(params.get("pageToken") or 0)
+            start = page * SUBSCRIPTIONS_PAGE_SIZE
+            end = min(start + SUBSCRIPTIONS_PAGE_SIZE, self.items_per_page)
+            items = []
+            for i in range(start, end):
+                item = copy.deepcopy(self._fixture["subscription_template"])
+                item["id"] = f"subscription{i}"
+                item["snippet"]["resourceId"]["channelId"] = bench_channel_id(i)
+                item["snippet"]["title"] = f"Kanal {i}"
+                items.append(item)
+            response: dict[str, Any] = {"items": items}
+            if end < self.items_per_page:
+                response["nextPageToken"] = str(page + 1)
+            return response
+
+        if method == "videoCategories.list":
+            return {"items": [{"id": "28", "snippet": {"title": "Science & Technology"}}]}
+
+        raise NotImplementedError(f"Keine Aufzeichnung für {method}")
+
+
+class _StubCollection:
+    def __init__(self, client: StubYouTube, resource: str) -> None:
+        self._client = client
+        self._resource = resource
+
+    def list(self, **params: Any) -> "_StubRequest":
+        return _StubRequest(self._client, f"{self._resource}.list", params)
+
+
+class _StubRequest:
+    def __init__(self, client: StubYouTube, method: str, params: dict[str, Any]) -> None:
+        self._client = client
+        self._method = method
+        self._params = params
+
+    def execute(self) -> dict[str, Any]:
+        self._client.latency.wait("youtube")
+        self._client.recorder.record(
+            f"youtube.{self._method}", QUOTA_COSTS.get(self._method, 0)
+        )
+        return self._client.respond(self._method, self._params)
+
+
+def _number_from_id(identifier: str) -> int:
+    """Recovers the number of a generated video or channel ID, 0 for other IDs."""
+    digits = re.search(r"(\d+)$", identifier or "")
+    return int(digits.group(1)) if digits else 0
+
+
+class StubFeeds:
+    """Replays the RSS feed of a channel. Replaces the requests session of feed_helper.
+
+    Responses carry an ETag. Requests whose If-None-Match matches it get a
+    304 without a body, like youtube.com answers unchanged feeds.
+    """
+
+    def __init__(
+        self, recorder: CallRecorder, latency: Latency, entries_per_feed: int = 15
+    ) -> None:
+        self.recorder = recorder
+        self.latency = latency
+        self.entries_per_feed = entries_per_feed
+        self._feed = load_fixture("rss_feed.xml")
+        self._entry = load_fixture("rss_entry.xml")
+
+    def feed_xml(self, channel_id: str) -> str:
+        """Renders the recorded feed for a channel."""
+        first = _number_from_id(channel_id) * self.entries_per_feed
+        entries = "\n".join(
+            self._entry.format(
+                video_id=bench_video_id(first + i),
+                channel_id=channel_id,
+                published=f"2025-04-{11 - i % 10:02d}T16:00:06+00:00",
+            )
+            for i in range(self.entries_per_feed)
+        )
+        return self._feed.format(channel_id=channel_id, entries=entries)
+
+    def get(
+        self, url: str, headers: dict[str, str] | None = None, **kwargs: Any
+    ) -> "_StubFeedResponse":
+        self.latency.wait("rss")
+        channel_id = url.rsplit("channel_id=", 1)[-1]
+        body = self.feed_xml(channel_id).encode("utf-8")
+        etag = f'"{hashlib.sha1(body).hexdigest()}"'
+        if (headers or {}).get("If-None-Match") == etag:
+            self.recorder.record("rss.not_modified")
+            return _StubFeedResponse(304, b"", etag)
+        self.recorder.record("rss.feed")
+        return _StubFeedResponse(200, body, etag)
+
+
+class _StubFeedResponse:
+    """The parts of requests.Response used by feed_helper."""
+
+    def __init__(self, status_code: int, body: bytes, etag: str) -> None:
+        self.status_code = status_code
+        self.headers = {"ETag": etag}
+        self._body = body
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+    def iter_content(self, chunk_size: int = 1) -> Iterator[bytes]:
+        for start in range(0, len(self._body), chunk_size):
+            yield self._body[start : start + chunk_size]
+
+    def close(self) -> None:
+        pass
+
+
+class StubYoutubeDL:
+    """Replays yt-dlp extractions. Replaces yt_dlp.YoutubeDL.
+
+    The app creates one instance per call, so the shared state lives in class
+    attributes. stubbed_services binds them on a subclass per run.
+    """
+
+    recorder: CallRecorder
+    latency: Latency
+    items_per_page = 50
+    _templates = load_fixture("ytdlp.json")["video_templates"]
+
+    def __init__(self, params: dict[str, Any] | None = None) -> None:
+        self.params = params or {}
+
+    def __enter__(self) -> "StubYoutubeDL":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        return None
+
+    @classmethod
+    def info(cls, number: int, video_id: str | None = None) -> dict[str, Any]:
+        """Builds a full extraction result from the recorded templates."""
+        info = copy.deepcopy(cls._templates[number % len(cls._templates)])
+        info["id"] = video_id or bench_video_id(number)
+        return info
+
+    def extract_info(self, url: str, download: bool = False) -> dict[str, Any]:
+        self.latency.wait("ytdlp")
+        self.recorder.record("ytdlp.extract_info")
+
+        search = re.match(r"ytsearch(\d+):", url)
+        if search or "feed/trending" in url:
+            count = min(int(search.group(1)) if search else 50, self.items_per_page)
+            start = self.params.get("playliststart", 1) - 1
+            end = min(self.params.get("playlistend") or count, count)
+            entries = []
+            for i in range(start, end):
+                entry = self.info(i)
+                if self.params.get("extract_flat"):
+                    entry = {
+                        key: entry[key]
+                        for key in ("id", "title", "duration", "uploader", "view_count")
+                    }
+                entries.append(entry)
+            return {"_type": "playlist", "entries": entries}
+
+        video_id = url.rsplit("v=", 1)[-1]
+        return self.info(_number_from_id(video_id), video_id)
+
+
+class StubTranscriptApi:
+    """Replays transcripts. Replaces youtube_transcript_api.YouTubeTranscriptApi."""
+
+    recorder: CallRecorder
+    latency: Latency
+    _fixture = load_fixture("transcripts.json")
+
+    @classmethod
+    def list_transcripts(cls, video_id: str) -> list["_StubTranscript"]:
+        cls.latency.wait("transcript")
+        cls.recorder.record("transcript.list")
+        return [_StubTranscript(cls)]
+
+
+class _StubTranscript:
+    """A manually created German track of a video."""
+
+    language_code = "de"
+    is_generated = False
+    is_translatable = True
+
+    def __init__(self, api: type[StubTranscriptApi]) -> None:
+        self._api = api
+
+    def fetch(self) -> list[SimpleNamespace]:
+        self._api.latency.wait("transcript")
+        self._api.recorder.record("transcript.fetch")
+        segments = self._api._fixture["segments"] * self._api._fixture["repeat"]
+        return [SimpleNamespace(text=segment["text"]) for segment in segments]
+
+
+class StubGeminiClient:
+    """Replays Gemini responses. Mimics genai.Client.models."""
+
+    def __init__(self, recorder: CallRecorder, latency: Latency) -> None:
+        self.recorder = recorder
+        self.latency = latency
+        self.prompt_chars = 0
+        self._fixture = load_fixture("gemini.json")
+        self._lock = threading.Lock()
+        self.models = SimpleNamespace(
+            generate_content=self.generate_content, embed_content=self.embed_content
+        )
+
+    def generate_content(self, model: str, contents: Any, config: Any = None) -> Any:
+        self.latency.wait("gemini")
+        self.recorder.record("gemini.generate_content")
+        prompt = str(contents)
+        with self._lock:
+            self.prompt_chars += len(prompt)
+
+        if "'video_id'" in prompt or '"video_id"' in prompt:
+            video_ids = _VIDEO_ID_IN_PROMPT.findall(prompt)
+            text = self._fixture["recommendation"].replace(
+                "{video_id}", video_ids[0] if video_ids else bench_video_id(0)
+            )
+        elif "Clickbait-Elemente" in prompt and "Analysiere" in prompt:
+            text = self._fixture["clickbait"]
+        else:
+            text = self._fixture["summary"]
+        return SimpleNamespace(text=text)
+
+    def embed_content(self, model: str, contents: list[str], config: Any = None) -> Any:
+        self.latency.wait("gemini")
+        self.recorder.record("gemini.embed_content")
+        dimension = self._fixture["embedding_dimension"]
+        embeddings = []
+        for text in contents:
+            seed = zlib.crc32(text.encode("utf-8"))
+            embeddings.append(
+                SimpleNamespace(
+                    values=[((seed * (i + 1)) % 1000) / 1000 for i in range(dimension)]
+                )
+            )
+        return SimpleNamespace(embeddings=embeddings)
+
+
+@contextmanager
+def stubbed_services(
+    latency: Latency, items_per_page: int = 50
+) -> Iterator[SimpleNamespace]:
+    """Replaces all network clients used by the helpers with recorded stubs.
+
+    Args:
+        latency (Latency): Simulated latency per service.
+        items_per_page (int, optional): Number of items returned by list calls.
+                                        Defaults to 50.
+
+    Yields:
+        SimpleNamespace: recorder (CallRecorder), youtube (StubYouTube) and
+                         gemini (StubGeminiClient).
+    """
+    import src.helpers.feed_helper
+    import src.helpers.gemini_helper
+    import src.helpers.youtube_helper
+
+    recorder = CallRecorder()
+    youtube = StubYouTube(recorder, latency, items_per_page)
+    gemini = StubGeminiClient(recorder, latency)
+    feeds = StubFeeds(recorder, latency)
+    youtube_dl = type(
+        "BoundStubYoutubeDL",
+        (StubYoutubeDL,),
+        {"recorder": recorder, "latency": latency, "items_per_page": items_per_page},
+    )
+    transcript_api = type(
+        "BoundStubTranscriptApi",
+        (StubTranscriptApi,),
+        {"recorder": recorder, "latency": latency},
+    )
+
+    youtube_helper = src.helpers.youtube_helper
+    with patch.object(src.helpers.feed_helper, "_session", feeds), patch.object(
+        youtube_helper.yt_dlp, "YoutubeDL", youtube_dl
+    ), patch.object(
+        youtube_helper, "YouTubeTranscriptApi", transcript_api
+    ), patch.object(
+        src.helpers.gemini_helper, "ai_client", gemini
+    ):
+        yield SimpleNamespace(recorder=recorder, youtube=youtube, gemini=gemini)
@@ -29,7 +29,7 @@ user_interests = st.sidebar.text_input("Deine Interessen", value=load_interests(
 save_interests(user_interests)
 
 search_method = st.sidebar.radio(
-    "Suchmethode wählen:", ("YouTube API", "yt-dlp (Experimentell)")
+    "Suchmethode wählen:", ("YouTube API", "yt-dlp (Experimentell)", "Lokaler Index")
 )
 
 show_spoiler = st.sidebar.checkbox(
@@ -60,7 +60,7 @@ with tabs[3]:
 with tabs[4]:
     build_subs_tab(show_spoiler, search_method, youtube, user_interests)
 with tabs[5]:
-    build_watch_later_tab(show_spoiler)
+    build_watch_later_tab(show_spoiler, user_interests)
 with tabs[6]:
     build_feedback_tab()
 with tabs[7]:
@@ -1,6 +1,10 @@
 import os
 from googleapiclient.discovery import build, Resource
 
+from src.helpers.logging_helper import get_logger
+
+logger = get_logger(__name__)
+
 GoogleApiResource = Resource
 
 
@@ -8,7 +12,7 @@ def get_api_key(env_var: str) -> str | None:
     """Fetches the value of a specified environment variable with basic error handling.
 
     This function retrieves the value of an environment variable using `os.getenv()`.
-    If an exception occurs during the retrieval process, it prints an error message
+    If an exception occurs during the retrieval process, it logs an error message
     and returns `None`.
 
     Args:
@@ -19,14 +23,14 @@ def get_api_key(env_var: str) -> str | None:
         or `None` if it is not set or an exception occurs.
 
     Side Effects:
-        Prints error messages to standard output if an exception occurs.
+        Logs error messages if an exception occurs.
     """
     try:
         api_key = os.getenv(env_var)
     except ValueError as e:
-        print(f"Configuration error: {e}. Please check your .env file.")
+        logger.error("Configuration error: %s. Please check your .env file.", e)
     except Exception as e:
-        print(f"Unexpected error: {e}")
+        logger.error("Unexpected error: %s", e)
     else:
         return api_key
     return None
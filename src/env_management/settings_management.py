@@ -0,0 +1,88 @@
+import os
+import sqlite3
+import sys
+
+from dotenv import load_dotenv
+
+from src.env_management.api_key_management import get_api_key
+from src.helpers.cache_helper import invalidate_api_key_scope
+from src.helpers.logging_helper import configure_logging, get_logger
+from src.helpers.user_helper import SUBSCRIPTIONS_FILE, all_user_paths
+
+logger = get_logger(__name__)
+
+# Settings whose value scopes cached API results (see cache_helper.disk_cache).
+API_KEY_SETTINGS = ("YOUTUBE_API_KEY", "TOKEN_GOOGLEAPI")
+
+
+def invalidate_changed_settings(
+    previous_env: dict[str, str | None],
+    updated_env: dict[str, str | None],
+    subscriptions_file: str = SUBSCRIPTIONS_FILE,
+) -> list[str]:
+    """Invalidates only the cached state that depends on changed settings.
+
+    Cached results of a changed API key are deleted, everything else
+    (transcripts, search index, video metadata, embeddings) stays warm.
+    A changed channel ID only drops the cached subscription lists; the
+    channel ID applies to the whole server, so the copies of all users in
+    user_data/ are removed as well.
+
+    Args:
+        previous_env (dict[str, str | None]): Settings before saving.
+        updated_env (dict[str, str | None]): Settings after saving.
+        subscriptions_file (str, optional): The cached subscription list of
+                                            the default user. Defaults to
+                                            SUBSCRIPTIONS_FILE.
+
+    Returns:
+        list[str]: The names of the changed settings.
+    """
+    changed = [
+        name
+        for name in (*API_KEY_SETTINGS, "CHANNEL_ID")
+        if (previous_env.get(name) or "") != (updated_env.get(name) or "")
+    ]
+
+    for name in changed:
+        if name in API_KEY_SETTINGS:
+            try:
+                invalidate_api_key_scope(name, previous_env.get(name))
+            except sqlite3.Error as e:
+                logger.warning("Cache für %s konnte nicht geleert werden: %s", name, e)
+
+    if "CHANNEL_ID" in changed:
+        for path in all_user_paths(subscriptions_file):
+            try:
+                os.remove(path)
+            except OSError as e:
+                logger.warning("%s konnte nicht gelöscht werden: %s", path, e)
+
+    return changed
+
+
+def reload_settings(env_path: str = ".env") -> None:
+    """Applies the settings from the .env file to the running process.
+
+    Re-reads the .env file into the environment, applies a changed
+    LOG_LEVEL and rebuilds the Gemini client if it is already loaded. The
+    YouTube client is not held here: run.py builds it with initialize() on
+    every script run, so the st.rerun() after saving already uses the new
+    key. Session state and in-memory caches are kept, so no restart of
+    Streamlit is needed.
+
+    Args:
+        env_path (str, optional): Path to the .env file. Defaults to ".env".
+
+    Returns:
+        None
+    """
+    load_dotenv(env_path, override=True)
+    configure_logging(force=True)
+
+    # gemini_helper creates its client on import and fails without a key,
+    # so it is only reloaded here once it has been imported successfully.
+    gemini_helper = sys.modules.get("src.helpers.gemini_helper")
+    gemini_api_key = get_api_key("TOKEN_GOOGLEAPI")
+    if gemini_helper is not None and gemini_api_key:
+        gemini_helper.reload_client(gemini_api_key)
@@ -0,0 +1,720 @@
+import copy
+import functools
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future
+from contextlib import closing
+from datetime import datetime
+from typing import Any, Callable
+
+from .gitignore_helper import register_data_files
+from .logging_helper import get_logger
+from .tracing_helper import set_attribute, span
+from .video_helper import Video
+
+logger = get_logger(__name__)
+
+CACHE_DB = "cache.db"
+register_data_files(f"{CACHE_DB}*")
+
+# Freshness tiers for video metadata. Title, channel, duration and upload
+# date practically never change, views change all the time.
+IMMUTABLE_TTL = 30 * 24 * 3600
+VOLATILE_TTL = 3600
+VOLATILE_FIELDS = ("views",)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    stored_at REAL NOT NULL,
+    expires_at REAL NOT NULL,
+    PRIMARY KEY (namespace, key)
+);
+CREATE TABLE IF NOT EXISTS video_metadata (
+    video_id TEXT PRIMARY KEY,
+    immutable TEXT NOT NULL,
+    immutable_fetched_at REAL NOT NULL,
+    volatile TEXT NOT NULL,
+    volatile_fetched_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS feed_state (
+    channel_id TEXT PRIMARY KEY,
+    etag TEXT,
+    last_modified TEXT,
+    video_ids TEXT NOT NULL,
+    truncated INTEGER NOT NULL,
+    fetched_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS subscription_videos (
+    video_id TEXT PRIMARY KEY,
+    channel_id TEXT NOT NULL,
+    video TEXT NOT NULL,
+    upload_date TEXT NOT NULL,
+    ingested_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS subscription_videos_channel
+    ON subscription_videos (channel_id, upload_date);
+CREATE TABLE IF NOT EXISTS ingested_channels (
+    channel_id TEXT PRIMARY KEY,
+    checked_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS trending_snapshots (
+    region_code TEXT NOT NULL,
+    source TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    videos TEXT NOT NULL,
+    PRIMARY KEY (region_code, source, fetched_at)
+);
+CREATE TABLE IF NOT EXISTS video_digests (
+    video_id TEXT NOT NULL,
+    method TEXT NOT NULL,
+    digest TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (video_id, method)
+);
+"""
+
+_initialized_paths: set[str] = set()
+
+# Calls in progress per single-flight key, shared by all sessions of the server.
+_inflight_lock = threading.Lock()
+_inflight: dict[str, Future] = {}
+
+
+def _connect(db_path: str | None = None) -> sqlite3.Connection:
+    """Opens a connection to the cache database and creates the schema once.
+
+    Args:
+        db_path (str | None, optional): Path to the SQLite database file.
+                                        Defaults to CACHE_DB.
+
+    Returns:
+        sqlite3.Connection: An open connection to the cache database.
+    """
+    path = db_path or CACHE_DB
+    connection = sqlite3.connect(path, timeout=5)
+    if path not in _initialized_paths:
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.executescript(_SCHEMA)
+        _initialized_paths.add(path)
+    return connection
+
+
+def _json_default(value: Any) -> Any:
+    """Serializes values the json module does not know (datetimes, sets, videos)."""
+    if isinstance(value, datetime):
+        return {"__datetime__": value.isoformat()}
+    if isinstance(value, Video):
+        return {"__video__": value.to_dict()}
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"Typ {type(value).__name__} kann nicht gecacht werden.")
+
+
+def _json_object_hook(value: dict[str, Any]) -> Any:
+    """Restores values written by _json_default."""
+    if len(value) == 1 and "__datetime__" in value:
+        return datetime.fromisoformat(value["__datetime__"])
+    if len(value) == 1 and "__video__" in value:
+        return Video.from_mapping(value["__video__"])
+    return value
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, default=_json_default, ensure_ascii=False)
+
+
+def _key_default(value: Any) -> Any:
+    """Serializes call arguments for cache keys.
+
+    Clients such as the YouTube Resource are reduced to their type name. Which
+    credentials they use is part of the namespace scope, not of the key.
+    """
+    try:
+        return _json_default(value)
+    except TypeError:
+        return type(value).__name__
+
+
+def _make_key(args: tuple, kwargs: dict[str, Any]) -> str:
+    """Builds a fixed-length cache key from call arguments."""
+    raw = json.dumps(
+        [args, sorted(kwargs.items())], default=_key_default, ensure_ascii=False
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _loads(text: str) -> Any:
+    return json.loads(text, object_hook=_json_object_hook)
+
+
+def cache_get(namespace: str, key: str, db_path: str | None = None) -> Any | None:
+    """Returns a cached value if it exists and has not expired.
+
+    Args:
+        namespace (str): Group of related entries, e.g. "search_dlp".
+        key (str): Key within the namespace.
+        db_path (str | None, optional): Path to the cache database. Defaults to CACHE_DB.
+
+    Returns:
+        Any | None: The cached value, or None on a miss.
+    """
+    with closing(_connect(db_path)) as connection:
+        row = connection.execute(
+            "SELECT value FROM entries WHERE namespace = ? AND key = ? AND expires_at > ?",
+            (namespace, key, time.time()),
+        ).fetchone()
+    return _loads(row[0]) if row else None
+
+
+def cache_set(
+    namespace: str, key: str, value: Any, ttl: float, db_path: str | None = None
+) -> None:
+    """Stores a JSON-serializable value for ttl seconds.
+
+    Args:
+        namespace (str): Group of related entries.
+        key (str): Key within the namespace.
+        value (Any): The value. Datetimes are supported.
+        ttl (float): Time to live in seconds.
+        db_path (str | None, optional): Path to the cache database. Defaults to CACHE_DB.
+
+    Returns:
+        None
+    """
+    now = time.time()
+    with closing(_connect(db_path)) as connection, connection:
+        connection.execute(
+            "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)",
+            (namespace, key, _dumps(value), now, now + ttl),
+        )
+
+
+def api_key_scope(env_var: str, api_key: str | None = None) -> str:
+    """Returns the cache scope for entries that depend on an API key.
+
+    Only a short hash of the key is used, the key itself is never stored.
+
+    Args:
+        env_var (str): Name of the environment variable, e.g. "YOUTUBE_API_KEY".
+        api_key (str | None, optional): The key value. Defaults to the current
+                                        value of the environment variable.
+
+    Returns:
+        str: A scope such as "YOUTUBE_API_KEY:1a2b3c4d5e6f".
+    """
+    if api_key is None:
+        api_key = os.getenv(env_var, "")
+    digest = hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:12]
+    return f"{env_var}:{digest}"
+
+
+def scoped_namespace(namespace: str, api_key_env: str | None = None) -> str:
+    """Appends the current API key scope to a namespace if one is required."""
+    if api_key_env is None:
+        return namespace
+    return f"{namespace}@{api_key_scope(api_key_env)}"
+
+
+def invalidate_api_key_scope(
+    env_var: str, api_key: str | None, db_path: str | None = None
+) -> int:
+    """Deletes all entries that were cached with a specific API key.
+
+    Entries of other keys and public entries (transcripts, dlp metadata,
+    dlp searches) stay warm.
+
+    Args:
+        env_var (str): Name of the environment variable of the key.
+        api_key (str | None): The key whose entries should be removed.
+        db_path (str | None, optional): Path to the cache database. Defaults to CACHE_DB.
+
+    Returns:
+        int: The number of deleted entries.
+    """
+    scope = api_key_scope(env_var, api_key or "")
+    with closing(_connect(db_path)) as connection, connection:
+        cursor = connection.execute(
+            "DELETE FROM entries WHERE namespace LIKE ? ESCAPE '\\'",
+            ("%@" + scope.replace("_", "\\_"),),
+        )
+    return cursor.rowcount
+
+
+def single_flight(key: str, func: Callable, *args: Any, **kwargs: Any) -> Any:
+    """Runs func once for all concurrent callers with the same key.
+
+    The first caller runs the function, callers arriving while it is running
+    wait for its result instead of sending the same request again. Every
+    waiting caller gets its own copy of the result. Exceptions are passed on
+    to all of them.
+
+    Args:
+        key (str): Identifies the request, e.g. "ytdlp:<video_id>".
+        func (Callable): The function to run.
+        *args (Any): Positional arguments for func.
+        **kwargs (Any): Keyword arguments for func.
+
+    Returns:
+        Any: The result of func.
+    """
+    with _inflight_lock:
+        future = _inflight.get(key)
+        leader = future is None
+        if leader:
+            future = _inflight[key] = Future()
+
+    if not leader:
+        set_attribute("single_flight_wait", True)
+        return copy.deepcopy(future.result())
+
+    try:
+        result = func(*args, **kwargs)
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        with _inflight_lock:
+            _inflight.pop(key, None)
+
+
+def disk_cache(
+    namespace: str,
+    ttl: float,
+    api_key_env: str | None = None,
+    should_cache: Callable[[Any], bool] = bool,
+) -> Callable:
+    """Decorator that persists the results of a function in the cache database.
+
+    The call arguments form the cache key. Results of functions that use an
+    API key are stored in a namespace scoped to that key, so changing the
+    key only invalidates these entries. Concurrent misses for the same key,
+    e.g. several users opening the trending tab at once, run the function
+    only once (see single_flight). Cache errors never break the wrapped
+    function.
+
+    Args:
+        namespace (str): Namespace for the entries of this function.
+        ttl (float): Time to live of each entry in seconds.
+        api_key_env (str | None, optional): Environment variable of the API key
+                                            the results depend on. Defaults to None
+                                            (public data).
+        should_cache (Callable[[Any], bool], optional): Decides whether a result is
+            stored. Defaults to bool, so empty results of failed fetches are
+            retried on the next call.
+
+    Returns:
+        Callable: The decorator.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            scoped = scoped_namespace(namespace, api_key_env)
+            try:
+                key = _make_key(args, kwargs)
+                with span("cache.lookup", namespace=namespace):
+                    cached = cache_get(scoped, key)
+                    set_attribute("hit", cached is not None)
+            except sqlite3.Error as e:
+                logger.warning("Cache für %s nicht verfügbar: %s", namespace, e)
+                return func(*args, **kwargs)
+            if cached is not None:
+                return cached
+
+            def fetch() -> Any:
+                result = func(*args, **kwargs)
+                if should_cache(result):
+                    try:
+                        cache_set(scoped, key, result, ttl)
+                    except (sqlite3.Error, TypeError) as e:
+                        logger.warning(
+                            "Ergebnis für %s konnte nicht gecacht werden: %s",
+                            namespace,
+                            e,
+                        )
+                return result
+
+            return single_flight(f"{scoped}:{key}", fetch)
+
+        return wrapper
+
+    return decorator
+
+
+def get_cached_video_metadata(
+    video_id: str, db_path: str | None = None
+) -> tuple[dict[str, Any] | None, bool]:
+    """Returns the cached metadata of a video and whether its volatile fields are stale.
+
+    Args:
+        video_id (str): The unique identifier of the YouTube video.
+        db_path (str | None, optional): Path to the cache database. Defaults to CACHE_DB.
+
+    Returns:
+        tuple[dict[str, Any] | None, bool]: The metadata dictionary (None if not
+            cached or the immutable tier has expired) and True if the volatile
+            fields such as views are older than VOLATILE_TTL.
+    """
+    with closing(_connect(db_path)) as connection:
+        row = connection.execute(
+            "SELECT immutable, immutable_fetched_at, volatile, volatile_fetched_at "
+            "FROM video_metadata WHERE video_id = ?",
+            (video_id,),
+        ).fetchone()
+
+    if not row:
+        return None, False
+
+    immutable, immutable_fetched_at, volatile, volatile_fetched_at = row
+    now = time.time()
+    if now - immutable_fetched_at > IMMUTABLE_TTL:
+        return None, False
+
+    video = _loads(immutable)
+    video.update(_loads(volatile))
+    return video, now - volatile_fetched_at > VOLATILE_TTL
+
+
+def store_video_metadata(video: dict[str, Any], db_path: str | None = None) -> None:
+    """Stores the metadata of a video, split into an immutable and a volatile tier.
+
+    Args:
+        video (dict[str, Any]): Video dictionary as returned by get_video_data_dlp.
+                                Must contain 'video_id'.
+        db_path (str | None, optional): Path to the cache database. Defaults to CACHE_DB.
+
+    Returns:
+        None
+    """
+    immutable = {
+        key: value for key, value in video.items() if key not in VOLATILE_FIELDS
+    }
+    volatile = {key: video[key] for key in VOLATILE_FIELDS if key in video}
+    now = time.time()
+
+    with closing(_connect(db_path)) as connection, connection:
+        connection.execute(
+            "INSERT OR REPLACE INTO video_metadata VALUES (?, ?, ?, ?, ?)",
+            (video["video_id"], _dumps(immutable), now, _dumps(volatile), now),
+        )
+
+
+def update_video_volatile_fields(
+    video_id: str, fields: dict[str, Any], db_path: str | None = None
+) -> None:
+    """Refreshes only the volatile tier (e.g. views) of a cached video.
+
+    Args:
+        video_id (str): The unique identifier of the YouTube video.
+        fields (dict[str, Any]): New values of the volatile fields.
+        db_path (str | None, optional): Path to the cache database. Defaults to CACHE_DB.
+
+    Returns:
+        None
+    """
+    volatile = {key: fields[key] for key in VOLATILE_FIELDS if key in fields}
+    with closing(_connect(db_path)) as connection, connection:
+        connection.execute(
+            "UPDATE video_metadata SET volatile = ?, volatile_fetched_at = ? "
+            "WHERE video_id = ?",
+            (_dumps(volatile), time.time(), video_id),
+        )
+
+
+def get_feed_state(channel_id: str, db_path: str | None = None) -> dict[str, Any] | None:
+    """Returns the stored validators and video IDs of a channel feed.
+
+    Args:
+        channel_id (str): The YouTube channel ID.
+        db_path (str | None, optional): Path to the cache database. Defaults to CACHE_DB.
+
+    Returns:
+        dict[str, Any] | None: 'etag', 'last_modified', 'video_ids', 'truncated'
+            and 'fetched_at', or None if the feed was never fetched.
+    """
+    with closing(_connect(db_path)) as connection:
+        row = connection.execute(
+            "SELECT etag, last_modified, video_ids, truncated, fetched_at "
+            "FROM feed_state WHERE channel_id = ?",
+            (channel_id,),
+        ).fetchone()
+
+    if not row:
+        return None
+    etag, last_modified, video_ids, truncated, fetched_at = row
+    return {
+        "etag": etag,
+        "last_modified": last_modified,
+        "video_ids": _loads(video_ids),
+        "truncated": bool(truncated),
+        "fetched_at": fetched_at,
+    }
+
+
+def store_feed_state(
+    channel_id: str,
+    etag: str | None,
+    last_modified: str | None,
+    video_ids: list[str],
+    truncated: bool,
+    db_path: str | None = None,
+) -> None:
+    """Stores the validators and parsed video IDs of a channel feed.
+
+    Args:
+        channel_id (str): The YouTube channel ID.
+        etag (str | None): The ETag header of the response.
+        last_modified (str | None): The Last-Modified header of the response.
+        video_ids (list[str]): The parsed video IDs, newest first.
+        truncated (bool): True if parsing stopped before the end of the feed.
+        db_path (str | None, optional): Path to the cache database. Defaults to CACHE_DB.
+
+    Returns:
+        None
+    """
+    with closing(_connect(db_path)) as connection, connection:
+        connection.execute(
+            "INSERT OR REPLACE INTO feed_state VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                channel_id,
+                etag,
+                last_modified,
+                _dumps(video_ids),
+                int(truncated),
+                time.time(),
+            ),
+        )
+
+
+def get_ingested_video_ids(channel_id: str, db_path: str | None = None) -> set[str]:
+    """Returns the IDs of the stored subscription videos of a channel.
+
+    Args:
+        channel_id (str): The YouTube channel ID.
+        db_path (str | None, optional): Path to the cache database. Defaults to CACHE_DB.
+
+    Returns:
+        set[str]: The stored video IDs.
+    """
+    with closing(_connect(db_path)) as connection:
+        rows = connection.execute(
+            "SELECT video_id FROM subscription_videos WHERE channel_id = ?",
+            (channel_id,),
+        ).fetchall()
+    return {row[0] for row in rows}
+
+
+def store_ingested_videos(
+    channel_id: str, videos: list[Video], keep: int, db_path: str | None = None
+) -> None:
+    """Stores new subscription videos of a channel and marks the channel as checked.
+
+    Only the keep most recent videos of the channel are retained.
+
+    Args:
+        channel_id (str): The YouTube channel ID.
+        videos (list[Video]): The new videos, may be empty.
+        keep (int): Number of videos to retain per channel.
+        db_path (str | None, optional): Path to the cache database. Defaults to CACHE_DB.
+
+    Returns:
+        None
+    """
+    now = time.time()
+    rows = [
+        (
+            video.video_id,
+            channel_id,
+            _dumps(video),
+            video.upload_date.isoformat() if video.upload_date else "",
+            now,
+        )
+        for video in videos
+    ]
+    with closing(_connect(db_path)) as connection, connection:
+        connection.executemany(
+            "INSERT OR REPLACE INTO subscription_videos VALUES (?, ?, ?, ?, ?)", rows
+        )
+        connection.execute(
+            "DELETE FROM subscription_videos WHERE channel_id = ? AND video_id NOT IN "
+            "(SELECT video_id FROM subscription_videos WHERE channel_id = ? "
+            "ORDER BY upload_date DESC LIMIT ?)",
+            (channel_id, channel_id, keep),
+        )
+        connection.execute(
+            "INSERT OR REPLACE INTO ingested_channels VALUES (?, ?)", (channel_id, now)
+        )
+
+
+def get_ingested_videos(
+    channel_ids: list[str],
+    per_channel: int,
+    max_age: float,
+    db_path: str | None = None,
+) -> dict[str, list[Video]]:
+    """Returns the stored subscription videos of recently checked channels.
+
+    Args:
+        channel_ids (list[str]): The YouTube channel IDs.
+        per_channel (int): Maximum number of videos per channel, newest first.
+        max_age (float): Channels checked longer ago than this many seconds
+                         are left out, so their videos can be fetched live.
+        db_path (str | None, optional): Path to the cache database. Defaults to CACHE_DB.
+
+    Returns:
+        dict[str, list[Video]]: The videos per channel ID. Channels that were
+            never checked or are stale are missing from the dictionary.
+    """
+    if not channel_ids:
+        return {}
+    placeholders = ", ".join("?" * len(channel_ids))
+    with closing(_connect(db_path)) as connection:
+        checked = connection.execute(
+            f"SELECT channel_id FROM ingested_channels "
+            f"WHERE channel_id IN ({placeholders}) AND checked_at > ?",
+            (*channel_ids, time.time() - max_age),
+        ).fetchall()
+        result: dict[str, list[Video]] = {row[0]: [] for row in checked}
+        if not result:
+            return result
+        fresh = list(result)
+        rows = connection.execute(
+            f"SELECT channel_id, video FROM ("
+            f"SELECT channel_id, video, ROW_NUMBER() OVER ("
+            f"PARTITION BY channel_id ORDER BY upload_date DESC) AS position "
+            f"FROM subscription_videos WHERE channel_id IN "
+            f"({', '.join('?' * len(fresh))})) WHERE position <= ?",
+            (*fresh, per_channel),
+        ).fetchall()
+    for channel_id, video in rows:
+        result[channel_id].append(_loads(video))
+    return result
+
+
+def store_trending_snapshot(
+    region_code: str,
+    source: str,
+    videos: list[Video],
+    keep: int,
+    db_path: str | None = None,
+) -> float:
+    """Stores a timestamped snapshot of the trending videos of a region.
+
+    Only the keep most recent snapshots per region and source are retained.
+
+    Args:
+        region_code (str): The ISO 3166-1 alpha-2 country code.
+        source (str): Where the videos come from, e.g. "api" or "dlp".
+        videos (list[Video]): The trending videos.
+        keep (int): Number of snapshots to retain.
+        db_path (str | None, optional): Path to the cache database. Defaults to CACHE_DB.
+
+    Returns:
+        float: The timestamp of the snapshot.
+    """
+    fetched_at = time.time()
+    with closing(_connect(db_path)) as connection, connection:
+        connection.execute(
+            "INSERT OR REPLACE INTO trending_snapshots VALUES (?, ?, ?, ?)",
+            (region_code, source, fetched_at, _dumps(videos)),
+        )
+        connection.execute(
+            "DELETE FROM trending_snapshots WHERE region_code = ? AND source = ? "
+            "AND fetched_at NOT IN (SELECT fetched_at FROM trending_snapshots "
+            "WHERE region_code = ? AND source = ? ORDER BY fetched_at DESC LIMIT ?)",
+            (region_code, source, region_code, source, keep),
+        )
+    return fetched_at
+
+
+def get_latest_trending_snapshot(
+    region_code: str, source: str, db_path: str | None = None
+) -> tuple[list[Video], float] | None:
+    """Returns the most recent trending snapshot of a region.
+
+    Args:
+        region_code (str): The ISO 3166-1 alpha-2 country code.
+        source (str): Where the videos come from, e.g. "api" or "dlp".
+        db_path (str | None, optional): Path to the cache database. Defaults to CACHE_DB.
+
+    Returns:
+        tuple[list[Video], float] | None: The videos and the time they were
+            fetched, or None if there is no snapshot yet.
+    """
+    with closing(_connect(db_path)) as connection:
+        row = connection.execute(
+            "SELECT videos, fetched_at FROM trending_snapshots "
+            "WHERE region_code = ? AND source = ? ORDER BY fetched_at DESC LIMIT 1",
+            (region_code, source),
+        ).fetchone()
+    if row is None:
+        return None
+    return _loads(row[0]), row[1]
+
+
+def get_video_digests(
+    video_ids: list[str],
+    method: str,
+    max_empty_age: float,
+    db_path: str | None = None,
+) -> dict[str, str]:
+    """Returns the stored transcript digests of videos.
+
+    Args:
+        video_ids (list[str]): The video IDs.
+        method (str): The digest method, so digests made with other settings
+                      are not reused.
+        max_empty_age (float): Empty digests (videos without a transcript) older
+                               than this many seconds are left out, so the
+                               transcript is looked up again.
+        db_path (str | None, optional): Path to the cache database. Defaults to CACHE_DB.
+
+    Returns:
+        dict[str, str]: The digest per video ID. Videos without a usable
+            entry are missing from the dictionary.
+    """
+    if not video_ids:
+        return {}
+    placeholders = ", ".join("?" * len(video_ids))
+    with closing(_connect(db_path)) as connection:
+        rows = connection.execute(
+            f"SELECT video_id, digest FROM video_digests "
+            f"WHERE video_id IN ({placeholders}) AND method = ? "
+            f"AND (digest != '' OR created_at > ?)",
+            (*video_ids, method, time.time() - max_empty_age),
+        ).fetchall()
+    return dict(rows)
+
+
+def store_video_digests(
+    digests: dict[str, str], method: str, db_path: str | None = None
+) -> None:
+    """Stores transcript digests of videos.
+
+    Args:
+        digests (dict[str, str]): The digest per video ID, "" for videos
+                                  without a transcript.
+        method (str): The digest method.
+        db_path (str | None, optional): Path to the cache database. Defaults to CACHE_DB.
+
+    Returns:
+        None
+    """
+    if not digests:
+        return
+    now = time.time()
+    with closing(_connect(db_path)) as connection, connection:
+        connection.executemany(
+            "INSERT OR REPLACE INTO video_digests VALUES (?, ?, ?, ?)",
+            [(video_id, method, digest, now) for video_id, digest in digests.items()],
+        )
@@ -0,0 +1,132 @@
+import difflib
+import re
+from functools import lru_cache
+from typing import Iterable
+
+NGRAM_SIZE = 3
+FUZZY_CUTOFF = 0.8
+
+_NON_WORD = re.compile(r"\W+")
+
+
+def normalize_channel_name(name: str) -> str:
+    """Lowercases a channel name and strips everything that is not a word character.
+
+    Args:
+        name (str): The channel name as shown on YouTube or returned by Gemini.
+
+    Returns:
+        str: The normalized name used for matching.
+    """
+    return _NON_WORD.sub("", str(name).lower())
+
+
+def _ngrams(text: str) -> set[str]:
+    """Returns all character n-grams of a normalized name."""
+    return {text[i : i + NGRAM_SIZE] for i in range(len(text) - NGRAM_SIZE + 1)}
+
+
+class ChannelNameIndex:
+    """Resolves free-form channel names to channel IDs without scanning all rows.
+
+    Exact matches on the normalized name are answered from a hash map.
+    Substring matches use an n-gram index to narrow the candidates before
+    the actual containment check. If neither matches, the closest
+    normalized name above FUZZY_CUTOFF is used.
+    """
+
+    def __init__(self, channel_names: Iterable[str], channel_ids: Iterable[str]):
+        self._names = [normalize_channel_name(name) for name in channel_names]
+        self._ids = [str(channel_id) for channel_id in channel_ids]
+        self._exact: dict[str, int] = {}
+        self._postings: dict[str, set[int]] = {}
+
+        for position, name in enumerate(self._names):
+            self._exact.setdefault(name, position)
+            for ngram in _ngrams(name):
+                self._postings.setdefault(ngram, set()).add(position)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def _substring_position(self, query: str) -> int | None:
+        """Returns the first position whose name contains the query."""
+        if len(query) < NGRAM_SIZE:
+            candidates: Iterable[int] = range(len(self._names))
+        else:
+            postings = sorted(
+                (self._postings.get(ngram, set()) for ngram in _ngrams(query)), key=len
+            )
+            candidates = sorted(set.intersection(*postings)) if postings[0] else []
+
+        for position in candidates:
+            if query in self._names[position]:
+                return position
+        return None
+
+    def lookup(self, channel_name: str) -> str | None:
+        """Finds the channel ID for a single channel name.
+
+        Args:
+            channel_name (str): The name to resolve.
+
+        Returns:
+            str | None: The matching channel ID, or None if nothing matches.
+        """
+        query = normalize_channel_name(channel_name)
+        if not query:
+            return None
+
+        position = self._exact.get(query)
+        if position is None:
+            position = self._substring_position(query)
+        if position is None:
+            close = difflib.get_close_matches(
+                query, self._exact.keys(), n=1, cutoff=FUZZY_CUTOFF
+            )
+            if close:
+                position = self._exact[close[0]]
+
+        return self._ids[position] if position is not None else None
+
+    def resolve(self, channel_names: Iterable[str]) -> list[str]:
+        """Resolves several channel names in one pass.
+
+        Args:
+            channel_names (Iterable[str]): The names to resolve.
+
+        Returns:
+            list[str]: The matching channel IDs in input order, without
+                       duplicates. Names without a match are skipped.
+        """
+        matched_ids: list[str] = []
+        for channel_name in channel_names:
+            channel_id = self.lookup(channel_name)
+            if channel_id is not None and channel_id not in matched_ids:
+                matched_ids.append(channel_id)
+        return matched_ids
+
+
+@lru_cache(maxsize=4)
+def _cached_index(
+    channel_names: tuple[str, ...], channel_ids: tuple[str, ...]
+) -> ChannelNameIndex:
+    return ChannelNameIndex(channel_names, channel_ids)
+
+
+def get_channel_name_index(
+    channel_names: Iterable[str], channel_ids: Iterable[str]
+) -> ChannelNameIndex:
+    """Returns the name index for a subscription list, building it only once.
+
+    Args:
+        channel_names (Iterable[str]): Channel names in subscription order.
+        channel_ids (Iterable[str]): Channel IDs in the same order.
+
+    Returns:
+        ChannelNameIndex: A (cached) index over the given channels.
+    """
+    return _cached_index(
+        tuple(str(name) for name in channel_names),
+        tuple(str(channel_id) for channel_id in channel_ids),
+    )
@@ -1,5 +1,4 @@
 from contextlib import nullcontext
-import re
 import streamlit as st
 
 ###
@@ -15,10 +14,8 @@ import pandas as pd
 from pathlib import Path
 import csv
 from datetime import datetime
-import time
-import subprocess
-import sys
-import signal
+import sqlite3
+import threading
 from typing import Any, Callable, NoReturn
 
 import src.env_management.config_env
@@ -30,19 +27,69 @@ from src.helpers.youtube_helper import (
     get_subscriptions,
     get_recent_videos_from_subscriptions,
     search_videos_dlp,
+    enrich_videos_dlp,
+    needs_enrichment,
     get_recent_videos_from_channels_RSS,
-    get_trending_videos,
-    get_trending_videos_dlp,
+)
+from src.helpers.trending_helper import load_trending_videos, trending_regions
+from src.helpers.search_helper import load_search_page, prefetch_search_page
+from src.helpers.digest_helper import combine_video_digests
+from src.helpers.tracing_helper import (
+    clear_traces,
+    get_recent_traces,
+    set_attribute,
+    traced,
+)
+from src.helpers.logging_helper import get_logger
+from src.helpers.video_helper import Video
+from src.helpers.video_helper import sort_by_upload_date as sort_video_list
+from src.helpers.video_frame_helper import (
+    VIDEO_PAGE_SIZE,
+    dedup_videos,
+    filter_by_duration,
+    frame_to_videos,
+    get_page,
+    page_count,
+    read_videos_csv,
+    sort_by_upload_date,
+    videos_to_frame,
+)
+from src.helpers.ingest_helper import load_ingested_videos
+from src.helpers.user_helper import SUBSCRIPTIONS_FILE, USER_DATA_DIR, user_path
+from src.helpers.gitignore_helper import ensure_gitignored, register_data_files
+from src.helpers.worker_helper import ensure_ingest_worker
+from src.helpers.storage_helper import (
+    DebouncedWriter,
+    append_csv_rows,
+    append_new_csv_rows,
+    file_lock,
+    rewrite_csv,
+)
+from src.helpers.planner_helper import interest_values, plan_watch_time
+from src.helpers.search_index_helper import index_videos, search_local_index
+from src.helpers.channel_index_helper import ChannelNameIndex, get_channel_name_index
+from src.helpers.vector_index_helper import (
+    CHANNEL_EMBEDDINGS_FILE,
+    VIDEO_EMBEDDINGS_FILE,
+    VectorIndex,
+    update_vector_index,
 )
 from src.env_management.api_key_management import get_api_key, create_youtube_client
 from src.env_management.youtube_channel_id import load_channel_id
+from src.env_management.settings_management import (
+    invalidate_changed_settings,
+    reload_settings,
+)
+
+logger = get_logger(__name__)
 
 
 def build_settings_pop_up() -> None:
     """Builds a pop-up modal (simulated via main page content) for initial API key setup.
 
     Displayed when API keys are missing upon initialization. Allows user
-    to input and save keys to the .env file. Triggers an app restart on save.
+    to input and save keys to the .env file. The new keys are applied to the
+    running app on save, see reload_settings.
 
     Returns:
         None
@@ -64,6 +111,7 @@ def build_settings_pop_up() -> None:
     channel_id = st.text_input("ℹ️ Channel ID", channel_id, type="password")
 
     if st.button("💾 Speichern"):
+        previous_env = dotenv_values(env_path)
         if youtube_key:
             set_key(env_path, "YOUTUBE_API_KEY", youtube_key)
         if gemini_key:
@@ -79,11 +127,11 @@ def build_settings_pop_up() -> None:
             and updated_env.get("CHANNEL_ID") == channel_id
         ):
 
-            st.success("✅ API-Keys wurden gespeichert!")
+            invalidate_changed_settings(previous_env, updated_env)
+            reload_settings(env_path)
             st.session_state.show_settings = False
-            time.sleep(2)
-            subprocess.Popen([sys.executable, "src/restart_app.py"])
-            os.kill(os.getpid(), signal.SIGTERM)
+            st.session_state["settings_saved"] = True
+            st.rerun()
 
         else:
             st.error("⚠️ Fehler beim Speichern! Bitte erneut versuchen.")
@@ -92,7 +140,10 @@ def build_settings_pop_up() -> None:
 def initialize() -> Resource | NoReturn:
     """Initializes the Google API Client for YouTube.
 
-    Checks for required API keys (YouTube and Gemini) in environment variables.
+    Makes sure all registered data files are listed in .gitignore, then
+    checks for required API keys (YouTube and Gemini) in environment variables
+    and starts the ingestion worker if it is not running (see
+    worker_helper.ensure_ingest_worker).
     If keys are missing or empty, it triggers a settings pop-up, stops
     the application execution via st.stop(), and raises a RuntimeError
     (the RuntimeError is primarily to satisfy static type checkers like mypy
@@ -109,18 +160,25 @@ def initialize() -> Resource | NoReturn:
         ValueError: If API keys are found to be None or empty after retrieval.
                     This is caught internally and leads to the NoReturn path.
     """
+    try:
+        ensure_gitignored()
+    except OSError as e:
+        logger.warning(".gitignore konnte nicht aktualisiert werden: %s", e)
+
     try:
         YT_API_KEY = get_api_key("YOUTUBE_API_KEY")
         GEMINI_API_KEY = get_api_key("TOKEN_GOOGLEAPI")
         if not YT_API_KEY or not GEMINI_API_KEY:
             raise ValueError("API keys not found. Please check your .env file.")
         youtube: Resource = create_youtube_client(YT_API_KEY)
-        return youtube
     except Exception as e:
         build_settings_pop_up()
         st.stop()
         raise RuntimeError("App sollte bis jetzt schon abgebrochen worden sein") from e
 
+    ensure_ingest_worker()
+    return youtube
+
 
 ####Needs to be executed after initialize()####
 try:
@@ -128,11 +186,11 @@ try:
         extract_video_id_and_reason,
         get_summary,
         get_recommendation,
-        combine_video_id_title_and_transcript,
         check_for_clickbait,
         get_subscriptions_based_on_interests,
         get_short_summary_for_watch_list,
         get_channel_recommendations,
+        get_embeddings,
     )
 except:
     initialize()
@@ -140,15 +198,16 @@ except:
         extract_video_id_and_reason,
         get_summary,
         get_recommendation,
-        combine_video_id_title_and_transcript,
         check_for_clickbait,
         get_subscriptions_based_on_interests,
         get_short_summary_for_watch_list,
         get_channel_recommendations,
+        get_embeddings,
     )
 
 
 # Variables & constants
+# Personal state files. The paths are resolved per user with user_path.
 watch_later_history = "watch_later_history.csv"
 watch_later_csv = "watch_later.csv"
 gitignore = ".gitignore"
@@ -157,6 +216,35 @@ Interests_file = "interests.txt"
 result = None
 
 FEEDBACK_FILE = "feedback.csv"
+WATCH_LATER_FIELDS = [
+    "title",
+    "channel_name",
+    "video_id",
+    "video_url",
+    "length",
+    "views",
+    "summarized_transcript",
+]
+FEEDBACK_FIELDS = ["Datum", "Uhrzeit", "Feedback"]
+
+# run.py saves the interests on every rerun. They are kept in memory per
+# interests file and written to disk once they stop changing.
+INTERESTS_DEBOUNCE_S = 2.0
+_interests_lock = threading.Lock()
+_interests_cache: dict[str, str] = {}
+_interests_writer = DebouncedWriter(INTERESTS_DEBOUNCE_S)
+
+register_data_files(
+    watch_later_csv,
+    watch_later_history,
+    Interests_file,
+    FEEDBACK_FILE,
+    SUBSCRIPTIONS_FILE,
+    f"{USER_DATA_DIR}/",
+)
+
+# The last step of the length filter in the search tab means "no limit".
+SEARCH_MAX_LENGTH_MINUTES = 180
 
 
 # Helpers
@@ -177,6 +265,120 @@ def duration_to_seconds(duration_str: str) -> int:
     return 0
 
 
+def embed_interests(interests: str) -> list[list[float]] | None:
+    """Embeds each comma-separated interest as a separate search query.
+
+    Args:
+        interests (str): The user's interests, e.g. "KI, Kochen, Fußball".
+
+    Returns:
+        list[list[float]] | None: One embedding per interest, or None if there
+                                  are no interests or the embedding call fails.
+    """
+    interest_list = [part.strip() for part in interests.split(",") if part.strip()]
+    if not interest_list:
+        return None
+    return get_embeddings(interest_list, task_type="RETRIEVAL_QUERY")
+
+
+def get_interest_matched_channel_ids(
+    subscriptions: pd.DataFrame,
+    interests: str,
+    number_of_channels: int,
+    index_path: str = CHANNEL_EMBEDDINGS_FILE,
+) -> list[str] | None:
+    """Selects the subscribed channels that best match the user's interests.
+
+    Channel name and description are embedded once per channel and kept in a
+    local vector index, so only new or changed channels cost an API call.
+    Matching itself is a local cosine similarity over all channels.
+
+    Args:
+        subscriptions (pd.DataFrame): Subscriptions as returned by get_subscriptions.
+        interests (str): The user's comma-separated interests.
+        number_of_channels (int): The number of channel IDs to return.
+        index_path (str, optional): Path of the channel embedding index.
+                                    Defaults to CHANNEL_EMBEDDINGS_FILE.
+
+    Returns:
+        list[str] | None: The best matching channel IDs, or None if embeddings
+                          are not available and the caller should fall back.
+    """
+    channel_texts = {
+        str(row.channel_id): f"{row.channel_name}: {row.description}"
+        for row in subscriptions.fillna("").itertuples(index=False)
+    }
+    if not channel_texts:
+        return []
+
+    index = VectorIndex.load(index_path)
+    if not update_vector_index(index, channel_texts, get_embeddings):
+        return None
+    if index.dirty:
+        index.save(index_path)
+
+    interest_vectors = embed_interests(interests)
+    if interest_vectors is None:
+        return None
+
+    return [
+        channel_id
+        for channel_id, _ in index.top_k(
+            interest_vectors, number_of_channels, keys=channel_texts.keys()
+        )
+    ]
+
+
+def score_videos_by_interests(
+    videos: list[dict[str, Any]],
+    interests: str,
+    index_path: str = VIDEO_EMBEDDINGS_FILE,
+) -> list[float] | None:
+    """Scores videos by the cosine similarity of their content to the interests.
+
+    Title, channel and, where available, the summarized transcript of each
+    video are embedded once and cached in a local vector index.
+
+    Args:
+        videos (list[dict[str, Any]]): Videos with at least 'video_id' and 'title'.
+        interests (str): The user's comma-separated interests.
+        index_path (str, optional): Path of the video embedding index.
+                                    Defaults to VIDEO_EMBEDDINGS_FILE.
+
+    Returns:
+        list[float] | None: One score between -1 and 1 per video, in input order,
+                            or None if embeddings are not available.
+    """
+    video_texts = {
+        video["video_id"]: " ".join(
+            str(part)
+            for part in (
+                video.get("title", ""),
+                video.get("channel_name", ""),
+                video.get("summarized_transcript", ""),
+            )
+            if part
+        )
+        for video in videos
+    }
+    if not video_texts:
+        return []
+
+    index = VectorIndex.load(index_path)
+    if not update_vector_index(index, video_texts, get_embeddings):
+        return None
+    if index.dirty:
+        index.save(index_path)
+
+    interest_vectors = embed_interests(interests)
+    if interest_vectors is None:
+        return None
+
+    keys, scores = index.similarities(interest_vectors, keys=video_texts.keys())
+    best_scores = dict(zip(keys, scores.max(axis=0).tolist()))
+    return [best_scores.get(video["video_id"], 0.0) for video in videos]
+
+
 @st.fragment
 def lazy_expander(
     title: str,
@@ -272,11 +474,43 @@ def lazy_button(
             st.rerun()
 
 
+def select_page(total: int, page_size: int, key_id: str) -> int:
+    """Renders a page selector for lists longer than one page.
+
+    Args:
+        total (int): The number of videos in the list.
+        page_size (int): Videos per page.
+        key_id (str): Identifies the list, the selected page is kept per list.
+
+    Returns:
+        int: The selected page, counting from 1. Always 1 for short lists.
+    """
+    pages = page_count(total, page_size)
+    if pages == 1:
+        return 1
+
+    key = f"page_{key_id}"
+    # A new, shorter result set must not keep a page that no longer exists.
+    if st.session_state.get(key, 1) > pages:
+        st.session_state[key] = 1
+    page = st.number_input(
+        f"Seite (von {pages}, {total} Videos)",
+        min_value=1,
+        max_value=pages,
+        step=1,
+        key=key,
+    )
+    return int(page)
+
+
 ########################## CSV-Functions ##########################
 def write_filename_to_gitignore(gitignore_path: str, filename: str) -> None:
     """Appends a filename to the specified .gitignore file if not already present.
 
-    Creates the .gitignore file if it does not exist.
+    Creates the .gitignore file if it does not exist. The .gitignore is read
+    once per process (see gitignore_helper.ensure_gitignored), so repeated
+    calls from the write paths cost no file access. Files in per-user
+    directories are covered by one entry for the whole user data directory.
 
     Args:
         gitignore_path (str): The path to the .gitignore file.
@@ -285,14 +519,7 @@ def write_filename_to_gitignore(gitignore_path: str, filename: str) -> None:
     Returns:
         None
     """
-    if os.path.exists(gitignore_path):
-        with open(gitignore_path, "r+", encoding="utf-8") as gitignore_file:
-            lines = gitignore_file.readlines()
-            if filename not in [line.strip() for line in lines]:
-                gitignore_file.write(f"\n{filename}\n")
-    else:
-        with open(gitignore_path, "w", encoding="utf-8") as gitignore_file:
-            gitignore_file.write(f"{filename}\n")
+    ensure_gitignored([filename], gitignore_path)
 
 
 def read_csv_to_list(filename: str) -> list[dict[str, str]]:
@@ -327,83 +554,71 @@ def read_csv_to_list(filename: str) -> list[dict[str, str]]:
 
 
 def update_history_csv(
-    source_file: str = watch_later_csv,
-    history_file: str = watch_later_history,
+    source_file: str | None = None,
+    history_file: str | None = None,
     gitignore_path: str = gitignore,
 ) -> None:
     """Appends new, unique rows from a source CSV file to a history CSV file.
 
     Creates the history file if it doesn't exist and adds it to .gitignore.
-    Handles potential errors during file operations.
+    Reading the history and appending the new rows happen under the file
+    lock of the history, so concurrent sessions never add a row twice.
 
     Args:
-        source_file (str, optional): Path to the source CSV file.
-                                     Defaults to watch_later_csv.
-        history_file (str, optional): Path to the history CSV file.
-                                      Defaults to watch_later_history.
+        source_file (str | None, optional): Path to the source CSV file.
+                                     Defaults to the user's watch_later_csv.
+        history_file (str | None, optional): Path to the history CSV file.
+                                      Defaults to the user's watch_later_history.
         gitignore_path (str, optional): Path to the .gitignore file.
                                         Defaults to gitignore.
 
     Returns:
         None
     """
+    source_file = source_file or user_path(watch_later_csv)
+    history_file = history_file or user_path(watch_later_history)
     if not os.path.exists(source_file) or os.stat(source_file).st_size == 0:
-        print("Die Quell-CSV ist leer oder existiert nicht. Keine neuen Einträge.")
+        logger.info("Die Quell-CSV ist leer oder existiert nicht. Keine neuen Einträge.")
         return
 
     if not os.path.exists(history_file):
-        with open(history_file, mode="w", encoding="utf-8") as file:
-            pass
-        print(f"{history_file} wurde erstellt.")
-
         write_filename_to_gitignore(gitignore_path, history_file)
 
-    history_data = set()
-    if os.stat(history_file).st_size > 0:
-        with open(history_file, mode="r", encoding="utf-8") as file:
+    with file_lock(source_file, shared=True):
+        with open(source_file, mode="r", encoding="utf-8") as file:
             reader = csv.reader(file)
             header = next(reader, None)
-            if header:
-                for row in reader:
-                    history_data.add(tuple(row))
-
-    new_data = []
-    with open(source_file, mode="r", encoding="utf-8") as file:
-        reader = csv.reader(file)
-        header = next(reader, None)
-        if header:
-            for row in reader:
-                if tuple(row) not in history_data:
-                    new_data.append(row)
+            rows = list(reader) if header else []
 
+    new_data = append_new_csv_rows(history_file, header, rows) if header else []
     if new_data:
-        with open(history_file, mode="a", newline="", encoding="utf-8") as file:
-            writer = csv.writer(file)
-            if not history_data and header:
-                writer.writerow(header)
-            writer.writerows(new_data)
-        print(f"{len(new_data)} neue Einträge zur History hinzugefügt.")
+        logger.info("%d neue Einträge zur History hinzugefügt.", len(new_data))
+        try:
+            index_videos(dict(zip(header, row)) for row in new_data)
+        except sqlite3.Error as e:
+            logger.warning("History konnte nicht indexiert werden: %s", e)
     else:
-        print("Keine neuen Einträge für die History gefunden.")
+        logger.info("Keine neuen Einträge für die History gefunden.")
 
 
 def save_video_to_csv(
-    video: dict[str, Any],
-    filename: str = watch_later_csv,
+    video: Video | dict[str, Any],
+    filename: str | None = None,
     gitignore_path: str = gitignore,
 ) -> None:
     """Saves video metadata to a specified CSV file and updates history.
 
     Appends the video information as a new row. Creates the CSV file
     with headers if it doesn't exist. Adds the filename to .gitignore.
-    Includes fetching and summarizing the transcript.
+    Includes fetching and summarizing the transcript. Appends of concurrent
+    sessions are locked and written together (see append_csv_rows).
 
     Args:
-        video (Dict[str, Any]): A dictionary containing video metadata. Must include
-                                keys: 'title', 'channel_name', 'video_id',
+        video (Video | dict[str, Any]): The video. Dictionaries must include
+                                the keys 'title', 'channel_name', 'video_id',
                                 'length', 'views'.
-        filename (str, optional): Path to the CSV file for saving.
-                                  Defaults to watch_later_csv.
+        filename (str | None, optional): Path to the CSV file for saving.
+                                  Defaults to the user's watch_later_csv.
         gitignore_path (str, optional): Path to the .gitignore file.
                                         Defaults to gitignore.
 
@@ -413,39 +628,23 @@ def save_video_to_csv(
     Raises:
         KeyError: If the 'video' dictionary is missing essential keys.
     """
-    file_exists = os.path.isfile(filename)
-    with open(filename, mode="a", newline="", encoding="utf-8") as file:
-        writer = csv.DictWriter(
-            file,
-            fieldnames=[
-                "title",
-                "channel_name",
-                "video_id",
-                "video_url",
-                "length",
-                "views",
-                "summarized_transcript",
-            ],
-        )
-
-        if not file_exists:
-            writer.writeheader()
-
-        writer.writerow(
-            {
-                "title": video["title"],
-                "channel_name": video["channel_name"],
-                "video_id": video["video_id"],
-                "video_url": f"https://www.youtube.com/watch?v={video['video_id']}",
-                "length": video["length"],
-                "views": video["views"],
-                "summarized_transcript": get_short_summary_for_watch_list(
-                    get_transcript(video["video_id"]),
-                    video["title"],
-                    video["channel_name"],
-                ),
-            }
-        )
+    filename = filename or user_path(watch_later_csv)
+    # The summary is generated before the file is locked, so slow Gemini
+    # calls never block other sessions.
+    row = {
+        "title": video["title"],
+        "channel_name": video["channel_name"],
+        "video_id": video["video_id"],
+        "video_url": f"https://www.youtube.com/watch?v={video['video_id']}",
+        "length": video["length"],
+        "views": video["views"],
+        "summarized_transcript": get_short_summary_for_watch_list(
+            get_transcript(video["video_id"]),
+            video["title"],
+            video["channel_name"],
+        ),
+    }
+    append_csv_rows(filename, WATCH_LATER_FIELDS, [row])
 
     write_filename_to_gitignore(gitignore_path, filename)
 
@@ -453,24 +652,35 @@ def save_video_to_csv(
 
 
 def load_interests() -> str:
-    """Loads user interests from the predefined interests text file.
+    """Loads the interests of the current user.
+
+    The interests file is read once per process, later calls are answered
+    from memory, including changes that have not been written yet.
 
     Returns:
         str: The content of the interests file as a string, stripped of
              leading/trailing whitespace. Returns an empty string if the file
              does not exist or an error occurs.
     """
-    if os.path.exists(Interests_file):
-        with open(Interests_file, "r", encoding="utf-8") as file:
-            return file.read().strip()
-    return ""
+    interests_file = user_path(Interests_file)
+    with _interests_lock:
+        if interests_file in _interests_cache:
+            return _interests_cache[interests_file]
+
+    interests = ""
+    if os.path.exists(interests_file):
+        with open(interests_file, "r", encoding="utf-8") as file:
+            interests = file.read().strip()
+    with _interests_lock:
+        return _interests_cache.setdefault(interests_file, interests)
 
 
 def save_interests(interests: str) -> None:
-    """Saves the given interests string to the predefined interests text file.
+    """Saves the interests of the current user.
 
-    Only writes to the file if the new interests string differs from the
-    currently saved one. Ensures the interests file is listed in .gitignore.
+    Unchanged interests cost no disk access. Changed interests are kept in
+    memory immediately and written to the interests file once they have not
+    changed for INTERESTS_DEBOUNCE_S seconds (see flush_interests).
 
     Args:
         interests (str): The string containing user interests to save.
@@ -478,99 +688,111 @@ def save_interests(interests: str) -> None:
     Returns:
         None
     """
+    interests_file = user_path(Interests_file)
     current_interests = load_interests()
     if current_interests != interests:
-        with open(Interests_file, "w", encoding="utf-8") as file:
-            file.write(interests)
+        with _interests_lock:
+            _interests_cache[interests_file] = interests
+        _interests_writer.schedule(interests_file, interests)
+
+    write_filename_to_gitignore(filename=interests_file, gitignore_path=gitignore)
+
 
-    write_filename_to_gitignore(filename=Interests_file, gitignore_path=gitignore)
+def flush_interests() -> None:
+    """Writes interests that are still waiting for the debounce delay."""
+    _interests_writer.flush()
 
 
-def delete_video_by_id(video: dict[str, Any], filename: str = watch_later_csv) -> None:
+def delete_video_by_id(
+    video: Video | dict[str, Any], filename: str | None = None
+) -> None:
     """Deletes a video entry from the specified CSV file based on 'video_id'.
 
     Rewrites the CSV file excluding the row that matches the video_id
-    from the input video dictionary.
+    from the input video dictionary. The new file replaces the old one
+    atomically under the file lock.
 
     Args:
-        video (Dict[str, Any]): A dictionary representing the video to delete.
-                                Must contain at least the 'video_id' key.
-        filename (str, optional): Path to the CSV file from which to delete.
-                                  Defaults to watch_later_csv.
+        video (Video | dict[str, Any]): The video to delete. Dictionaries must
+                                contain at least the 'video_id' key.
+        filename (str | None, optional): Path to the CSV file from which to delete.
+                                  Defaults to the user's watch_later_csv.
 
     Returns:
         None
     """
-    videos = []
+    filename = filename or user_path(watch_later_csv)
     video_id = video["video_id"]
-    with open(filename, mode="r", encoding="utf-8") as file:
-        reader = csv.DictReader(file)
-        for row in reader:
-            videos.append(row)
-
-    videos_to_keep = [video for video in videos if video["video_id"] != video_id]
-
-    with open(filename, mode="w", newline="", encoding="utf-8") as file:
-        fieldnames = [
-            "title",
-            "channel_name",
-            "video_id",
-            "video_url",
-            "length",
-            "views",
-            "summarized_transcript",
-        ]
-        writer = csv.DictWriter(file, fieldnames=fieldnames)
-
-        writer.writeheader()
-        for video in videos_to_keep:
-            writer.writerow(video)
+    rewrite_csv(
+        filename,
+        WATCH_LATER_FIELDS,
+        lambda rows: [row for row in rows if row["video_id"] != video_id],
+    )
 
-    print(f"Das Video mit der video_id {video_id} wurde erfolgreich gelöscht.")
+    logger.info("Das Video mit der video_id %s wurde erfolgreich gelöscht.", video_id)
 
 
+@traced("render.video_list")
 def build_video_list(
-    show_spoiler: bool, incoming_videos: list[dict[str, Any]], key_id: str
+    show_spoiler: bool,
+    incoming_videos: pd.DataFrame | list[Video | dict[str, Any]],
+    key_id: str,
+    page_size: int = VIDEO_PAGE_SIZE,
 ) -> None:
     """Renders a list of videos using Streamlit components.
 
     Displays title, channel, link, an expandable summary, video player,
     length, views, and conditional add/delete buttons for each video.
+    Longer lists are shown page by page. Only the videos of the current
+    page are converted, rendered and added to the local search index.
 
     Args:
         show_spoiler (bool): value that controls whether your summary is with or without spoilers
 
-        incoming_videos (List[Dict[str, Any]]): A list of dictionaries,
-                        where each dictionary represents a video and contains
-                        keys like 'title', 'channel_name', 'video_id', 'length', 'views'.
+        incoming_videos (pd.DataFrame | list[Video | dict[str, Any]]): The videos
+                        to show, as a video frame (see video_frame_helper) or
+                        a list. Rows of the watch list CSV files are
+                        normalized to Video.
         key_id (str): A unique identifier string to be incorporated into the keys
                       of Streamlit elements created within this function, ensuring
                       uniqueness across different lists.
+        page_size (int, optional): Videos per page. Defaults to VIDEO_PAGE_SIZE.
 
     Returns:
         None
     """
     saved_video_ids = []
-    filename = watch_later_csv
+    filename = user_path(watch_later_csv)
     if os.path.exists(filename):
-        with open(filename, mode="r", encoding="utf-8") as file:
+        with file_lock(filename, shared=True), open(
+            filename, mode="r", encoding="utf-8"
+        ) as file:
             reader = csv.DictReader(file)
 
             for row in reader:
                 if "video_id" in row:
                     saved_video_ids.append(row["video_id"])
                 else:
-                    print(f"Spalte '{'video_id'}' nicht gefunden.")
+                    logger.warning("Spalte 'video_id' nicht gefunden in %s.", filename)
+
+    if not isinstance(incoming_videos, pd.DataFrame):
+        incoming_videos = videos_to_frame(incoming_videos)
+    page = select_page(len(incoming_videos), page_size, key_id)
+    videos = frame_to_videos(get_page(incoming_videos, page, page_size))
+    set_attribute("video_count", len(incoming_videos))
+    try:
+        index_videos(videos)
+    except sqlite3.Error as e:
+        logger.warning("Videos konnten nicht indexiert werden: %s", e)
 
-    for video in incoming_videos:
-        st.subheader(video["title"])
-        st.write(video["channel_name"])
+    for video in videos:
+        st.subheader(video.title)
+        st.write(video.channel_name)
         st.write(
-            f"[📺 Video ansehen](https://www.youtube.com/watch?v={video['video_id']})"
+            f"[📺 Video ansehen](https://www.youtube.com/watch?v={video.video_id})"
         )
 
-        expander_key = f"summary_{video['video_id']}_{key_id}"
-        print(expander_key)
+        expander_key = f"summary_{video.video_id}_{key_id}"
         if expander_key not in st.session_state:
             st.session_state[expander_key] = None
 
@@ -606,39 +828,41 @@ def build_video_list(
             title="📜 Zusammenfassung",
             key=expander_key,
             on_expand=load_summary,
-            callback_kwargs={"video_id": video["video_id"], "title": video["title"]},
+            callback_kwargs={"video_id": video.video_id, "title": video.title},
         )
 
-        st.video(f"https://www.youtube.com/watch?v={video['video_id']}")
-        st.write(f"{video['length']} Min.")
-        st.write(f"{video['views']} Views")
+        st.video(f"https://www.youtube.com/watch?v={video.video_id}")
+        st.write(f"{video.length} Min.")
+        st.write(f"{video.views} Views")
 
         if key_id == "watch_later":
             lazy_button(
                 label="🚮delete from list",
-                key=f"del_{video['video_id']}",
+                key=f"del_{video.video_id}",
                 on_click=delete_video_by_id,
                 callback_kwargs={"video": video},
             )
 
         else:
-            if video["video_id"] not in saved_video_ids:
+            if video.video_id not in saved_video_ids:
                 lazy_button(
                     label="➕add to watch list",
-                    key=f"save_{video['video_id']}",
+                    key=f"save_{video.video_id}",
                     on_click=save_video_to_csv,
                     callback_kwargs={"video": video},
                 )
 
 
 # Build Tabs
+@traced("render.trending_videos_tab")
 def build_trending_videos_tab(
     spoiler: bool, search_method: str, youtube: Resource | None
 ) -> None:
     """Builds the Streamlit tab displaying trending YouTube videos.
 
-    Allows selection of region and loads trending videos using either the
-    YouTube API or yt-dlp based on the search_method.
+    Allows selection of region and shows the latest trending snapshot of
+    that region, taken either with the YouTube API or yt-dlp based on the
+    search_method. The regions come from TRENDING_REGIONS.
 
     Args:
         search_method (str): The method to use for fetching videos
@@ -650,21 +874,21 @@ def build_trending_videos_tab(
         None
     """
     st.header("Trending Videos")
-    region_code = st.radio("Region wählen:", ("DE", "US", "GB"))
+    region_code = st.radio("Region wählen:", trending_regions())
 
     if st.button("🔄 Trending Videos laden"):
         with st.spinner("Lade Trending Videos..."):
-            if search_method == "YouTube API":
-                videos = get_trending_videos(youtube, region_code)
-            else:
-                videos = get_trending_videos_dlp(region_code)
-            print(videos)
+            videos = load_trending_videos(
+                region_code, youtube if search_method == "YouTube API" else None
+            )
+            logger.debug("%d Trending Videos geladen", len(videos))
         if not videos:
             st.write("Keine Videos gefunden oder ein Fehler ist aufgetreten.")
         else:
             build_video_list(spoiler, videos, key_id="trending_videos")
 
 
+@traced("render.trend_recommendations")
 def build_trend_recommendations(
     spoiler: bool,
     search_method: str,
@@ -676,8 +900,10 @@ def build_trend_recommendations(
 ) -> None:
     """Builds the content for recommendations based on trending videos.
 
-    Fetches trending videos, gets recommendations from Gemini based on them
-    and user interests, and displays the recommended video. Includes retry logic.
+    Loads the trending snapshot, gets recommendations from Gemini based on
+    the transcript digests of the videos and user interests, and displays
+    the recommended video. Only videos that were not digested in an earlier
+    run have their transcript loaded. Includes retry logic.
 
     Args:
         search_method (str): The method for fetching videos ("YouTube API" or other).
@@ -712,12 +938,11 @@ def build_trend_recommendations(
                 "Bitte beachten Sie eine möglicherweise längere Ladezeit aufgrund der hohen Datenmenge und QA-Mechanismen."
             )
 
-        if search_method == "YouTube API":
-            videos = get_trending_videos(youtube, region_code="DE")
-        else:
-            videos = get_trending_videos_dlp(region_code="DE")
+        videos = load_trending_videos(
+            "DE", youtube if search_method == "YouTube API" else None
+        )
 
-        video_ids_titles_and_transcripts = combine_video_id_title_and_transcript(videos)
+        video_ids_titles_and_transcripts = combine_video_digests(videos)
         recommendations_unfiltered = get_recommendation(
             video_ids_titles_and_transcripts=video_ids_titles_and_transcripts,
             interests=user_interests,
@@ -767,6 +992,7 @@ def build_trend_recommendations(
         st.write(recommendations["Begründung"])
 
 
+@traced("render.gemini_recommendations")
 def build_gemini_recommondations(
     spoiler: bool,
     search_method: str,
@@ -810,7 +1036,11 @@ def build_gemini_recommondations(
                 "Kanalanzahl (yt-dlp)", min_value=1, max_value=30, value=10
             )
 
-        subscriptions = get_subscriptions(channel_Id=channelId, youtube=youtube)
+        subscriptions = get_subscriptions(
+            channel_Id=channelId,
+            youtube=youtube,
+            csv_filename=user_path(SUBSCRIPTIONS_FILE),
+        )
         if os.path.exists(history_path):
             history = read_csv_to_list(history_path)
             if len(history) != 0:
@@ -820,8 +1050,7 @@ def build_gemini_recommondations(
                     )
                     for channel in recommended_channels:
                         if channel != "Fehler":
-                            print(channel)
-                            print("response:_______________________________")
+                            logger.debug("Lade Videos für empfohlenen Kanal %s", channel)
                             if search_method == "YouTube API":
                                 if youtube:
                                     try:
@@ -860,6 +1089,7 @@ def build_gemini_recommondations(
             )
 
 
+@traced("render.recommendation_tab")
 def build_recommendation_tab(
     spoiler: bool,
     search_method: str,
@@ -905,10 +1135,15 @@ def build_recommendation_tab(
 
     with tab2:
         build_gemini_recommondations(
-            spoiler, search_method, youtube, user_interests, "watch_later_history.csv"
+            spoiler,
+            search_method,
+            youtube,
+            user_interests,
+            user_path(watch_later_history),
         )
 
 
+@traced("render.clickbait_recognition_tab")
 def build_clickbait_recognition_tab() -> None:
     """Builds the Streamlit tab for analyzing video clickbait potential.
 
@@ -931,7 +1166,7 @@ def build_clickbait_recognition_tab() -> None:
         if video_id:
             video_info = get_video_data_dlp(video_id)
             clickbait_elements = check_for_clickbait(
-                get_transcript(video_id), video_info["title"]
+                get_transcript(video_id), video_info.title if video_info else ""
             )
             if clickbait_elements == "no transcript":
                 st.warning(
@@ -968,19 +1203,14 @@ def save_feedback(feedback_text: str) -> None:
     time = now.strftime("%H:%M:%S")
     feedback_data = [date, time, feedback_text]
 
-    file_exists = os.path.exists(FEEDBACK_FILE)
-
-    with open(FEEDBACK_FILE, mode="a", newline="", encoding="utf-8") as file:
-        writer = csv.writer(file)
-        if not file_exists:
-            writer.writerow(["Datum", "Uhrzeit", "Feedback"])
-        writer.writerow(feedback_data)
+    append_csv_rows(user_path(FEEDBACK_FILE), FEEDBACK_FIELDS, [feedback_data])
 
     st.session_state["feedback_submitted"] = True
     st.session_state["feedback_text"] = ""
     st.rerun()
 
 
+@traced("render.feedback_tab")
 def build_feedback_tab() -> None:
     """Builds the Streamlit tab for collecting user feedback.
 
@@ -1012,17 +1242,27 @@ def build_feedback_tab() -> None:
             st.warning("Bitte gib ein Feedback ein, bevor du es absendest.")
 
 
+@traced("render.search_tab")
 def build_search_tab(
     spoiler: bool, search_method: str, youtube: Resource | None
 ) -> None:
     """Builds the Streamlit tab for searching YouTube videos.
 
-    Provides a text input for the query and optionally a slider for max results.
-    Fetches and displays search results using the specified method. Manages
-    results in session state.
+    Provides a text input for the query and fetches the first page of search
+    results using the specified method. Further pages are loaded with the
+    "Mehr laden" button and appended to the list (see load_search_page); with
+    yt-dlp the next page is already prefetched in the background while the
+    current one is shown. API pages are only loaded on demand, each one costs
+    100 quota units. The "Lokaler Index" method searches already seen videos
+    and transcripts offline. Results are kept as a deduplicated video frame
+    in session state, so sorting and the length filter run on columns
+    without a new search. Flat yt-dlp results are shown at once; their
+    missing upload dates, tags and views are loaded afterwards (see
+    enrich_videos_dlp) and the list is redrawn with them.
 
     Args:
-        search_method (str): The method for searching videos ("YouTube API" or other).
+        search_method (str): The method for searching videos ("YouTube API",
+                             "Lokaler Index" or other).
         youtube (Resource | None): The initialized YouTube API client resource, or None.
 
     Returns:
@@ -1030,55 +1270,171 @@ def build_search_tab(
     """
     st.session_state["active_tab"] = "search"
 
-    if "videos" not in st.session_state or (st.session_state.get("new_search", False)):
-        st.session_state["videos"] = []
-        st.session_state["new_search"] = False
-
     st.header("Suche")
     st.write("Hier kannst du nach Videos oder Kategorien suchen.")
 
     query = st.text_input("🔎 Wonach suchst du?", "KI Trends 2024")
 
-    max_results = 10
-    if search_method == "yt-dlp(Experimentell)":
-        max_results = st.slider(
-            "Anzahl der Videos", min_value=1, max_value=50, value=10
-        )
-
     if st.button("🔍 Suchen"):
-        st.session_state["new_search"] = True
-        if search_method == "YouTube API":
-            if youtube:
-                try:
-                    request = youtube.search().list(
-                        part="snippet", q=query, type="video", maxResults=10
-                    )
-                    response = request.execute()
-                    videos = get_video_data(youtube, response)
-                except Exception as e:
-                    st.error(f"API-Fehler bei der Suche: {e}")
-                    videos = []
-            else:
-                st.error("YouTube API Client nicht verfügbar.")
-                videos = []
+        st.session_state["search_enrichment_pending"] = False
+        st.session_state["search_paging"] = None
+        videos = []
+        if search_method == "Lokaler Index":
+            try:
+                videos = search_local_index(query, max_results=50)
+            except sqlite3.Error as e:
+                st.error(f"Fehler beim Durchsuchen des lokalen Index: {e}")
+            if not videos:
+                st.info("Keine Treffer im lokalen Index.")
+        elif search_method == "YouTube API" and not youtube:
+            st.error("YouTube API Client nicht verfügbar.")
         else:
-            videos = search_videos_dlp(query, max_results=max_results)
+            client = youtube if search_method == "YouTube API" else None
+            try:
+                page = load_search_page(query, 1, client)
+            except Exception as e:
+                st.error(f"Fehler bei der Suche: {e}")
+            else:
+                videos = page.videos
+                st.session_state["search_paging"] = {
+                    "query": query,
+                    "method": search_method,
+                    "page": 1,
+                    "has_more": page.has_more,
+                }
+                if client is None:
+                    st.session_state["search_enrichment_pending"] = any(
+                        needs_enrichment(video) for video in videos
+                    )
+                    if page.has_more:
+                        prefetch_search_page(query, 2)
 
-        st.session_state["videos"] = videos
+        st.session_state["search_results"] = dedup_videos(videos_to_frame(videos))
         st.session_state["last_tab"] = "search"
 
-    if st.session_state.get("videos"):
-        build_video_list(spoiler, st.session_state["videos"], key_id="search")
+    results = st.session_state.get("search_results")
+    if results is None or results.empty:
+        return
 
+    order_column, length_column = st.columns(2)
+    order = order_column.radio(
+        "Sortierung", ("Relevanz", "Neueste zuerst"), horizontal=True, key="search_order"
+    )
+    max_minutes = length_column.slider(
+        "Maximale Länge (Min.)",
+        min_value=1,
+        max_value=SEARCH_MAX_LENGTH_MINUTES,
+        value=SEARCH_MAX_LENGTH_MINUTES,
+        key="search_max_length",
+    )
+
+    shown = filter_by_duration(
+        results,
+        max_seconds=(
+            None if max_minutes == SEARCH_MAX_LENGTH_MINUTES else max_minutes * 60
+        ),
+    )
+    if order == "Neueste zuerst":
+        shown = sort_by_upload_date(shown)
+    else:
+        shown = shown.sort_values("place", kind="stable", na_position="last")
+
+    if shown.empty:
+        st.info("Keine Videos in dieser Länge gefunden.")
+    else:
+        build_video_list(spoiler, shown, key_id="search")
+
+    paging = st.session_state.get("search_paging")
+    if (
+        paging
+        and paging["has_more"]
+        and st.button("⏬ Mehr laden", key="search_more")
+    ):
+        client = youtube if paging["method"] == "YouTube API" else None
+        next_page = paging["page"] + 1
+        try:
+            with st.spinner("Lade weitere Ergebnisse..."):
+                page = load_search_page(paging["query"], next_page, client)
+        except Exception as e:
+            st.error(f"Fehler bei der Suche: {e}")
+        else:
+            st.session_state["search_paging"] = {
+                **paging,
+                "page": next_page,
+                "has_more": page.has_more,
+            }
+            st.session_state["search_results"] = dedup_videos(
+                videos_to_frame(frame_to_videos(results) + page.videos)
+            )
+            if client is None:
+                st.session_state["search_enrichment_pending"] = any(
+                    needs_enrichment(video) for video in page.videos
+                )
+                if page.has_more:
+                    prefetch_search_page(paging["query"], next_page + 1)
+            st.rerun()
+
+    if st.session_state.get("search_enrichment_pending") is True:
+        st.session_state["search_enrichment_pending"] = False
+        with st.spinner("Lade Upload-Daten und Aufrufe..."):
+            enriched = enrich_videos_dlp(frame_to_videos(results))
+        st.session_state["search_results"] = videos_to_frame(enriched)
+        st.rerun()
+
+
+def match_channels_with_gemini(
+    subscriptions: pd.DataFrame,
+    user_interests: str,
+    max_subs: int,
+    name_index: ChannelNameIndex,
+) -> list[str]:
+    """Lets Gemini pick channels by description and maps the names back to IDs.
+
+    Fallback for get_interest_matched_channel_ids when no embeddings can be
+    computed.
+
+    Args:
+        subscriptions (pd.DataFrame): Subscriptions as returned by get_subscriptions.
+        user_interests (str): A string describing the user's interests.
+        max_subs (int): The number of channels Gemini should select.
+        name_index (ChannelNameIndex): Precomputed name index of the subscriptions,
+                                       used to resolve the returned names.
 
+    Returns:
+        list[str]: The channel IDs of the selected channels.
+    """
+    channel_names_and_description = ", ".join(
+        subscriptions[subscriptions["description"].str.strip() != ""].apply(
+            lambda row: f"{row['channel_name']}:{row['description']}",
+            axis=1,
+        )
+    )
+
+    channel_string = get_subscriptions_based_on_interests(
+        channel_names_and_description, user_interests, max_subs
+    )
+
+    channel_list = []
+    if channel_string:
+        channel_list = channel_string.split(",")
+    else:
+        st.warning("Keine Kanal-Empfehlungen von Gemini erhalten.")
+
+    return name_index.resolve(channel_list)
+
+
+@traced("render.subs_tab")
 def build_subs_tab(
     spoiler, search_method: str, youtube: Resource, user_interests: str
 ) -> None:
     """Builds the Streamlit tab displaying recent videos from subscribed channels.
 
-    Fetches subscriptions, filters channels based on interests using Gemini,
-    retrieves recent videos from those channels using the specified method,
-    and displays them.
+    Fetches subscriptions, filters channels based on interests using a local
+    embedding index (with Gemini channel selection as fallback), retrieves
+    recent videos from those channels using the specified method,
+    and displays them. Outside the YouTube API mode, videos precomputed by
+    the ingestion worker (src/ingest_worker.py) are read from the local
+    store; only channels without recent results are fetched via RSS.
 
     Args:
         search_method (str): The method for fetching videos ("YouTube API" or other).
@@ -1117,51 +1473,47 @@ def build_subs_tab(
         )
     else:
         try:
-            subscriptions = get_subscriptions(channel_Id=channelId, youtube=youtube)
+            subscriptions = get_subscriptions(
+                channel_Id=channelId,
+                youtube=youtube,
+                csv_filename=user_path(SUBSCRIPTIONS_FILE),
+            )
             if len(subscriptions) == 0:
                 st.error("APi key aufgebraucht oder Abos nicht öffentlich zugänglich.")
+            name_index = get_channel_name_index(
+                subscriptions.get("channel_name", []),
+                subscriptions.get("channel_id", []),
+            )
 
         except:
             st.write("Bitte stelle sicher, dass deine Abos öffentlich einsehbar sind.")
         else:
             if st.button("🔄 Abos laden"):
-                channel_names_and_description = ", ".join(
-                    subscriptions[subscriptions["description"].str.strip() != ""].apply(
-                        lambda row: f"{row['channel_name']}:{row['description']}",
-                        axis=1,
-                    )
-                )
-
-                channel_string = get_subscriptions_based_on_interests(
-                    channel_names_and_description, user_interests, max_subs
+                matched_ids = get_interest_matched_channel_ids(
+                    subscriptions, user_interests, max_subs
                 )
-
-                channel_list = []
-                if channel_string:
-                    channel_list = channel_string.split(",")
-                else:
-                    st.warning("Keine Kanal-Empfehlungen von Gemini erhalten.")
-
-                matched_ids = []
-                for channel in channel_list:
-                    normalized_channel = re.sub(r"\W+", "", channel.lower())
-                    match = subscriptions[
-                        subscriptions["channel_name"]
-                        .str.lower()
-                        .str.replace(r"\W+", "", regex=True)
-                        .str.contains(normalized_channel, na=False)
-                    ]
-                    if not match.empty:
-                        matched_ids.append(match.iloc[0]["channel_id"])
+                if matched_ids is None:
+                    matched_ids = match_channels_with_gemini(
+                        subscriptions, user_interests, max_subs, name_index
+                    )
 
                 if search_method == "YouTube API":
                     recent_videos = get_recent_videos_from_subscriptions(
                         youtube, matched_ids, max_results
                     )
                 else:
-                    recent_videos = get_recent_videos_from_channels_RSS(
+                    # The ingestion worker keeps the subscriptions up to date,
+                    # only channels it has not checked recently are fetched live.
+                    recent_videos, missing_ids = load_ingested_videos(
                         matched_ids, max_results
                     )
+                    if missing_ids:
+                        recent_videos = sort_video_list(
+                            recent_videos
+                            + get_recent_videos_from_channels_RSS(
+                                missing_ids, max_results
+                            )
+                        )
 
                 st.session_state["videos"] = recent_videos
                 st.session_state["last_tab"] = "subs"
@@ -1170,11 +1522,92 @@ def build_subs_tab(
                 build_video_list(spoiler, st.session_state["videos"], key_id="subs")
 
 
-def build_watch_later_tab(spoiler) -> None:
+def plan_watch_list(
+    videos: pd.DataFrame, interests: str, free_minutes: int
+) -> pd.DataFrame:
+    """Picks the videos that fit into the free time and match the interests best.
+
+    Scores come from the local embedding index (see score_videos_by_interests)
+    and the selection from plan_watch_time. Without embeddings, the plan
+    fits in as many videos as possible.
+
+    Args:
+        videos (pd.DataFrame): A video frame, e.g. from read_videos_csv.
+        interests (str): The user's comma-separated interests.
+        free_minutes (int): The available time in minutes.
+
+    Returns:
+        pd.DataFrame: The planned videos, best match first, with an added
+                      'score' column.
+    """
+    videos = videos[videos["duration_s"] > 0]
+    if videos.empty:
+        return videos.assign(score=pd.Series(dtype="float64"))
+
+    columns = [
+        column
+        for column in ("video_id", "title", "channel_name", "summarized_transcript")
+        if column in videos
+    ]
+    scores = (
+        score_videos_by_interests(videos[columns].to_dict("records"), interests)
+        if interests.strip()
+        else None
+    )
+    values = interest_values(scores, len(videos))
+    chosen = plan_watch_time(
+        videos["duration_s"].to_numpy(), values, free_minutes * 60
+    )
+    plan = videos.iloc[chosen].assign(score=values[chosen])
+    return plan.sort_values("score", ascending=False, kind="stable")
+
+
+@traced("render.watch_plan")
+def build_watch_plan(spoiler: bool, videos: pd.DataFrame, user_interests: str) -> None:
+    """Builds the planner that fits the watch list into the user's free time.
+
+    Args:
+        spoiler (bool): Whether summaries may contain spoilers.
+        videos (pd.DataFrame): The watch list as a video frame.
+        user_interests (str): The user's comma-separated interests.
+
+    Returns:
+        None
+    """
+    with st.expander("⏱️ Was schaffe ich heute?"):
+        free_minutes = st.number_input(
+            "Freie Zeit (Min.)", min_value=5, max_value=600, value=60, step=5
+        )
+        if st.button("📋 Watch-Plan erstellen"):
+            st.session_state["watch_plan"] = plan_watch_list(
+                videos, user_interests, int(free_minutes)
+            )
+
+        plan = st.session_state.get("watch_plan")
+        if plan is None:
+            return
+        if plan.empty:
+            st.info("Kein Video aus der Watchlist passt in diese Zeit.")
+            return
+        total_minutes = int(plan["duration_s"].sum()) // 60
+        st.write(
+            f"{len(plan)} Videos, zusammen {total_minutes} von {free_minutes} Min."
+        )
+        build_video_list(spoiler, plan, key_id="watch_plan")
+
+
+@traced("render.watch_later_tab")
+def build_watch_later_tab(spoiler: bool, user_interests: str = "") -> None:
     """Builds the Streamlit tab displaying the user's 'Watch Later' list.
 
     Reads videos from the watch later CSV file and displays them using
-    the build_video_list function. Provides a button to reload the list.
+    the build_video_list function. Provides a button to reload the list
+    and a planner for the user's free time.
+
+    Args:
+        spoiler (bool): Whether summaries may contain spoilers.
+        user_interests (str, optional): Interests used to rank the watch plan.
+                                        Defaults to "".
 
     Returns:
         None
@@ -1190,9 +1623,12 @@ def build_watch_later_tab(spoiler) -> None:
     if st.button("neu laden"):
         st.rerun()
 
-    if os.path.exists(watch_later_csv):
-        videos = read_csv_to_list(watch_later_csv)
-        if len(videos) != 0:
+    watch_later_file = user_path(watch_later_csv)
+    if os.path.exists(watch_later_file):
+        with file_lock(watch_later_file, shared=True):
+            videos = read_videos_csv(watch_later_file)
+        if not videos.empty:
+            build_watch_plan(spoiler, videos, user_interests)
             st.header("Watch list")
             build_video_list(spoiler, videos, key_id="watch_later")
         else:
@@ -1201,17 +1637,94 @@ def build_watch_later_tab(spoiler) -> None:
         st.warning("Es wurden noch keine Videos zur Watchlist hinzugefügt")
 
 
+def trace_to_dataframe(trace: list[Any]) -> pd.DataFrame:
+    """Flattens the spans of one trace into a table ordered as a call tree.
+
+    Args:
+        trace (list[Any]): The spans of one trace, see tracing_helper.get_recent_traces.
+
+    Returns:
+        pd.DataFrame: One row per span with the columns 'Span' (indented by
+                      depth), 'Dauer (ms)', 'Anteil (%)' and 'Attribute'.
+    """
+    children: dict[str | None, list[Any]] = {}
+    for trace_span in trace:
+        children.setdefault(trace_span.parent_id, []).append(trace_span)
+
+    span_ids = {trace_span.span_id for trace_span in trace}
+    roots = [
+        trace_span
+        for trace_span in trace
+        if trace_span.parent_id is None or trace_span.parent_id not in span_ids
+    ]
+    total_ms = sum(root.duration_ms for root in roots) or 1.0
+
+    rows = []
+    stack = [(root, 0) for root in sorted(roots, key=lambda s: s.start_ns, reverse=True)]
+    while stack:
+        trace_span, depth = stack.pop()
+        rows.append(
+            {
+                "Span": "  " * depth + trace_span.name,
+                "Dauer (ms)": round(trace_span.duration_ms, 1),
+                "Anteil (%)": round(100 * trace_span.duration_ms / total_ms, 1),
+                "Attribute": ", ".join(
+                    f"{key}={value}" for key, value in trace_span.attributes.items()
+                ),
+            }
+        )
+        for child in sorted(
+            children.get(trace_span.span_id, []), key=lambda s: s.start_ns, reverse=True
+        ):
+            stack.append((child, depth + 1))
+
+    return pd.DataFrame(rows, columns=["Span", "Dauer (ms)", "Anteil (%)", "Attribute"])
+
+
+def build_trace_panel() -> None:
+    """Builds the developer panel that shows where recent tab loads spent their time.
+
+    Returns:
+        None
+    """
+    with st.expander("🛠️ Entwickler: Ladezeiten"):
+        traces = get_recent_traces()
+        if not traces:
+            st.info("Noch keine Messungen vorhanden.")
+            return
+
+        labels = []
+        for trace in traces:
+            root = next(
+                (trace_span for trace_span in trace if trace_span.parent_id is None),
+                trace[-1],
+            )
+            started = datetime.fromtimestamp(root.start_ns / 1e9).strftime("%H:%M:%S")
+            labels.append(f"{started} {root.name} ({root.duration_ms:.0f} ms)")
+
+        selected = st.selectbox(
+            "Messung", range(len(traces)), format_func=lambda i: labels[i]
+        )
+        st.dataframe(trace_to_dataframe(traces[selected]), hide_index=True)
+
+        if st.button("Messungen löschen"):
+            clear_traces()
+
+
+@traced("render.settings_tab")
 def build_settings_tab() -> None:
     """Builds the Streamlit tab for managing API keys and other settings.
 
     Allows viewing/updating API keys stored in the .env file and provides
-    an option to clear the watch list history. Triggers an app restart
-    when settings are saved.
+    an option to clear the watch list history. Saved settings are applied
+    to the running app without a restart, session state and caches are kept.
 
     Returns:
         None
     """
     st.header("⚙️ Einstellungen")
+    if st.session_state.pop("settings_saved", False):
+        st.success("✅ Gespeichert. Die Änderungen wurden übernommen.")
 
     env_path = ".env"
     load_dotenv()
@@ -1241,17 +1754,16 @@ def build_settings_tab() -> None:
 
     if st.button("🗑️Watch List history löschen"):
         st.success("✅ Erfolgreich gelöscht.")
-        history = watch_later_history
-
-        if os.path.exists(history) and os.path.exists(watch_later_csv):
-            df = pd.read_csv(history)
-            df1 = pd.read_csv(watch_later_csv)
+        history = user_path(watch_later_history)
+        watch_later_file = user_path(watch_later_csv)
 
-            df.iloc[0:0].to_csv(history, index=False)
-            df1.iloc[0:0].to_csv(watch_later_csv, index=False)
+        if os.path.exists(history) and os.path.exists(watch_later_file):
+            for path in (history, watch_later_file):
+                rewrite_csv(path, WATCH_LATER_FIELDS, lambda rows: [])
         else:
             st.error("Es existiert noch keine Historie. Der Vorgang wird abgebrochen.")
     if st.button("💾 Speichern"):
+        previous_env = dotenv_values(env_path)
         if youtube_key:
             set_key(env_path, "YOUTUBE_API_KEY", youtube_key)
         if gemini_key:
@@ -1267,13 +1779,11 @@ def build_settings_tab() -> None:
             and updated_env.get("TOKEN_GOOGLEAPI") == gemini_key
             and updated_env.get("CHANNEL_ID") == channel_id
         ):
-
-            st.success(
-                "✅ Gespeichert. Bitte laden sie das Dashboard neu um die Änderungen zu übernehmen."
-            )
-            st.write("Starte App neu...")
-            time.sleep(2)
-            subprocess.Popen([sys.executable, "src/restart_app.py"])
-            os.kill(os.getpid(), signal.SIGTERM)
+            invalidate_changed_settings(previous_env, updated_env)
+            reload_settings(env_path)
+            st.session_state["settings_saved"] = True
+            st.rerun()
         else:
             st.error("⚠️ Fehler beim Speichern! Bitte erneut versuchen.")
+
+    build_trace_panel()
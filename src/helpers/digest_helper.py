@@ -0,0 +1,216 @@
+import math
+import multiprocessing
+import re
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Mapping
+
+import numpy as np
+
+from .cache_helper import get_video_digests, store_video_digests
+from .logging_helper import get_logger
+from .tracing_helper import continue_trace, set_attribute, traced
+from .youtube_helper import get_transcript
+
+logger = get_logger(__name__)
+
+# Token budget of one video in prompts. A ten-minute transcript has about
+# 2000 tokens, so prompts with many videos shrink by roughly ten times.
+DIGEST_TOKEN_BUDGET = 200
+# Rough token estimate for German and English text.
+CHARS_PER_TOKEN = 4
+# Automatic captions have no punctuation, they are split into pieces of
+# this many words instead of sentences.
+CHUNK_WORDS = 25
+# Sentences in the first part of a video usually introduce its topic.
+LEAD_SHARE = 0.1
+LEAD_BONUS = 0.5
+# Weight left for words of a selected sentence, so the next picks cover
+# other parts of the video.
+REDUNDANCY_DECAY = 0.5
+# Stored digests are only reused if they were made with the same settings.
+DIGEST_METHOD = f"extractive-{DIGEST_TOKEN_BUDGET}"
+# Videos without a transcript are looked up again after this many seconds,
+# automatic captions often appear some hours after the upload.
+EMPTY_DIGEST_TTL = 6 * 3600
+
+_FILLER = re.compile(
+    r"\[(?:musik|music|applaus|applause|gelächter|laughter|lachen)\]"
+    r"|\b(?:ä+h+m*|ö+h+m*|h+m+|u+h+m*|e+r+m+)\b[,.]?",
+    re.IGNORECASE,
+)
+_SENTENCE_END = re.compile(r"(?<=[.!?…])\s+")
+_WORD = re.compile(r"\w+")
+_STOPWORDS = frozenset(
+    """
+    aber alle als also am an auch auf aus bei bin bis bist da dann das dass
+    dein dem den der des die dies diese dieser du durch ein eine einem einen
+    einer er es etwas für habe haben hat hier ich ihr im in ist ja jetzt kann
+    mal man mehr mein mich mir mit nach nicht noch nur ob oder schon sehr sich
+    sie sind so über um und uns unser von vor war was weil wenn wie wir wird
+    wo zu zum zur a about all also an and are as at be because but by can do
+    for from get go going have he here i if in is it just know like me my no
+    not now of on one or our out really right so that the there they this to
+    up was we what when which will with you your
+    """.split()
+)
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimates the number of prompt tokens of a text."""
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def _split_sentences(text: str) -> list[str]:
+    """Splits a transcript into sentences, long unpunctuated runs into word chunks."""
+    sentences = []
+    for sentence in _SENTENCE_END.split(text):
+        words = sentence.split()
+        if len(words) <= 2 * CHUNK_WORDS:
+            sentences.append(sentence)
+            continue
+        sentences.extend(
+            " ".join(words[i : i + CHUNK_WORDS])
+            for i in range(0, len(words), CHUNK_WORDS)
+        )
+    return [sentence for sentence in sentences if sentence]
+
+
+def make_digest(transcript: str, token_budget: int = DIGEST_TOKEN_BUDGET) -> str:
+    """Compresses a transcript into an extractive digest for prompts.
+
+    Filler words and repeated sentences are removed. If the rest is still
+    longer than the budget, sentences are scored by how frequent their
+    content words are in the whole transcript, with a bonus for the
+    introduction. The best sentences are picked until the budget is used
+    up; words of picked sentences count less for later picks, so the digest
+    covers different parts of the video. The picked sentences keep their
+    original order.
+
+    Args:
+        transcript (str): The full transcript.
+        token_budget (int, optional): Maximum size of the digest in tokens.
+                                      Defaults to DIGEST_TOKEN_BUDGET.
+
+    Returns:
+        str: The digest, "" for an empty transcript.
+    """
+    text = " ".join(_FILLER.sub(" ", transcript).split())
+    if estimate_tokens(text) <= token_budget:
+        return text
+
+    # Sentences with the same content words (e.g. "Schritt 1: ..." and
+    # "Schritt 2: ...") are kept once, but all of them count for the
+    # frequency of their words.
+    vocabulary: dict[str, int] = {}
+    all_terms: list[int] = []
+    sentences: list[str] = []
+    sentence_ids: list[int] = []
+    term_ids: list[int] = []
+    seen: set[frozenset[int]] = set()
+    for sentence in _split_sentences(text):
+        terms = frozenset(
+            vocabulary.setdefault(word, len(vocabulary))
+            for word in _WORD.findall(sentence.lower())
+            if len(word) > 2 and word not in _STOPWORDS and not word.isdigit()
+        )
+        all_terms.extend(terms)
+        if not terms or terms in seen:
+            continue
+        seen.add(terms)
+        sentence_ids.extend([len(sentences)] * len(terms))
+        term_ids.extend(terms)
+        sentences.append(sentence)
+
+    # Sparse sentence-term matrix as parallel index arrays.
+    rows = np.array(sentence_ids, dtype=np.int64)
+    columns = np.array(term_ids, dtype=np.int64)
+    term_weights = np.log1p(
+        np.bincount(np.array(all_terms, dtype=np.int64), minlength=len(vocabulary))
+    )
+    lengths = np.array([len(sentence.split()) for sentence in sentences], dtype=float)
+    normalization = np.sqrt(np.maximum(lengths, 1.0))
+    positions = np.arange(len(sentences))
+    lead = 1.0 + LEAD_BONUS * (positions < max(1, int(len(sentences) * LEAD_SHARE)))
+    costs = np.array([estimate_tokens(sentence) + 1 for sentence in sentences])
+
+    available = costs <= token_budget
+    remaining = token_budget
+    selected: list[int] = []
+    while remaining > 0 and available.any():
+        scores = (
+            np.bincount(rows, weights=term_weights[columns], minlength=len(sentences))
+            / normalization
+            * lead
+        )
+        scores[~available] = -np.inf
+        best = int(np.argmax(scores))
+        selected.append(best)
+        remaining -= costs[best]
+        available[best] = False
+        available &= costs <= remaining
+        term_weights[columns[rows == best]] *= REDUNDANCY_DECAY
+
+    if not selected:
+        # Not even one sentence fits, the beginning is used instead.
+        cut = text.rfind(" ", 0, token_budget * CHARS_PER_TOKEN + 1)
+        return text[: cut if cut > 0 else token_budget * CHARS_PER_TOKEN]
+    return " ".join(sentences[index] for index in sorted(selected))
+
+
+def _fetch_digest(video_id: str) -> str:
+    try:
+        return make_digest(get_transcript(video_id))
+    except Exception as e:
+        logger.warning("Transkript von %s nicht verfügbar: %s", video_id, e)
+        return ""
+
+
+@traced("digest.combine_video_digests")
+def combine_video_digests(videos: list[Mapping[str, Any]]) -> list[str]:
+    """Formats videos with their transcript digest for recommendation prompts.
+
+    Each transcript is compressed with make_digest. Digests are kept in the
+    cache database across runs. Only videos that were not digested before,
+    e.g. new entries of the trending list, have their transcript loaded, so
+    a repeated recommendation only pays for what changed.
+
+    Args:
+        videos (list[Mapping[str, Any]]): Videos or dictionaries with at least
+                                          'video_id' and 'title'.
+
+    Returns:
+        list[str]: One entry per video with a transcript, in the order of
+            videos, in the format of combine_video_id_title_and_transcript.
+    """
+    titles = {
+        video["video_id"]: video.get("title") or ""
+        for video in videos
+        if video.get("video_id")
+    }
+    try:
+        digests = get_video_digests(list(titles), DIGEST_METHOD, EMPTY_DIGEST_TTL)
+    except sqlite3.Error as e:
+        logger.warning("Gespeicherte Digests nicht verfügbar: %s", e)
+        digests = {}
+    new_ids = [video_id for video_id in titles if video_id not in digests]
+
+    if new_ids:
+        num_threads = min(len(new_ids), multiprocessing.cpu_count() * 2)
+        with ThreadPoolExecutor(
+            max_workers=num_threads, initializer=continue_trace()
+        ) as executor:
+            new_digests = dict(zip(new_ids, executor.map(_fetch_digest, new_ids)))
+        try:
+            store_video_digests(new_digests, DIGEST_METHOD)
+        except sqlite3.Error as e:
+            logger.warning("Digests konnten nicht gespeichert werden: %s", e)
+        digests.update(new_digests)
+
+    set_attribute("video_count", len(titles))
+    set_attribute("new_videos", len(new_ids))
+    return [
+        f"Titel: {title}\nTranskript: {digests[video_id]}\nVideo-ID: {video_id}\n"
+        for video_id, title in titles.items()
+        if digests.get(video_id)
+    ]
@@ -0,0 +1,148 @@
+import re
+from typing import Iterable
+from xml.etree import ElementTree
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .cache_helper import get_feed_state, store_feed_state
+from .logging_helper import get_logger
+from .tracing_helper import set_attribute, span
+
+logger = get_logger(__name__)
+
+FEED_URL = "https://www.youtube.com/feeds/videos.xml?channel_id={channel_id}"
+REQUEST_TIMEOUT = 10
+# Feeds are read in small chunks, so parsing can stop after the first entries
+# without downloading the rest of the document.
+CHUNK_SIZE = 4096
+
+_ATOM = "{http://www.w3.org/2005/Atom}"
+_YT = "{http://www.youtube.com/xml/schemas/2015}"
+_WATCH_URL_PATTERN = re.compile(r"[?&]v=([a-zA-Z0-9_-]+)")
+
+# One session for all feeds keeps the connections to youtube.com alive. The
+# pool is sized for the thread pool of get_recent_videos_from_channels_RSS.
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_maxsize=32))
+
+
+def _entry_video_id(entry: ElementTree.Element) -> str | None:
+    """Returns the video ID of a feed entry, from <yt:videoId> or its watch link."""
+    video_id = entry.findtext(f"{_YT}videoId")
+    if video_id:
+        return video_id.strip()
+    link = entry.find(f"{_ATOM}link")
+    match = _WATCH_URL_PATTERN.search(link.get("href", "")) if link is not None else None
+    return match.group(1) if match else None
+
+
+def parse_feed_video_ids(
+    chunks: Iterable[bytes], max_videos: int
+) -> tuple[list[str], bool]:
+    """Reads the video IDs from a channel feed while it is being downloaded.
+
+    The feed is parsed incrementally. Parsing stops as soon as max_videos
+    entries have been read, the remaining chunks are not consumed.
+
+    Args:
+        chunks (Iterable[bytes]): The feed document in chunks, e.g.
+                                  response.iter_content().
+        max_videos (int): Number of entries to read.
+
+    Returns:
+        tuple[list[str], bool]: The video IDs in feed order (newest first) and
+            True if parsing stopped early, i.e. the feed may hold more entries.
+    """
+    parser = ElementTree.XMLPullParser(events=("end",))
+    video_ids: list[str] = []
+    if max_videos <= 0:
+        return video_ids, True
+
+    def read_entries() -> bool:
+        for _, element in parser.read_events():
+            if element.tag != f"{_ATOM}entry":
+                continue
+            video_id = _entry_video_id(element)
+            element.clear()
+            if video_id and video_id not in video_ids:
+                video_ids.append(video_id)
+                if len(video_ids) >= max_videos:
+                    return True
+        return False
+
+    for chunk in chunks:
+        parser.feed(chunk)
+        if read_entries():
+            return video_ids, True
+    parser.close()
+    return video_ids, read_entries()
+
+
+def fetch_channel_video_ids(
+    channel_id: str, max_videos: int = 1, db_path: str | None = None
+) -> list[str]:
+    """Returns the latest video IDs of a channel from its RSS feed.
+
+    The ETag and Last-Modified validators of the last response are stored per
+    channel and sent with the next request. If the feed has not changed, the
+    server answers 304 without a body and the stored IDs are returned. Stored
+    IDs are only reused if they cover max_videos; a request for more entries
+    than were parsed last time downloads the feed again.
+
+    Args:
+        channel_id (str): The YouTube channel ID.
+        max_videos (int, optional): Number of recent videos. Defaults to 1.
+        db_path (str | None, optional): Path to the cache database holding the
+                                        feed state. Defaults to CACHE_DB.
+
+    Returns:
+        list[str]: Up to max_videos video IDs, newest first.
+
+    Raises:
+        requests.RequestException: If the feed cannot be downloaded.
+    """
+    state = get_feed_state(channel_id, db_path)
+    usable = state is not None and (
+        not state["truncated"] or len(state["video_ids"]) >= max_videos
+    )
+
+    headers = {}
+    if usable:
+        if state["etag"]:
+            headers["If-None-Match"] = state["etag"]
+        if state["last_modified"]:
+            headers["If-Modified-Since"] = state["last_modified"]
+
+    with span("rss.fetch", channel_id=channel_id, conditional=bool(headers)):
+        response = _session.get(
+            FEED_URL.format(channel_id=channel_id),
+            headers=headers,
+            stream=True,
+            timeout=REQUEST_TIMEOUT,
+        )
+        try:
+            if response.status_code == 304 and usable:
+                set_attribute("not_modified", True)
+                logger.debug("Feed von Kanal %s unverändert.", channel_id)
+                return state["video_ids"][:max_videos]
+
+            response.raise_for_status()
+            video_ids, truncated = parse_feed_video_ids(
+                response.iter_content(CHUNK_SIZE), max_videos
+            )
+        finally:
+            # Closing drops the unread rest of the body instead of draining it.
+            response.close()
+        set_attribute("not_modified", False)
+        set_attribute("video_count", len(video_ids))
+
+    store_feed_state(
+        channel_id,
+        etag=response.headers.get("ETag"),
+        last_modified=response.headers.get("Last-Modified"),
+        video_ids=video_ids,
+        truncated=truncated,
+        db_path=db_path,
+    )
+    return video_ids
@@ -6,29 +6,57 @@ import concurrent.futures
 import multiprocessing
 import json
 from .youtube_helper import get_transcript
+from .cache_helper import disk_cache
+from .tracing_helper import continue_trace, set_attribute, traced
+from .logging_helper import get_logger
 from ..env_management.api_key_management import get_api_key
 import streamlit as st
 
 ################# Initialization ###############################
+logger = get_logger(__name__)
+
 api_key = get_api_key("TOKEN_GOOGLEAPI")
 
 if not api_key:
     raise ValueError("API Key nicht gefunden (leer oder nicht vorhanden).")
-else:
-    print("API Key erfolgreich geladen.")
 
 try:
-    print("Versuche Gemini Client zu erstellen...")
+    logger.debug("Versuche Gemini Client zu erstellen...")
     ai_client = genai.Client(api_key=api_key)
-    print("Client erfolgreich erstellt.")
 except Exception as e:
     raise RuntimeError(
         f"Fehler beim Erstellen des genai Clients mit gefundenem Key: {e}"
     ) from e
 else:
-    print("API_KEY gefunden")
+    logger.info("Gemini Client erfolgreich erstellt.")
+
+
+def reload_client(new_api_key: str) -> None:
+    """Replaces the Gemini client with one for a new API key.
+
+    Used by the settings hot reload, so a changed key is applied without
+    restarting the app.
+
+    Args:
+        new_api_key (str): The new Gemini API key.
+
+    Returns:
+        None
+
+    Raises:
+        RuntimeError: If the client cannot be created. The old client stays active.
+    """
+    global ai_client
+    try:
+        ai_client = genai.Client(api_key=new_api_key)
+    except Exception as e:
+        raise RuntimeError(f"Fehler beim Erstellen des genai Clients: {e}") from e
+
 
 ai_model = "gemini-2.0-flash"
+ai_embedding_model = "text-embedding-004"
+ai_embedding_batch_size = 100
+ai_cache_ttl = 7 * 24 * 3600
 ai_generate_content_config = genai.types.GenerateContentConfig(
     temperature=1,
     top_p=0.95,
@@ -48,6 +76,7 @@ ai_generate_content_config = genai.types.GenerateContentConfig(
 )
 
 
+@traced("gemini.get_short_summary_for_watch_list")
 def get_short_summary_for_watch_list(
     transcript: str, title: str, channel: str
 ) -> str | None:
@@ -82,6 +111,7 @@ def get_short_summary_for_watch_list(
         return transcript
 
 
+@traced("gemini.get_channel_recommendations")
 def get_channel_recommendations(
     history: Any,
     channels: Any,
@@ -116,7 +146,7 @@ def get_channel_recommendations(
             ),
         )
         if response.text:
-            print(response.text)
+            logger.debug("Kanalvorschläge: %s", response.text)
             return response.text.split(",")
         else:
             return "Fehler"
@@ -124,6 +154,14 @@ def get_channel_recommendations(
         return "Fehler"
 
 
+def _is_generated_text(text: str | None) -> bool:
+    """Returns True for real model output, False for empty results and error messages."""
+    return bool(text) and text not in ("no response", "no transcript") and not (
+        text.startswith("Fehler")
+    )
+
+
+@traced("gemini.get_summary_without_spoiler")
 def get_summary_without_spoiler(transcript: str, title: str) -> str | None:
     """Generates a non-spoiler summary of a YouTube video transcript using Gemini.
 
@@ -155,6 +193,13 @@ def get_summary_without_spoiler(transcript: str, title: str) -> str | None:
         return f"Fehler beim Erzeugen der Zusammenfassung: {e}"
 
 
+@disk_cache(
+    "gemini_summary",
+    ttl=ai_cache_ttl,
+    api_key_env="TOKEN_GOOGLEAPI",
+    should_cache=_is_generated_text,
+)
+@traced("gemini.get_summary")
 def get_summary(spoiler: bool, transcript: str, title: str) -> str | None:
     """Generates a summary of a YouTube video transcript using Gemini.
 
@@ -168,9 +213,8 @@ def get_summary(spoiler: bool, transcript: str, title: str) -> str | None:
         str | None: The generated summary and clickbait analysis text,
                        or None if the API call yields no text or an error occurs.
     """
-    print(spoiler)
+    logger.debug("Zusammenfassung für '%s', Spoiler: %s", title, spoiler)
     if spoiler == False:
-        print("summary_withourt_spoiler")
         return get_summary_without_spoiler(transcript, title)
     if spoiler == True:
         try:
@@ -192,6 +236,7 @@ def get_summary(spoiler: bool, transcript: str, title: str) -> str | None:
             return f"Fehler beim Erzeugen der Zusammenfassung: {e}"
 
 
+@traced("gemini.get_recommendation")
 def get_recommendation(
     video_ids_titles_and_transcripts: list[str],
     interests: str | None = None,
@@ -208,8 +253,10 @@ def get_recommendation(
                                                       title, transcript, and video ID
                                                       for a single video.
         interests (str | None, optional): User interests to guide selection. Defaults to None.
-        todays_free_time (float | None, optional): User's available time (currently unused
-                                                     in the prompt). Defaults to None.
+        todays_free_time (float | None, optional): Not used in the prompt. Fitting
+                                                   videos into the free time is done
+                                                   locally by plan_watch_list.
+                                                   Defaults to None.
         subscriptions (DataFrame | None, optional): User's subscriptions data (currently unused
                                                         in the prompt). Defaults to None.
 
@@ -234,7 +281,7 @@ def get_recommendation(
         contents=prompt,
     )
 
-    print(f"\n{response.text}\n")
+    logger.debug("Empfehlung: %s", response.text)
 
     if response.text:
         return response.text
@@ -259,6 +306,7 @@ def get_transcript_safe(video_id: str) -> str:
         return f"Fehler beim Abrufen des Transkripts: {e}"
 
 
+@traced("youtube.combine_video_id_title_and_transcript")
 def combine_video_id_title_and_transcript(
     videos: list[dict[str, Any]],
 ) -> list[str]:
@@ -284,7 +332,9 @@ def combine_video_id_title_and_transcript(
         video["video_id"]: video["title"] for video in videos if "video_id" in video
     }
 
-    with concurrent.futures.ThreadPoolExecutor(max_workers=num_threads) as executor:
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=num_threads, initializer=continue_trace()
+    ) as executor:
         future_to_video_id = {
             executor.submit(get_transcript_safe, video_id): video_id
             for video_id in video_map
@@ -300,6 +350,7 @@ def combine_video_id_title_and_transcript(
                     f"Titel: {title}\nTranskript: {transcript}\nVideo-ID: {video_id}\n"
                 )
 
+    set_attribute("video_count", num_videos)
     return video_id_title_and_transcript
 
 
@@ -353,6 +404,13 @@ def extract_video_id_and_reason(
         return None
 
 
+@disk_cache(
+    "gemini_clickbait",
+    ttl=ai_cache_ttl,
+    api_key_env="TOKEN_GOOGLEAPI",
+    should_cache=_is_generated_text,
+)
+@traced("gemini.check_for_clickbait")
 def check_for_clickbait(transcript: str, title: str) -> str:
     """Analyzes a video transcript and title for clickbait elements using Gemini.
 
@@ -401,6 +459,7 @@ def live_conversation() -> str:
     return response.text
 
 
+@traced("gemini.get_subscriptions_based_on_interests")
 def get_subscriptions_based_on_interests(
     subscriptions: str, interests: str, number_of_channels: int
 ) -> str | None:
@@ -444,5 +503,40 @@ def get_subscriptions_based_on_interests(
         return f"Fehler beim Erzeugen der Empfehlung: {e}"
 
 
+@traced("gemini.get_embeddings")
+def get_embeddings(
+    texts: list[str], task_type: str = "RETRIEVAL_DOCUMENT"
+) -> list[list[float]] | None:
+    """Computes text embeddings with the Gemini embedding model.
+
+    Texts are sent in batches of ai_embedding_batch_size, the maximum the
+    batch endpoint accepts.
+
+    Args:
+        texts (list[str]): The texts to embed.
+        task_type (str, optional): Gemini task type, "RETRIEVAL_DOCUMENT" for
+                                   indexed texts and "RETRIEVAL_QUERY" for
+                                   search input. Defaults to "RETRIEVAL_DOCUMENT".
+
+    Returns:
+        list[list[float]] | None: One embedding per input text in the same order,
+                                  or None if an API call fails.
+    """
+    embeddings: list[list[float]] = []
+    try:
+        for start in range(0, len(texts), ai_embedding_batch_size):
+            response = ai_client.models.embed_content(
+                model=ai_embedding_model,
+                contents=texts[start : start + ai_embedding_batch_size],
+                config=genai.types.EmbedContentConfig(task_type=task_type),
+            )
+            embeddings.extend(embedding.values for embedding in response.embeddings)
+    except Exception as e:
+        logger.warning("Fehler beim Erzeugen der Embeddings: %s", e)
+        return None
+
+    return embeddings
+
+
 if __name__ == "__main__":
     pass
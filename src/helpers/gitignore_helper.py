@@ -0,0 +1,90 @@
+import os
+import threading
+from typing import Iterable
+
+from .user_helper import gitignore_entry
+
+GITIGNORE = ".gitignore"
+
+# Data files written by the app. Modules register the files they own, the
+# dashboard makes sure all of them are ignored once at startup.
+MANAGED_FILES: list[str] = []
+
+_lock = threading.Lock()
+# Entries known to be in each .gitignore, read at most once per process.
+_known_entries: dict[str, set[str]] = {}
+
+
+def register_data_files(*entries: str) -> None:
+    """Adds files or patterns to the registry of managed data files.
+
+    Args:
+        *entries (str): File names or .gitignore patterns, e.g. "cache.db*".
+
+    Returns:
+        None
+    """
+    with _lock:
+        for entry in entries:
+            entry = gitignore_entry(entry)
+            if entry not in MANAGED_FILES:
+                MANAGED_FILES.append(entry)
+
+
+def _read_entries(gitignore_path: str) -> set[str]:
+    with open(gitignore_path, "r", encoding="utf-8") as gitignore_file:
+        return {line.strip() for line in gitignore_file.readlines()}
+
+
+def ensure_gitignored(
+    entries: Iterable[str] | None = None, gitignore_path: str = GITIGNORE
+) -> list[str]:
+    """Makes sure that data files are listed in a .gitignore file.
+
+    The .gitignore is read only on the first call per process and path.
+    Later calls for entries that are already known cost no file access.
+    Missing entries are appended in one write; the file is created if it
+    does not exist.
+
+    Args:
+        entries (Iterable[str] | None, optional): Files or patterns. Defaults
+                                                  to all MANAGED_FILES.
+        gitignore_path (str, optional): Path to the .gitignore file.
+                                        Defaults to GITIGNORE.
+
+    Returns:
+        list[str]: The entries that were added.
+    """
+    with _lock:
+        if entries is None:
+            entries = list(MANAGED_FILES)
+        wanted = list(dict.fromkeys(gitignore_entry(entry) for entry in entries))
+        key = os.path.abspath(gitignore_path)
+        known = _known_entries.get(key)
+        if known is not None and all(entry in known for entry in wanted):
+            return []
+
+        exists = os.path.isfile(gitignore_path)
+        if known is None:
+            known = _known_entries[key] = (
+                _read_entries(gitignore_path) if exists else set()
+            )
+        missing = [entry for entry in wanted if entry not in known]
+        if not missing:
+            return []
+
+        lines = "\n".join(missing)
+        if exists:
+            with open(gitignore_path, "a", encoding="utf-8") as gitignore_file:
+                gitignore_file.write(f"\n{lines}\n")
+        else:
+            with open(gitignore_path, "w", encoding="utf-8") as gitignore_file:
+                gitignore_file.write(f"{lines}\n")
+        known.update(missing)
+    return missing
+
+
+def reset_gitignore_cache() -> None:
+    """Forgets the cached .gitignore contents, e.g. after editing them by hand."""
+    with _lock:
+        _known_entries.clear()
@@ -0,0 +1,160 @@
+import multiprocessing
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+from .cache_helper import (
+    get_ingested_video_ids,
+    get_ingested_videos,
+    store_ingested_videos,
+)
+from .feed_helper import fetch_channel_video_ids
+from .logging_helper import get_logger
+from .tracing_helper import continue_trace, set_attribute, span
+from .video_helper import Video, sort_by_upload_date
+from .youtube_helper import get_transcript, get_video_data_dlp
+
+logger = get_logger(__name__)
+
+DEFAULT_INTERVAL_MINUTES = 30
+DEFAULT_MAX_VIDEOS = 10
+# Stored results are used as long as the worker has checked the channel
+# within this many intervals. Afterwards the Abos tab fetches live again.
+STALE_AFTER_INTERVALS = 3
+
+
+@dataclass(slots=True)
+class IngestStats:
+    """Counters of one ingestion cycle."""
+
+    channels: int = 0
+    failed_channels: int = 0
+    new_videos: int = 0
+    transcripts: int = 0
+
+
+def ingest_interval_s() -> int:
+    """Returns the ingestion interval from INGEST_INTERVAL_MINUTES in seconds."""
+    try:
+        minutes = int(os.getenv("INGEST_INTERVAL_MINUTES", DEFAULT_INTERVAL_MINUTES))
+    except ValueError:
+        minutes = DEFAULT_INTERVAL_MINUTES
+    return max(1, minutes) * 60
+
+
+def ingest_max_videos() -> int:
+    """Returns the number of videos kept per channel from INGEST_MAX_VIDEOS."""
+    try:
+        return max(1, int(os.getenv("INGEST_MAX_VIDEOS", DEFAULT_MAX_VIDEOS)))
+    except ValueError:
+        return DEFAULT_MAX_VIDEOS
+
+
+def ingest_channel(
+    channel_id: str,
+    max_videos: int,
+    fetch_transcripts: bool = True,
+    db_path: str | None = None,
+) -> IngestStats:
+    """Polls one channel feed and stores its new videos.
+
+    Only videos that are not stored yet are enriched with yt-dlp metadata and,
+    optionally, have their transcript fetched into the local search index.
+
+    Args:
+        channel_id (str): The YouTube channel ID.
+        max_videos (int): Number of recent videos to poll and keep.
+        fetch_transcripts (bool, optional): Pre-fetch transcripts of new videos.
+                                            Defaults to True.
+        db_path (str | None, optional): Path to the cache database. Defaults to CACHE_DB.
+
+    Returns:
+        IngestStats: The counters for this channel.
+    """
+    stats = IngestStats(channels=1)
+    video_ids = fetch_channel_video_ids(channel_id, max_videos, db_path=db_path)
+    known = get_ingested_video_ids(channel_id, db_path)
+
+    new_videos: list[Video] = []
+    for video_id in video_ids:
+        if video_id in known:
+            continue
+        video = get_video_data_dlp(video_id)
+        if video is None:
+            continue
+        new_videos.append(video)
+        if fetch_transcripts and get_transcript(video_id):
+            stats.transcripts += 1
+
+    store_ingested_videos(channel_id, new_videos, keep=max_videos, db_path=db_path)
+    stats.new_videos = len(new_videos)
+    return stats
+
+
+def ingest_channels(
+    channel_ids: list[str],
+    max_videos: int | None = None,
+    fetch_transcripts: bool = True,
+    db_path: str | None = None,
+) -> IngestStats:
+    """Runs one ingestion cycle over the given channels in parallel.
+
+    A failing channel is logged and skipped, the others are still ingested.
+
+    Args:
+        channel_ids (list[str]): The subscribed channel IDs.
+        max_videos (int | None, optional): Videos per channel. Defaults to
+                                           INGEST_MAX_VIDEOS from the .env file.
+        fetch_transcripts (bool, optional): Pre-fetch transcripts of new videos.
+                                            Defaults to True.
+        db_path (str | None, optional): Path to the cache database. Defaults to CACHE_DB.
+
+    Returns:
+        IngestStats: The summed counters of the cycle.
+    """
+    max_videos = max_videos or ingest_max_videos()
+    total = IngestStats()
+    if not channel_ids:
+        return total
+
+    def run(channel_id: str) -> IngestStats:
+        try:
+            return ingest_channel(channel_id, max_videos, fetch_transcripts, db_path)
+        except Exception as e:
+            logger.warning("Kanal %s konnte nicht geladen werden: %s", channel_id, e)
+            return IngestStats(channels=1, failed_channels=1)
+
+    num_threads = min(len(channel_ids), multiprocessing.cpu_count() * 2)
+    with span("ingest.cycle", channel_count=len(channel_ids)):
+        with ThreadPoolExecutor(
+            max_workers=num_threads, initializer=continue_trace()
+        ) as executor:
+            for stats in executor.map(run, channel_ids):
+                total.channels += stats.channels
+                total.failed_channels += stats.failed_channels
+                total.new_videos += stats.new_videos
+                total.transcripts += stats.transcripts
+        set_attribute("new_videos", total.new_videos)
+    return total
+
+
+def load_ingested_videos(
+    channel_ids: list[str], max_videos: int, db_path: str | None = None
+) -> tuple[list[Video], list[str]]:
+    """Reads the precomputed subscription videos written by the ingestion worker.
+
+    Args:
+        channel_ids (list[str]): The channel IDs to show.
+        max_videos (int): Maximum number of videos per channel.
+        db_path (str | None, optional): Path to the cache database. Defaults to CACHE_DB.
+
+    Returns:
+        tuple[list[Video], list[str]]: The stored videos sorted by upload date
+            (descending) and the channel IDs without recent results, which
+            still have to be fetched live.
+    """
+    max_age = ingest_interval_s() * STALE_AFTER_INTERVALS
+    stored = get_ingested_videos(channel_ids, max_videos, max_age, db_path)
+    videos = [video for channel_videos in stored.values() for video in channel_videos]
+    missing = [channel_id for channel_id in channel_ids if channel_id not in stored]
+    return sort_by_upload_date(videos), missing
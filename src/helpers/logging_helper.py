@@ -0,0 +1,117 @@
+import logging
+import os
+import threading
+from collections import defaultdict
+
+LOGGER_NAME = "src"
+DEFAULT_LEVEL = "WARNING"
+DEFAULT_FORMAT = "%(asctime)s %(levelname)-8s %(name)s: %(message)s"
+DEFAULT_SAMPLE_EVERY = 10
+
+_configure_lock = threading.Lock()
+_configured = False
+_sample_lock = threading.Lock()
+_sample_counts: defaultdict[str, int] = defaultdict(int)
+
+
+class _PackageHandler(logging.StreamHandler):
+    """Marks the handler installed by configure_logging, so it is replaced on reconfigure."""
+
+
+def _level_from_env() -> int:
+    level_name = os.getenv("LOG_LEVEL", DEFAULT_LEVEL).strip().upper()
+    level = logging.getLevelName(level_name)
+    return level if isinstance(level, int) else logging.getLevelName(DEFAULT_LEVEL)
+
+
+def _sample_every_from_env() -> int:
+    try:
+        return max(1, int(os.getenv("LOG_SAMPLE_EVERY", DEFAULT_SAMPLE_EVERY)))
+    except ValueError:
+        return DEFAULT_SAMPLE_EVERY
+
+
+def configure_logging(force: bool = False) -> logging.Logger:
+    """Configures the package logger from the .env file.
+
+    LOG_LEVEL sets the level (DEBUG, INFO, WARNING, ERROR). Defaults to
+    WARNING, so debug payloads are neither formatted nor written in normal
+    runs. LOG_FORMAT overrides the record format. Messages go to stderr and
+    do not propagate to the root logger, which Streamlit configures itself.
+
+    Args:
+        force (bool, optional): Re-reads the settings even if the logger is
+                                already configured. Defaults to False.
+
+    Returns:
+        logging.Logger: The package logger.
+    """
+    global _configured
+    logger = logging.getLogger(LOGGER_NAME)
+    with _configure_lock:
+        if _configured and not force:
+            return logger
+
+        for handler in [h for h in logger.handlers if isinstance(h, _PackageHandler)]:
+            logger.removeHandler(handler)
+        handler = _PackageHandler()
+        handler.setFormatter(logging.Formatter(os.getenv("LOG_FORMAT", DEFAULT_FORMAT)))
+        logger.addHandler(handler)
+        logger.setLevel(_level_from_env())
+        logger.propagate = False
+        _configured = True
+    return logger
+
+
+def get_logger(name: str) -> logging.Logger:
+    """Returns the logger for a module of the package.
+
+    Args:
+        name (str): The module name, usually __name__.
+
+    Returns:
+        logging.Logger: The logger, configured from the .env file on first use.
+    """
+    configure_logging()
+    return logging.getLogger(name)
+
+
+def log_sampled(
+    logger: logging.Logger,
+    level: int,
+    key: str,
+    message: str,
+    *args: object,
+    every: int | None = None,
+) -> None:
+    """Logs only every n-th occurrence of a message from a hot loop.
+
+    The first occurrence is always logged. If the level is disabled, the
+    call returns before counting or formatting anything.
+
+    Args:
+        logger (logging.Logger): The logger to write to.
+        level (int): The log level, e.g. logging.DEBUG.
+        key (str): Identifies the call site whose occurrences are counted.
+        message (str): The %-style message template.
+        *args (object): Arguments for the template, formatted lazily.
+        every (int | None, optional): Sampling interval. Defaults to
+                                      LOG_SAMPLE_EVERY from the .env file.
+
+    Returns:
+        None
+    """
+    if not logger.isEnabledFor(level):
+        return
+    every = every or _sample_every_from_env()
+    with _sample_lock:
+        count = _sample_counts[key]
+        _sample_counts[key] = count + 1
+    if count % every == 0:
+        logger.log(level, message, *args, extra={"sample_count": count + 1})
+
+
+def reset_sampling() -> None:
+    """Resets the occurrence counters of log_sampled."""
+    with _sample_lock:
+        _sample_counts.clear()
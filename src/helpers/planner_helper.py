@@ -0,0 +1,114 @@
+import numpy as np
+
+# Durations are planned in whole minutes. A 3 hour budget is 180 capacity
+# steps, so the dynamic program stays small even for long lists.
+DEFAULT_RESOLUTION_S = 60
+# Above this many cells (videos x capacity steps) the greedy plan is used.
+MAX_DP_CELLS = 5_000_000
+
+
+def _greedy_plan(weights: np.ndarray, values: np.ndarray, capacity: int) -> np.ndarray:
+    """Picks videos by value per minute until the budget is used up."""
+    order = np.lexsort((-values, -(values / weights)))
+    fits = np.cumsum(weights[order]) <= capacity
+    # Videos after the first one that does not fit may still fit on their own.
+    chosen = list(order[fits])
+    remaining = capacity - int(weights[chosen].sum())
+    for index in order[~fits]:
+        if weights[index] <= remaining:
+            chosen.append(index)
+            remaining -= int(weights[index])
+    return np.sort(np.asarray(chosen, dtype=np.intp))
+
+
+def _knapsack_plan(weights: np.ndarray, values: np.ndarray, capacity: int) -> np.ndarray:
+    """Solves the 0/1 knapsack exactly, vectorised over the capacity axis."""
+    best = np.zeros(capacity + 1)
+    taken = np.zeros((len(weights), capacity + 1), dtype=bool)
+
+    for index, (weight, value) in enumerate(zip(weights, values)):
+        if weight > capacity:
+            continue
+        candidate = best[: capacity + 1 - weight] + value
+        improves = candidate > best[weight:]
+        taken[index, weight:] = improves
+        best[weight:] = np.where(improves, candidate, best[weight:])
+
+    chosen = []
+    remaining = capacity
+    for index in range(len(weights) - 1, -1, -1):
+        if taken[index, remaining]:
+            chosen.append(index)
+            remaining -= int(weights[index])
+    return np.asarray(sorted(chosen), dtype=np.intp)
+
+
+def plan_watch_time(
+    durations_s: np.ndarray,
+    scores: np.ndarray,
+    free_time_s: int,
+    resolution_s: int = DEFAULT_RESOLUTION_S,
+) -> np.ndarray:
+    """Selects the set of videos with the highest total score that fits the free time.
+
+    Solves a 0/1 knapsack over the video durations with a dynamic program
+    over the free time, rounded up to resolution_s. Very large inputs fall
+    back to a greedy plan by score per minute. Videos without a known
+    duration (0 seconds) and videos with a score of 0 or less are never
+    planned.
+
+    Args:
+        durations_s (np.ndarray): Duration of every video in seconds.
+        scores (np.ndarray): Score of every video, higher is better.
+        free_time_s (int): The available time in seconds.
+        resolution_s (int, optional): Planning step in seconds.
+                                      Defaults to DEFAULT_RESOLUTION_S.
+
+    Returns:
+        np.ndarray: The indices of the selected videos, in ascending order.
+    """
+    durations_s = np.asarray(durations_s, dtype=np.int64)
+    scores = np.asarray(scores, dtype=np.float64)
+    capacity = int(free_time_s) // resolution_s
+
+    candidates = np.flatnonzero((durations_s > 0) & (scores > 0))
+    if capacity <= 0 or candidates.size == 0:
+        return np.empty(0, dtype=np.intp)
+
+    # Rounding up keeps the plan within the free time.
+    weights = -(-durations_s[candidates] // resolution_s)
+    values = scores[candidates]
+
+    if candidates.size * (capacity + 1) > MAX_DP_CELLS:
+        chosen = _greedy_plan(weights, values, capacity)
+    else:
+        chosen = _knapsack_plan(weights, values, capacity)
+    return candidates[chosen]
+
+
+def interest_values(
+    scores: np.ndarray | list[float] | None, count: int, floor: float = 0.05
+) -> np.ndarray:
+    """Turns interest similarities into positive knapsack values.
+
+    Similarities are rescaled to [floor, 1 + floor], so the best match is
+    worth about twenty times the worst one and every video stays plannable.
+    Without scores every video is worth the same and the plan fits in as
+    many videos as possible.
+
+    Args:
+        scores (np.ndarray | list[float] | None): Similarity per video, e.g.
+                                    from score_videos_by_interests, or None.
+        count (int): Number of videos.
+        floor (float, optional): Value of the worst match. Defaults to 0.05.
+
+    Returns:
+        np.ndarray: One positive value per video.
+    """
+    if scores is None or len(scores) == 0:
+        return np.ones(count)
+    scores = np.asarray(scores, dtype=np.float64)
+    spread = scores.max() - scores.min()
+    if spread == 0:
+        return np.ones(count)
+    return floor + (scores - scores.min()) / spread
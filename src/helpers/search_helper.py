@@ -0,0 +1,161 @@
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from googleapiclient.discovery import Resource
+
+from .cache_helper import disk_cache
+from .logging_helper import get_logger
+from .tracing_helper import continue_trace, set_attribute, traced
+from .video_frame_helper import VIDEO_PAGE_SIZE
+from .video_helper import Video
+from .youtube_helper import search_videos_dlp_range, search_videos_page
+
+logger = get_logger(__name__)
+
+SEARCH_PAGE_SIZE = VIDEO_PAGE_SIZE
+SEARCH_PAGE_TTL = 3600
+# yt-dlp cannot extract more than 1000 search results.
+DLP_MAX_RESULTS = 1000
+
+# Background loads of the next page while the user looks at the current one.
+_prefetch_executor = ThreadPoolExecutor(max_workers=2)
+_pending_prefetches: dict[tuple[str, str, int], Future] = {}
+_pending_prefetches_lock = threading.Lock()
+
+
+@dataclass(slots=True)
+class SearchPage:
+    """One page of search results.
+
+    Attributes:
+        videos (list[Video]): The videos of the page; place is their position
+                              in the whole result list.
+        page (int): The page number, starting at 1.
+        has_more (bool): Whether a next page can be loaded.
+    """
+
+    videos: list[Video]
+    page: int
+    has_more: bool
+
+
+def _has_page(result: dict[str, Any]) -> bool:
+    return bool(result["videos"])
+
+
+@disk_cache(
+    "search_page_api",
+    ttl=SEARCH_PAGE_TTL,
+    api_key_env="YOUTUBE_API_KEY",
+    should_cache=_has_page,
+)
+def _load_page_api(youtube: Resource, query: str, page: int) -> dict[str, Any]:
+    """Loads an API result page, following the cached tokens of the pages before it."""
+    page_token = None
+    if page > 1:
+        page_token = _load_page_api(youtube, query, page - 1)["next_page_token"]
+        if not page_token:
+            return {"videos": [], "next_page_token": None}
+    videos, next_page_token = search_videos_page(
+        youtube, query, max_results=SEARCH_PAGE_SIZE, page_token=page_token
+    )
+    offset = (page - 1) * SEARCH_PAGE_SIZE
+    for index, video in enumerate(videos, start=1):
+        video.place = offset + index
+    return {"videos": videos, "next_page_token": next_page_token}
+
+
+@disk_cache("search_page_dlp", ttl=SEARCH_PAGE_TTL, should_cache=_has_page)
+def _load_page_dlp(query: str, page: int) -> dict[str, Any]:
+    """Loads a yt-dlp result page as a slice of the search result list."""
+    start = (page - 1) * SEARCH_PAGE_SIZE + 1
+    end = min(page * SEARCH_PAGE_SIZE, DLP_MAX_RESULTS)
+    videos = search_videos_dlp_range(query, start, end)
+    has_more = len(videos) == end - start + 1 and end < DLP_MAX_RESULTS
+    return {"videos": videos, "next_page_token": str(page + 1) if has_more else None}
+
+
+@traced("search.load_page")
+def load_search_page(
+    query: str, page: int = 1, youtube: Resource | None = None
+) -> SearchPage:
+    """Loads one page of search results.
+
+    Pages are cached by query and page number, and a page that is being
+    prefetched is not loaded a second time. With the YouTube API every page
+    needs the continuation token of the page before it; these tokens are
+    taken from the cached pages, so loading page n only costs one request
+    when pages 1 to n - 1 were shown before. With yt-dlp a page is a slice
+    of the result list.
+
+    Args:
+        query (str): The search term.
+        page (int, optional): The page number, starting at 1. Defaults to 1.
+        youtube (Resource | None, optional): The YouTube API client. Without a
+                                             client yt-dlp is used. Defaults to None.
+
+    Returns:
+        SearchPage: The page. Its video list is empty after the last page.
+
+    Raises:
+        googleapiclient.errors.HttpError: If an API call fails.
+    """
+    set_attribute("page", page)
+    if youtube is None:
+        result = _load_page_dlp(query, page)
+    else:
+        result = _load_page_api(youtube, query, page)
+    set_attribute("video_count", len(result["videos"]))
+    return SearchPage(
+        videos=result["videos"],
+        page=page,
+        has_more=bool(result["next_page_token"]),
+    )
+
+
+def prefetch_search_page(
+    query: str, page: int, youtube: Resource | None = None
+) -> Future:
+    """Loads a search page in the background, e.g. the page after the shown one.
+
+    The page lands in the cache, so a later load_search_page returns at once.
+    A prefetch that is already running for the same page is reused.
+
+    Args:
+        query (str): The search term.
+        page (int): The page number, starting at 1.
+        youtube (Resource | None, optional): The YouTube API client. Defaults to None (yt-dlp).
+
+    Returns:
+        Future: Resolves to the SearchPage, or to None if loading failed.
+    """
+    key = ("dlp" if youtube is None else "api", query, page)
+    with _pending_prefetches_lock:
+        future = _pending_prefetches.get(key)
+        if future is not None:
+            return future
+        future = _prefetch_executor.submit(
+            _prefetch, key, query, page, youtube, continue_trace()
+        )
+        _pending_prefetches[key] = future
+    return future
+
+
+def _prefetch(
+    key: tuple[str, str, int],
+    query: str,
+    page: int,
+    youtube: Resource | None,
+    attach_trace: Callable[[], None],
+) -> SearchPage | None:
+    attach_trace()
+    try:
+        return load_search_page(query, page, youtube)
+    except Exception as e:
+        logger.warning("Suchseite %d für '%s' nicht vorgeladen: %s", page, query, e)
+        return None
+    finally:
+        with _pending_prefetches_lock:
+            _pending_prefetches.pop(key, None)
@@ -0,0 +1,270 @@
+import re
+import sqlite3
+import time
+from contextlib import closing
+from datetime import datetime
+from typing import Any, Iterable
+
+from .gitignore_helper import register_data_files
+from .video_helper import (
+    DEFAULT_CHANNEL,
+    DEFAULT_TITLE,
+    NO_TAGS,
+    Video,
+    parse_count,
+    parse_length,
+    parse_upload_date,
+)
+
+INDEX_DB = "search_index.db"
+register_data_files(f"{INDEX_DB}*")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS videos (
+    rowid INTEGER PRIMARY KEY,
+    video_id TEXT NOT NULL UNIQUE,
+    title TEXT NOT NULL DEFAULT '',
+    channel_name TEXT NOT NULL DEFAULT '',
+    tags TEXT NOT NULL DEFAULT '',
+    transcript TEXT NOT NULL DEFAULT '',
+    thumbnail TEXT NOT NULL DEFAULT '',
+    length TEXT NOT NULL DEFAULT '',
+    views TEXT NOT NULL DEFAULT '',
+    upload_date TEXT NOT NULL DEFAULT '',
+    indexed_at REAL NOT NULL DEFAULT 0
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS videos_fts USING fts5(
+    title, channel_name, tags, transcript,
+    content='videos', content_rowid='rowid',
+    tokenize='unicode61 remove_diacritics 2'
+);
+CREATE TRIGGER IF NOT EXISTS videos_ai AFTER INSERT ON videos BEGIN
+    INSERT INTO videos_fts(rowid, title, channel_name, tags, transcript)
+    VALUES (new.rowid, new.title, new.channel_name, new.tags, new.transcript);
+END;
+CREATE TRIGGER IF NOT EXISTS videos_ad AFTER DELETE ON videos BEGIN
+    INSERT INTO videos_fts(videos_fts, rowid, title, channel_name, tags, transcript)
+    VALUES ('delete', old.rowid, old.title, old.channel_name, old.tags, old.transcript);
+END;
+CREATE TRIGGER IF NOT EXISTS videos_au AFTER UPDATE ON videos BEGIN
+    INSERT INTO videos_fts(videos_fts, rowid, title, channel_name, tags, transcript)
+    VALUES ('delete', old.rowid, old.title, old.channel_name, old.tags, old.transcript);
+    INSERT INTO videos_fts(rowid, title, channel_name, tags, transcript)
+    VALUES (new.rowid, new.title, new.channel_name, new.tags, new.transcript);
+END;
+"""
+
+# Non-empty values replace stored ones, empty values keep what is already indexed.
+# That way a transcript-only update does not wipe the metadata and vice versa.
+_UPSERT = """
+INSERT INTO videos (
+    video_id, title, channel_name, tags, transcript,
+    thumbnail, length, views, upload_date, indexed_at
+)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(video_id) DO UPDATE SET
+    title = CASE WHEN excluded.title != '' THEN excluded.title ELSE title END,
+    channel_name = CASE WHEN excluded.channel_name != ''
+        THEN excluded.channel_name ELSE channel_name END,
+    tags = CASE WHEN excluded.tags != '' THEN excluded.tags ELSE tags END,
+    transcript = CASE WHEN excluded.transcript != ''
+        THEN excluded.transcript ELSE transcript END,
+    thumbnail = CASE WHEN excluded.thumbnail != ''
+        THEN excluded.thumbnail ELSE thumbnail END,
+    length = CASE WHEN excluded.length != '' THEN excluded.length ELSE length END,
+    views = CASE WHEN excluded.views != '' THEN excluded.views ELSE views END,
+    upload_date = CASE WHEN excluded.upload_date != ''
+        THEN excluded.upload_date ELSE upload_date END,
+    indexed_at = excluded.indexed_at
+"""
+
+_initialized_paths: set[str] = set()
+
+
+def _connect(db_path: str | None = None) -> sqlite3.Connection:
+    """Opens a connection to the local search index and creates the schema once.
+
+    A new connection is opened per call so the index can be used from the
+    worker threads that fetch transcripts concurrently.
+
+    Args:
+        db_path (str | None, optional): Path to the SQLite database file.
+                                        Defaults to INDEX_DB.
+
+    Returns:
+        sqlite3.Connection: An open connection to the index database.
+    """
+    path = db_path or INDEX_DB
+    connection = sqlite3.connect(path, timeout=5)
+    if path not in _initialized_paths:
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.executescript(_SCHEMA)
+        _initialized_paths.add(path)
+    return connection
+
+
+def _to_text(value: Any) -> str:
+    """Converts a metadata value into the text representation stored in the index."""
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def _video_to_row(video: dict[str, Any], transcript: str = "") -> tuple:
+    """Maps a video dictionary onto the column order used by _UPSERT."""
+    tags = video.get("tags", "")
+    if tags == "Keine Tags":
+        tags = ""
+    return (
+        video["video_id"],
+        _to_text(video.get("title")),
+        _to_text(video.get("channel_name")),
+        _to_text(tags),
+        transcript or "",
+        _to_text(video.get("thumbnail")),
+        _to_text(video.get("length")),
+        _to_text(video.get("views")),
+        _to_text(video.get("upload_date")),
+        time.time(),
+    )
+
+
+def index_videos(
+    videos: Iterable[dict[str, Any]], db_path: str | None = None
+) -> int:
+    """Adds or updates the metadata of several videos in the local search index.
+
+    All rows are written in a single transaction. Videos without a
+    'video_id' are skipped.
+
+    Args:
+        videos (Iterable[dict[str, Any]]): Video dictionaries as returned by the
+                                           youtube_helper functions or read from
+                                           the watch list CSV files.
+        db_path (str | None, optional): Path to the index database. Defaults to INDEX_DB.
+
+    Returns:
+        int: The number of indexed videos.
+    """
+    rows = [_video_to_row(video) for video in videos if video.get("video_id")]
+    if not rows:
+        return 0
+
+    with closing(_connect(db_path)) as connection, connection:
+        connection.executemany(_UPSERT, rows)
+    return len(rows)
+
+
+def index_transcript(
+    video_id: str, transcript: str, db_path: str | None = None
+) -> None:
+    """Stores the transcript of a video in the local search index.
+
+    Args:
+        video_id (str): The unique identifier of the YouTube video.
+        transcript (str): The transcript text. Empty transcripts are ignored.
+        db_path (str | None, optional): Path to the index database. Defaults to INDEX_DB.
+
+    Returns:
+        None
+    """
+    if not transcript:
+        return
+
+    with closing(_connect(db_path)) as connection, connection:
+        connection.execute(
+            _UPSERT, _video_to_row({"video_id": video_id}, transcript=transcript)
+        )
+
+
+def get_indexed_transcript(video_id: str, db_path: str | None = None) -> str:
+    """Returns the transcript of a video from the local search index.
+
+    Args:
+        video_id (str): The unique identifier of the YouTube video.
+        db_path (str | None, optional): Path to the index database. Defaults to INDEX_DB.
+
+    Returns:
+        str: The cached transcript, or an empty string if none is indexed.
+    """
+    with closing(_connect(db_path)) as connection:
+        row = connection.execute(
+            "SELECT transcript FROM videos WHERE video_id = ?", (video_id,)
+        ).fetchone()
+    return row[0] if row else ""
+
+
+def _build_match_query(query: str) -> str:
+    """Turns free user input into a safe FTS5 MATCH expression.
+
+    Every word becomes a quoted prefix term, so special FTS5 syntax typed by
+    the user cannot break the query. All terms have to match.
+
+    Args:
+        query (str): The raw search input.
+
+    Returns:
+        str: The MATCH expression, or an empty string if the input has no words.
+    """
+    terms = re.findall(r"\w+", query, flags=re.UNICODE)
+    return " ".join(f'"{term}"*' for term in terms)
+
+
+def search_local_index(
+    query: str, max_results: int = 50, db_path: str | None = None
+) -> list[Video]:
+    """Searches the local index over titles, tags, channel names and transcripts.
+
+    Runs entirely on the local SQLite FTS5 index, so no network request or
+    API quota is used. Results are ranked by BM25 with matches in the title
+    weighted highest.
+
+    Args:
+        query (str): The search term.
+        max_results (int, optional): Maximum number of results. Defaults to 50.
+        db_path (str | None, optional): Path to the index database. Defaults to INDEX_DB.
+
+    Returns:
+        list[Video]: The matching videos, best match first. Returns an empty
+                     list if nothing matches.
+    """
+    match_query = _build_match_query(query)
+    if not match_query:
+        return []
+
+    with closing(_connect(db_path)) as connection:
+        rows = connection.execute(
+            """
+            SELECT v.video_id, v.title, v.channel_name, v.tags, v.thumbnail,
+                   v.length, v.views, v.upload_date
+            FROM videos_fts
+            JOIN videos AS v ON v.rowid = videos_fts.rowid
+            WHERE videos_fts MATCH ?
+            ORDER BY bm25(videos_fts, 10.0, 5.0, 3.0, 1.0)
+            LIMIT ?
+            """,
+            (match_query, max_results),
+        ).fetchall()
+
+    videos = []
+    for index, row in enumerate(rows, start=1):
+        video_id, title, channel_name, tags, thumbnail, length, views, upload_date = (
+            row
+        )
+        videos.append(
+            Video(
+                video_id=video_id,
+                title=title or DEFAULT_TITLE,
+                channel_name=channel_name or DEFAULT_CHANNEL,
+                duration_s=parse_length(length),
+                views=parse_count(views),
+                upload_date=parse_upload_date(upload_date),
+                thumbnail=thumbnail or "",
+                tags=tags or NO_TAGS,
+                place=index,
+            )
+        )
+
+    return videos
@@ -0,0 +1,347 @@
+import atexit
+import csv
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import Future
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Mapping, Sequence
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+from .gitignore_helper import register_data_files
+from .logging_helper import get_logger
+
+logger = get_logger(__name__)
+
+LOCK_SUFFIX = ".lock"
+register_data_files(f"*.csv{LOCK_SUFFIX}")
+# Windows has no blocking lock with timeout, it is polled instead.
+_LOCK_POLL_S = 0.01
+
+Row = Sequence[Any] | Mapping[str, Any]
+
+# Threads of one process are serialized here, other processes by the lock file.
+_thread_locks_lock = threading.Lock()
+_thread_locks: dict[str, threading.RLock] = {}
+_local = threading.local()
+
+
+def _thread_lock(path: str) -> threading.RLock:
+    with _thread_locks_lock:
+        return _thread_locks.setdefault(os.path.abspath(path), threading.RLock())
+
+
+def _held_locks() -> dict[str, int]:
+    """Returns the nesting depth of the file locks held by the current thread."""
+    if not hasattr(_local, "held"):
+        _local.held = {}
+    return _local.held
+
+
+def _lock_fd(fd: int, shared: bool) -> None:
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+        return
+    while True:
+        try:
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+            return
+        except OSError:
+            time.sleep(_LOCK_POLL_S)
+
+
+def _unlock_fd(fd: int) -> None:
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+    else:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+
+@contextmanager
+def file_lock(path: str, shared: bool = False) -> Iterator[None]:
+    """Holds an advisory lock for a data file, across threads and processes.
+
+    The lock is taken on a sidecar file (path + LOCK_SUFFIX), because
+    atomic_write replaces the data file itself. Locks are reentrant within
+    a thread. On Windows, shared locks are exclusive.
+
+    Args:
+        path (str): The data file to lock.
+        shared (bool, optional): Take a shared (read) lock. Defaults to False.
+
+    Yields:
+        None
+    """
+    key = os.path.abspath(path)
+    held = _held_locks()
+    with _thread_lock(path):
+        # A nested lock must not lock the file again: flock on a second
+        # descriptor would wait for the lock this thread already holds.
+        if held.get(key):
+            held[key] += 1
+            try:
+                yield
+            finally:
+                held[key] -= 1
+            return
+
+        fd = os.open(path + LOCK_SUFFIX, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            _lock_fd(fd, shared)
+            held[key] = 1
+            try:
+                yield
+            finally:
+                held[key] = 0
+                _unlock_fd(fd)
+        finally:
+            os.close(fd)
+
+
+@contextmanager
+def atomic_write(path: str, encoding: str = "utf-8") -> Iterator[Any]:
+    """Writes a file completely or not at all.
+
+    The content goes to a temporary file in the same directory, which then
+    replaces the target with os.replace. Readers see either the old or the
+    new file, never a partial one. On errors the target is left unchanged.
+
+    Args:
+        path (str): The file to write.
+        encoding (str, optional): Text encoding. Defaults to "utf-8".
+
+    Yields:
+        Any: The open temporary text file (newline="", ready for csv).
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(
+        prefix=f".{os.path.basename(path)}.", suffix=".tmp", dir=directory
+    )
+    try:
+        with os.fdopen(fd, "w", newline="", encoding=encoding) as file:
+            yield file
+            file.flush()
+            os.fsync(file.fileno())
+        if os.path.exists(path):
+            os.chmod(temp_path, os.stat(path).st_mode)
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _as_list(row: Row, header: Sequence[str]) -> list[Any]:
+    if isinstance(row, Mapping):
+        return [row.get(field, "") for field in header]
+    return list(row)
+
+
+def _append_unlocked(path: str, header: Sequence[str], rows: list[Row]) -> None:
+    """Appends rows, writing the header first if the file is new or empty."""
+    with open(path, mode="a", newline="", encoding="utf-8") as file:
+        writer = csv.writer(file)
+        if file.tell() == 0:
+            writer.writerow(header)
+        writer.writerows(_as_list(row, header) for row in rows)
+        file.flush()
+        os.fsync(file.fileno())
+
+
+class _GroupCommit:
+    """Collects concurrent appends to a file and writes them in one batch.
+
+    The first caller for a file becomes the committer: it takes the file
+    lock once and writes its rows together with all rows queued meanwhile.
+    Every caller returns only after its own rows have been written.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._pending: dict[str, list[tuple[Sequence[str], list[Row], Future]]] = {}
+        self._committing: set[str] = set()
+
+    def append(self, path: str, header: Sequence[str], rows: list[Row]) -> None:
+        key = os.path.abspath(path)
+        future: Future = Future()
+        with self._lock:
+            self._pending.setdefault(key, []).append((header, rows, future))
+            leader = key not in self._committing
+            if leader:
+                self._committing.add(key)
+
+        if leader:
+            self._commit(path, key)
+        future.result()
+
+    def _commit(self, path: str, key: str) -> None:
+        while True:
+            with self._lock:
+                batch = self._pending.pop(key, [])
+                if not batch:
+                    self._committing.discard(key)
+                    return
+            try:
+                with file_lock(path):
+                    header = batch[0][0]
+                    _append_unlocked(
+                        path, header, [row for _, rows, _ in batch for row in rows]
+                    )
+            except Exception as e:
+                for _, _, future in batch:
+                    future.set_exception(e)
+            else:
+                if len(batch) > 1:
+                    logger.debug("%d Schreibvorgänge in %s gebündelt.", len(batch), path)
+                for _, _, future in batch:
+                    future.set_result(None)
+
+
+_group_commit = _GroupCommit()
+
+
+def append_csv_rows(path: str, header: Sequence[str], rows: list[Row]) -> None:
+    """Appends rows to a CSV file, safe for concurrent sessions.
+
+    Appends of concurrent callers are grouped into one locked write. The
+    header is written if the file does not exist yet or is empty.
+
+    Args:
+        path (str): The CSV file.
+        header (Sequence[str]): The column names.
+        rows (list[Row]): Rows as sequences in header order or as mappings.
+
+    Returns:
+        None
+    """
+    if rows:
+        _group_commit.append(path, header, rows)
+
+
+def append_new_csv_rows(
+    path: str,
+    header: Sequence[str],
+    rows: list[Sequence[Any]],
+) -> list[Sequence[Any]]:
+    """Appends only the rows that are not in the CSV file yet.
+
+    Reading the existing rows and appending happen under one lock, so two
+    sessions cannot add the same row twice.
+
+    Args:
+        path (str): The CSV file.
+        header (Sequence[str]): The column names, written to a new file.
+        rows (list[Sequence[Any]]): Candidate rows in header order.
+
+    Returns:
+        list[Sequence[Any]]: The rows that were appended.
+    """
+    with file_lock(path):
+        existing = set()
+        if os.path.exists(path):
+            with open(path, mode="r", newline="", encoding="utf-8") as file:
+                reader = csv.reader(file)
+                next(reader, None)
+                existing = {tuple(row) for row in reader}
+
+        new_rows = []
+        for row in rows:
+            if tuple(row) not in existing:
+                existing.add(tuple(row))
+                new_rows.append(row)
+        if new_rows:
+            _append_unlocked(path, header, new_rows)
+    return new_rows
+
+
+def rewrite_csv(
+    path: str,
+    fieldnames: Sequence[str],
+    transform: Callable[[list[dict[str, str]]], list[Mapping[str, Any]]],
+) -> None:
+    """Rewrites a CSV file atomically under the file lock.
+
+    Args:
+        path (str): The CSV file.
+        fieldnames (Sequence[str]): The columns of the rewritten file.
+        transform (Callable): Receives the current rows as dictionaries and
+                              returns the rows to keep or write.
+
+    Returns:
+        None
+    """
+    with file_lock(path):
+        rows: list[dict[str, str]] = []
+        if os.path.exists(path):
+            with open(path, mode="r", newline="", encoding="utf-8") as file:
+                rows = list(csv.DictReader(file))
+
+        with atomic_write(path) as file:
+            writer = csv.DictWriter(file, fieldnames=fieldnames, extrasaction="ignore")
+            writer.writeheader()
+            writer.writerows(transform(rows))
+
+
+class DebouncedWriter:
+    """Writes text files only after their content has stopped changing.
+
+    Every schedule call replaces the pending content of a file and restarts
+    its timer. The file is written once, delay seconds after the last
+    change, atomically and under the file lock. Pending writes are flushed
+    when the process exits.
+
+    Args:
+        delay (float): Seconds without changes before a file is written.
+    """
+
+    def __init__(self, delay: float) -> None:
+        self.delay = delay
+        self._lock = threading.Lock()
+        self._pending: dict[str, tuple[str, threading.Timer]] = {}
+        atexit.register(self.flush)
+
+    def schedule(self, path: str, content: str) -> None:
+        """Sets the content a file will be written with."""
+        timer = threading.Timer(self.delay, self._write, args=(path,))
+        timer.daemon = True
+        with self._lock:
+            previous = self._pending.get(path)
+            if previous is not None:
+                previous[1].cancel()
+            self._pending[path] = (content, timer)
+        timer.start()
+
+    def pending(self, path: str) -> str | None:
+        """Returns the content waiting to be written to a file, if any."""
+        with self._lock:
+            entry = self._pending.get(path)
+        return entry[0] if entry else None
+
+    def flush(self) -> None:
+        """Writes all pending files now."""
+        with self._lock:
+            paths = list(self._pending)
+        for path in paths:
+            self._write(path)
+
+    def _write(self, path: str) -> None:
+        with self._lock:
+            entry = self._pending.pop(path, None)
+        if entry is None:
+            return
+        content, timer = entry
+        timer.cancel()
+        try:
+            with file_lock(path), atomic_write(path) as file:
+                file.write(content)
+        except OSError as e:
+            logger.error("%s konnte nicht gespeichert werden: %s", path, e)
@@ -0,0 +1,288 @@
+import contextvars
+import functools
+import json
+import os
+import secrets
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator
+
+import requests
+
+from .logging_helper import get_logger
+
+logger = get_logger(__name__)
+
+SERVICE_NAME = "youtube-fy-dashboard"
+MAX_RECENT_TRACES = 50
+
+# OTLP status codes.
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+
+class Span:
+    """A timed operation with attributes, compatible with the OpenTelemetry span model."""
+
+    __slots__ = (
+        "name",
+        "trace_id",
+        "span_id",
+        "parent_id",
+        "start_ns",
+        "end_ns",
+        "attributes",
+        "status_code",
+        "status_message",
+    )
+
+    def __init__(self, name: str, parent: "Span | None", attributes: dict[str, Any]):
+        self.name = name
+        self.trace_id = parent.trace_id if parent else secrets.token_hex(16)
+        self.span_id = secrets.token_hex(8)
+        self.parent_id = parent.span_id if parent else None
+        self.start_ns = time.time_ns()
+        self.end_ns: int | None = None
+        self.attributes = dict(attributes)
+        self.status_code = STATUS_OK
+        self.status_message = ""
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    @property
+    def duration_ms(self) -> float:
+        end_ns = self.end_ns if self.end_ns is not None else time.time_ns()
+        return (end_ns - self.start_ns) / 1e6
+
+    def to_otlp(self) -> dict[str, Any]:
+        """Returns the span in the OTLP/JSON encoding."""
+        span = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": 1,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns or self.start_ns),
+            "attributes": [_otlp_attribute(k, v) for k, v in self.attributes.items()],
+            "status": {"code": self.status_code, "message": self.status_message},
+        }
+        if self.parent_id:
+            span["parentSpanId"] = self.parent_id
+        return span
+
+
+def _otlp_attribute(key: str, value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {"key": key, "value": {"boolValue": value}}
+    if isinstance(value, int):
+        return {"key": key, "value": {"intValue": str(value)}}
+    if isinstance(value, float):
+        return {"key": key, "value": {"doubleValue": value}}
+    return {"key": key, "value": {"stringValue": str(value)}}
+
+
+_current_span: contextvars.ContextVar[Span | None] = contextvars.ContextVar(
+    "current_span", default=None
+)
+_lock = threading.Lock()
+# Spans of the traces whose root span is still running. A trace is added
+# when its root span starts and removed when the root span finishes.
+_open_traces: dict[str, list[Span]] = {}
+_recent_traces: deque[list[Span]] = deque(maxlen=MAX_RECENT_TRACES)
+_export_executor = ThreadPoolExecutor(max_workers=1)
+
+
+def tracing_enabled() -> bool:
+    """Tracing is on unless TRACING is set to 0, false or off in the .env file."""
+    return os.getenv("TRACING", "1").strip().lower() not in ("0", "false", "off")
+
+
+def _start(span: Span) -> None:
+    """Opens the trace of a root span, so its children can be collected."""
+    if span.parent_id is None:
+        with _lock:
+            _open_traces[span.trace_id] = []
+
+
+def _finish(span: Span) -> None:
+    """Collects a finished span and exports its trace once the root span ends.
+
+    Child spans that end after their root, e.g. in background threads
+    started with continue_trace(), are added to the trace in the recent
+    traces (if it is still there) and exported on their own. They never
+    reopen the trace, so no spans are kept after the root has finished.
+    """
+    with _lock:
+        spans = _open_traces.get(span.trace_id)
+        if spans is None:
+            finished_spans = [span]
+            for index, trace in enumerate(_recent_traces):
+                if trace and trace[0].trace_id == span.trace_id:
+                    _recent_traces[index] = [*trace, span]
+                    break
+        elif span.parent_id is not None:
+            spans.append(span)
+            return
+        else:
+            spans.append(span)
+            finished_spans = _open_traces.pop(span.trace_id)
+            _recent_traces.append(finished_spans)
+
+    if os.getenv("TRACE_EXPORT_FILE") or os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT"):
+        _export_executor.submit(export_spans, finished_spans)
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Span | None]:
+    """Measures a block of code as a span of the current trace.
+
+    Spans opened inside the block become children of this span. A span
+    without a parent starts a new trace. Exceptions mark the span as failed
+    and are re-raised. Streamlit's rerun/stop signals derive from
+    BaseException and end the span without an error.
+
+    Args:
+        name (str): Name of the operation, e.g. "youtube.videos.list".
+        **attributes (Any): Attributes such as video_count or quota_units.
+
+    Yields:
+        Span | None: The span, to add attributes while it runs. None if
+                     tracing is disabled.
+    """
+    if not tracing_enabled():
+        yield None
+        return
+
+    current = Span(name, _current_span.get(), attributes)
+    _start(current)
+    token = _current_span.set(current)
+    try:
+        yield current
+    except Exception as e:
+        current.status_code = STATUS_ERROR
+        current.status_message = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        current.end_ns = time.time_ns()
+        _current_span.reset(token)
+        _finish(current)
+
+
+def traced(name: str | None = None, **attributes: Any) -> Callable:
+    """Decorator that runs every call of a function inside a span.
+
+    Args:
+        name (str | None, optional): Span name. Defaults to the function name.
+        **attributes (Any): Static attributes of the span.
+
+    Returns:
+        Callable: The decorator.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with span(span_name, **attributes):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def set_attribute(key: str, value: Any) -> None:
+    """Adds an attribute to the current span, if there is one."""
+    current = _current_span.get()
+    if current is not None:
+        current.set_attribute(key, value)
+
+
+def continue_trace() -> Callable[[], None]:
+    """Returns a thread initializer that attaches worker threads to the current span.
+
+    ThreadPoolExecutor does not carry the current span into its threads.
+    Passing initializer=continue_trace() keeps spans opened in the workers
+    as children of the span that created the executor.
+
+    Returns:
+        Callable[[], None]: The initializer for ThreadPoolExecutor.
+    """
+    parent = _current_span.get()
+
+    def initializer() -> None:
+        _current_span.set(parent)
+
+    return initializer
+
+
+def to_otlp_payload(spans: list[Span]) -> dict[str, Any]:
+    """Wraps spans in an OTLP/JSON ExportTraceServiceRequest."""
+    return {
+        "resourceSpans": [
+            {
+                "resource": {
+                    "attributes": [_otlp_attribute("service.name", SERVICE_NAME)]
+                },
+                "scopeSpans": [
+                    {
+                        "scope": {"name": __name__},
+                        "spans": [span.to_otlp() for span in spans],
+                    }
+                ],
+            }
+        ]
+    }
+
+
+def export_spans(spans: list[Span]) -> None:
+    """Exports spans to the configured file and/or OTLP/HTTP collector.
+
+    TRACE_EXPORT_FILE appends one OTLP/JSON request per line, the format read
+    by the OpenTelemetry Collector's otlpjsonfile receiver.
+    OTEL_EXPORTER_OTLP_ENDPOINT sends the same payload to <endpoint>/v1/traces.
+    Export errors are logged and never raised.
+
+    Args:
+        spans (list[Span]): The finished spans of one trace, or a single
+                            child span that finished after its root.
+
+    Returns:
+        None
+    """
+    payload = to_otlp_payload(spans)
+
+    export_file = os.getenv("TRACE_EXPORT_FILE")
+    if export_file:
+        try:
+            with open(export_file, "a", encoding="utf-8") as file:
+                file.write(json.dumps(payload) + "\n")
+        except OSError as e:
+            logger.warning("Traces konnten nicht gespeichert werden: %s", e)
+
+    endpoint = os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT")
+    if endpoint:
+        try:
+            requests.post(
+                endpoint.rstrip("/") + "/v1/traces", json=payload, timeout=2
+            ).raise_for_status()
+        except requests.RequestException as e:
+            logger.warning("Traces konnten nicht an den Collector gesendet werden: %s", e)
+
+
+def get_recent_traces() -> list[list[Span]]:
+    """Returns the latest finished traces, newest first. Each trace is a list of spans."""
+    with _lock:
+        return list(reversed(_recent_traces))
+
+
+def clear_traces() -> None:
+    """Drops all collected traces."""
+    with _lock:
+        _recent_traces.clear()
+        _open_traces.clear()
@@ -0,0 +1,158 @@
+import os
+import time
+
+from googleapiclient.discovery import Resource
+
+from .cache_helper import (
+    get_latest_trending_snapshot,
+    single_flight,
+    store_trending_snapshot,
+)
+from .logging_helper import get_logger
+from .tracing_helper import set_attribute, span
+from .video_helper import Video
+from .youtube_helper import get_trending_videos, get_trending_videos_dlp
+
+logger = get_logger(__name__)
+
+DEFAULT_REGIONS = ("DE", "US", "GB")
+DEFAULT_INTERVAL_MINUTES = 30
+# Older snapshots are kept for a day at the default interval.
+SNAPSHOTS_KEPT = 48
+
+SOURCE_API = "api"
+SOURCE_DLP = "dlp"
+
+
+def trending_regions() -> tuple[str, ...]:
+    """Returns the regions to keep warm from TRENDING_REGIONS, e.g. "DE,US,GB"."""
+    regions = [
+        region.strip().upper()
+        for region in os.getenv("TRENDING_REGIONS", "").split(",")
+        if len(region.strip()) == 2 and region.strip().isalpha()
+    ]
+    return tuple(dict.fromkeys(regions)) or DEFAULT_REGIONS
+
+
+def trending_interval_s() -> int:
+    """Returns the snapshot interval from TRENDING_INTERVAL_MINUTES in seconds."""
+    try:
+        minutes = int(os.getenv("TRENDING_INTERVAL_MINUTES", DEFAULT_INTERVAL_MINUTES))
+    except ValueError:
+        minutes = DEFAULT_INTERVAL_MINUTES
+    return max(1, minutes) * 60
+
+
+def refresh_trending_snapshot(
+    region_code: str, youtube: Resource | None = None, db_path: str | None = None
+) -> list[Video]:
+    """Fetches the trending videos of a region and stores them as a new snapshot.
+
+    Concurrent refreshes of the same region and source share one fetch.
+    Empty results are not stored, so a failed scrape never replaces the
+    last good snapshot.
+
+    Args:
+        region_code (str): The ISO 3166-1 alpha-2 country code.
+        youtube (Resource | None, optional): The YouTube API client. Without a
+                                             client the videos are fetched
+                                             with yt-dlp. Defaults to None.
+        db_path (str | None, optional): Path to the cache database. Defaults to CACHE_DB.
+
+    Returns:
+        list[Video]: The fetched videos.
+    """
+    source = SOURCE_DLP if youtube is None else SOURCE_API
+
+    def fetch() -> list[Video]:
+        with span("trending.refresh", region=region_code, source=source):
+            if youtube is None:
+                videos = get_trending_videos_dlp(region_code)
+            else:
+                videos = get_trending_videos(youtube, region_code)
+            set_attribute("video_count", len(videos))
+        if videos:
+            store_trending_snapshot(
+                region_code, source, videos, keep=SNAPSHOTS_KEPT, db_path=db_path
+            )
+        return videos
+
+    return single_flight(f"trending:{source}:{region_code}", fetch)
+
+
+def load_trending_videos(
+    region_code: str, youtube: Resource | None = None, db_path: str | None = None
+) -> list[Video]:
+    """Returns the trending videos of a region from the latest snapshot.
+
+    The snapshot is shared by all users. It is refreshed here only if the
+    ingestion worker has not done so within the snapshot interval. If the
+    refresh fails, the last snapshot is shown regardless of its age.
+
+    Args:
+        region_code (str): The ISO 3166-1 alpha-2 country code.
+        youtube (Resource | None, optional): The YouTube API client for the
+                                             "YouTube API" search method.
+                                             Defaults to None (yt-dlp).
+        db_path (str | None, optional): Path to the cache database. Defaults to CACHE_DB.
+
+    Returns:
+        list[Video]: The trending videos. Empty if no snapshot could be loaded.
+    """
+    source = SOURCE_DLP if youtube is None else SOURCE_API
+    latest = get_latest_trending_snapshot(region_code, source, db_path)
+    if latest is not None and time.time() - latest[1] < trending_interval_s():
+        set_attribute("trending_snapshot_age_s", round(time.time() - latest[1]))
+        return latest[0]
+
+    try:
+        videos = refresh_trending_snapshot(region_code, youtube, db_path)
+    except Exception as e:
+        logger.warning("Trends für %s konnten nicht geladen werden: %s", region_code, e)
+        videos = []
+    if not videos and latest is not None:
+        logger.info("Zeige den letzten Trend-Snapshot für %s.", region_code)
+        return latest[0]
+    return videos
+
+
+def refresh_trending_regions(
+    regions: tuple[str, ...] | None = None,
+    youtube: Resource | None = None,
+    db_path: str | None = None,
+) -> int:
+    """Refreshes the trending snapshots of all regions that are due.
+
+    Called by the ingestion worker, so users find fresh snapshots. yt-dlp
+    snapshots are always refreshed, API snapshots only if a client is given.
+
+    Args:
+        regions (tuple[str, ...] | None, optional): The regions. Defaults to
+                                                    TRENDING_REGIONS from the .env file.
+        youtube (Resource | None, optional): The YouTube API client. Defaults to None.
+        db_path (str | None, optional): Path to the cache database. Defaults to CACHE_DB.
+
+    Returns:
+        int: The number of snapshots that were refreshed.
+    """
+    clients = [None] if youtube is None else [None, youtube]
+    # Refresh slightly early, so a snapshot never expires between two cycles.
+    max_age = trending_interval_s() * 0.9
+    refreshed = 0
+    for region_code in regions or trending_regions():
+        for client in clients:
+            source = SOURCE_DLP if client is None else SOURCE_API
+            latest = get_latest_trending_snapshot(region_code, source, db_path)
+            if latest is not None and time.time() - latest[1] < max_age:
+                continue
+            try:
+                if refresh_trending_snapshot(region_code, client, db_path):
+                    refreshed += 1
+            except Exception as e:
+                logger.warning(
+                    "Trends für %s (%s) konnten nicht geladen werden: %s",
+                    region_code,
+                    source,
+                    e,
+                )
+    return refreshed
@@ -0,0 +1,132 @@
+import glob
+import hashlib
+import os
+import re
+
+import streamlit as st
+
+from .logging_helper import get_logger
+
+logger = get_logger(__name__)
+
+# The user of a single-user installation keeps the files in the working
+# directory, where they have always been.
+DEFAULT_USER = "default"
+USER_DATA_DIR = "user_data"
+# The cached subscription list, kept per user like the other state files.
+SUBSCRIPTIONS_FILE = "subscriptions.csv"
+USER_QUERY_PARAM = "user"
+
+_USER_ID_PATTERN = re.compile(r"^[A-Za-z0-9_-]{1,64}$")
+
+
+def user_id_from_identity(identity: str) -> str:
+    """Derives a stable directory name from a login identity such as an e-mail address.
+
+    Args:
+        identity (str): The identity reported by the login provider.
+
+    Returns:
+        str: A short hash, so the identity itself never appears in paths.
+    """
+    return hashlib.sha256(identity.strip().lower().encode("utf-8")).hexdigest()[:16]
+
+
+def _resolve_user_id() -> str:
+    """Determines the user of the current Streamlit session.
+
+    Logged-in users (st.login) are identified by their account. Without a
+    login, a "?user=<name>" query parameter selects the namespace, which
+    separates users of a shared server but does not authenticate them.
+    """
+    try:
+        user = st.user
+        if getattr(user, "is_logged_in", False) is True:
+            identity = user.get("email") or user.get("sub")
+            if identity:
+                return user_id_from_identity(str(identity))
+    except Exception as e:
+        logger.debug("Login-Informationen nicht verfügbar: %s", e)
+
+    try:
+        requested = st.query_params.get(USER_QUERY_PARAM)
+    except Exception as e:
+        logger.debug("Query-Parameter nicht verfügbar: %s", e)
+        requested = None
+    if isinstance(requested, str) and _USER_ID_PATTERN.match(requested):
+        return requested
+    return DEFAULT_USER
+
+
+def get_user_id() -> str:
+    """Returns the user of the current session, resolved once per session.
+
+    Returns:
+        str: The user ID, DEFAULT_USER for single-user installations.
+    """
+    try:
+        user_id = st.session_state.get("user_id")
+    except Exception:
+        user_id = None
+    if isinstance(user_id, str) and user_id:
+        return user_id
+
+    user_id = _resolve_user_id()
+    try:
+        st.session_state["user_id"] = user_id
+    except Exception:
+        pass
+    return user_id
+
+
+def user_path(filename: str, user_id: str | None = None) -> str:
+    """Returns the path of a personal state file of a user.
+
+    Personal state (watch list, history, interests, feedback, subscriptions)
+    lives in USER_DATA_DIR/<user_id>/. The default user keeps the given path,
+    so existing single-user installations find their files unchanged.
+
+    Args:
+        filename (str): The file, e.g. "watch_later.csv".
+        user_id (str | None, optional): The user. Defaults to the user of the
+                                        current session.
+
+    Returns:
+        str: The path of the file. The user directory is created if needed.
+    """
+    user_id = user_id or get_user_id()
+    if user_id == DEFAULT_USER:
+        return filename
+    directory = os.path.join(USER_DATA_DIR, user_id)
+    os.makedirs(directory, exist_ok=True)
+    return os.path.join(directory, os.path.basename(filename))
+
+
+def all_user_paths(filename: str) -> list[str]:
+    """Returns the existing copies of a state file of all users.
+
+    Used for server-wide changes, e.g. a new channel ID makes the cached
+    subscription lists of every user stale.
+
+    Args:
+        filename (str): The file, e.g. "subscriptions.csv".
+
+    Returns:
+        list[str]: The file of the default user (if it exists) followed by
+            the files of the named users in USER_DATA_DIR.
+    """
+    paths = [filename] if os.path.isfile(filename) else []
+    pattern = os.path.join(USER_DATA_DIR, "*", os.path.basename(filename))
+    return paths + sorted(path for path in glob.glob(pattern) if os.path.isfile(path))
+
+
+def gitignore_entry(path: str) -> str:
+    """Returns the .gitignore entry that covers a state file.
+
+    Files of named users are covered by a single entry for USER_DATA_DIR
+    instead of one line per user and file.
+    """
+    parts = os.path.normpath(path).split(os.sep)
+    if parts[0] == USER_DATA_DIR:
+        return f"{USER_DATA_DIR}/"
+    return path
@@ -0,0 +1,243 @@
+import hashlib
+import os
+from typing import Callable, Iterable
+
+import numpy as np
+
+from .gitignore_helper import register_data_files
+from .logging_helper import get_logger
+
+logger = get_logger(__name__)
+
+CHANNEL_EMBEDDINGS_FILE = "channel_embeddings.npz"
+VIDEO_EMBEDDINGS_FILE = "video_embeddings.npz"
+register_data_files(CHANNEL_EMBEDDINGS_FILE, VIDEO_EMBEDDINGS_FILE)
+
+
+def _fingerprint(text: str) -> str:
+    """Returns a short hash used to detect changed source texts."""
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()[:16]
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    """Scales each row to unit length so dot products equal cosine similarity."""
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+class VectorIndex:
+    """An in-memory matrix of unit-length embeddings addressed by string keys.
+
+    Rows are stored in one contiguous float32 matrix, so similarity queries
+    for many query vectors against all entries are a single matrix product.
+    Each entry remembers a fingerprint of the text it was computed from, so
+    embeddings are only recomputed when the text changes.
+    """
+
+    def __init__(self) -> None:
+        self.keys: list[str] = []
+        self.fingerprints: list[str] = []
+        self.matrix: np.ndarray = np.zeros((0, 0), dtype=np.float32)
+        self._positions: dict[str, int] = {}
+        self.dirty = False
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._positions
+
+    def stale_keys(self, texts: dict[str, str]) -> list[str]:
+        """Returns the keys whose text is not indexed yet or has changed.
+
+        Args:
+            texts (dict[str, str]): Mapping of key to the text that should be embedded.
+
+        Returns:
+            list[str]: Keys that need a (new) embedding.
+        """
+        stale = []
+        for key, text in texts.items():
+            position = self._positions.get(key)
+            if position is None or self.fingerprints[position] != _fingerprint(text):
+                stale.append(key)
+        return stale
+
+    def upsert(
+        self, keys: list[str], texts: list[str], vectors: Iterable[Iterable[float]]
+    ) -> None:
+        """Adds new embeddings or replaces existing ones.
+
+        Args:
+            keys (list[str]): Keys of the entries.
+            texts (list[str]): Source texts, used for the change fingerprint.
+            vectors (Iterable[Iterable[float]]): One embedding per key.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If the embedding dimension does not match the index.
+        """
+        new_rows = _normalize(np.asarray(list(vectors), dtype=np.float32))
+        if len(new_rows) == 0:
+            return
+        if len(self.keys) and new_rows.shape[1] != self.matrix.shape[1]:
+            raise ValueError(
+                f"Embedding-Dimension {new_rows.shape[1]} passt nicht zum Index "
+                f"({self.matrix.shape[1]})."
+            )
+
+        append_keys, append_fingerprints, append_rows = [], [], []
+        for key, text, row in zip(keys, texts, new_rows):
+            position = self._positions.get(key)
+            if position is None:
+                append_keys.append(key)
+                append_fingerprints.append(_fingerprint(text))
+                append_rows.append(row)
+            else:
+                self.matrix[position] = row
+                self.fingerprints[position] = _fingerprint(text)
+
+        if append_rows:
+            stacked = np.vstack(append_rows)
+            self.matrix = (
+                np.vstack([self.matrix, stacked]) if len(self.keys) else stacked
+            )
+            for key, fingerprint in zip(append_keys, append_fingerprints):
+                self._positions[key] = len(self.keys)
+                self.keys.append(key)
+                self.fingerprints.append(fingerprint)
+
+        self.dirty = True
+
+    def similarities(
+        self, query_vectors: Iterable[Iterable[float]], keys: Iterable[str] | None = None
+    ) -> tuple[list[str], np.ndarray]:
+        """Computes cosine similarities for a batch of query vectors.
+
+        Args:
+            query_vectors (Iterable[Iterable[float]]): One or more query embeddings.
+            keys (Iterable[str] | None, optional): Restricts the comparison to these
+                                                   keys. Unknown keys are skipped.
+                                                   Defaults to all entries.
+
+        Returns:
+            tuple[list[str], np.ndarray]: The compared keys and a matrix of shape
+                                          (number of queries, number of keys).
+        """
+        queries = _normalize(np.asarray(list(query_vectors), dtype=np.float32))
+        if keys is None:
+            selected_keys = list(self.keys)
+            matrix = self.matrix
+        else:
+            selected_keys = [key for key in keys if key in self._positions]
+            matrix = self.matrix[[self._positions[key] for key in selected_keys]]
+
+        if not selected_keys:
+            return [], np.zeros((len(queries), 0), dtype=np.float32)
+        return selected_keys, queries @ matrix.T
+
+    def top_k(
+        self,
+        query_vectors: Iterable[Iterable[float]],
+        k: int,
+        keys: Iterable[str] | None = None,
+    ) -> list[tuple[str, float]]:
+        """Returns the k entries most similar to any of the query vectors.
+
+        Every entry is scored with its best similarity over all queries, so a
+        channel only has to match one of several interests.
+
+        Args:
+            query_vectors (Iterable[Iterable[float]]): One or more query embeddings.
+            k (int): Number of results.
+            keys (Iterable[str] | None, optional): Restricts the search to these keys.
+                                                   Defaults to all entries.
+
+        Returns:
+            list[tuple[str, float]]: (key, score) pairs sorted by descending score.
+        """
+        selected_keys, scores = self.similarities(query_vectors, keys)
+        if not selected_keys or k <= 0:
+            return []
+
+        best_scores = scores.max(axis=0)
+        k = min(k, len(selected_keys))
+        candidates = np.argpartition(-best_scores, k - 1)[:k]
+        ordered = candidates[np.argsort(-best_scores[candidates], kind="stable")]
+        return [(selected_keys[i], float(best_scores[i])) for i in ordered]
+
+    def save(self, path: str) -> None:
+        """Writes the index to a compressed NumPy archive.
+
+        Args:
+            path (str): Target .npz file.
+
+        Returns:
+            None
+        """
+        np.savez_compressed(
+            path,
+            keys=np.asarray(self.keys, dtype=str),
+            fingerprints=np.asarray(self.fingerprints, dtype=str),
+            matrix=self.matrix,
+        )
+        self.dirty = False
+
+    @classmethod
+    def load(cls, path: str) -> "VectorIndex":
+        """Loads an index written by save(). Returns an empty index if unavailable.
+
+        Args:
+            path (str): Path to the .npz file.
+
+        Returns:
+            VectorIndex: The loaded index.
+        """
+        index = cls()
+        if not os.path.exists(path):
+            return index
+
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                index.keys = data["keys"].tolist()
+                index.fingerprints = data["fingerprints"].tolist()
+                index.matrix = data["matrix"].astype(np.float32)
+        except (OSError, KeyError, ValueError) as e:
+            logger.warning("Vektorindex %s konnte nicht geladen werden: %s", path, e)
+            return cls()
+
+        index._positions = {key: i for i, key in enumerate(index.keys)}
+        return index
+
+
+def update_vector_index(
+    index: VectorIndex,
+    texts: dict[str, str],
+    embed: Callable[[list[str]], list[list[float]] | None],
+) -> bool:
+    """Embeds all texts that are missing or changed in the index.
+
+    Args:
+        index (VectorIndex): The index to update in place.
+        texts (dict[str, str]): Mapping of key to source text.
+        embed (Callable[[list[str]], list[list[float]] | None]): Function that
+            returns one embedding per text, or None on failure.
+
+    Returns:
+        bool: True if the index covers all texts afterwards, False if the
+              embedding function failed.
+    """
+    stale = index.stale_keys(texts)
+    if not stale:
+        return True
+
+    stale_texts = [texts[key] for key in stale]
+    vectors = embed(stale_texts)
+    if vectors is None or len(vectors) != len(stale):
+        return False
+
+    index.upsert(stale, stale_texts, vectors)
+    return True
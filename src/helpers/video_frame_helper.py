@@ -0,0 +1,191 @@
+import math
+from typing import Any, Iterable, Mapping
+
+import numpy as np
+import pandas as pd
+
+from .video_helper import DEFAULT_CHANNEL, DEFAULT_TITLE, NO_TAGS, Video, to_video
+
+# Text columns are stored as Arrow strings: one contiguous buffer per column
+# instead of one Python object per cell.
+TEXT_DTYPE = "string[pyarrow]"
+VIDEO_COLUMNS = (
+    "video_id",
+    "title",
+    "channel_name",
+    "duration_s",
+    "views",
+    "upload_date",
+    "thumbnail",
+    "tags",
+    "place",
+)
+VIDEO_PAGE_SIZE = 20
+
+_LENGTH_PATTERN = r"^(?:(\d+):)?(\d+):(\d+)$"
+
+
+def videos_to_frame(videos: Iterable[Video | Mapping[str, Any]]) -> pd.DataFrame:
+    """Converts videos into a columnar DataFrame.
+
+    Args:
+        videos (Iterable[Video | Mapping[str, Any]]): Videos or video dictionaries.
+
+    Returns:
+        pd.DataFrame: One row per video with the columns VIDEO_COLUMNS.
+                      duration_s and views are integer columns, upload_date
+                      is datetime64 (NaT if unknown).
+    """
+    videos = [to_video(video) for video in videos]
+    count = len(videos)
+    return pd.DataFrame(
+        {
+            "video_id": pd.array([v.video_id for v in videos], dtype=TEXT_DTYPE),
+            "title": pd.array([v.title for v in videos], dtype=TEXT_DTYPE),
+            "channel_name": pd.array([v.channel_name for v in videos], dtype=TEXT_DTYPE),
+            "duration_s": np.fromiter(
+                (v.duration_s for v in videos), dtype=np.int32, count=count
+            ),
+            "views": np.fromiter((v.views for v in videos), dtype=np.int64, count=count),
+            "upload_date": pd.to_datetime(
+                pd.Series([v.upload_date for v in videos], dtype="object")
+            ),
+            "thumbnail": pd.array([v.thumbnail for v in videos], dtype=TEXT_DTYPE),
+            "tags": pd.array([v.tags for v in videos], dtype=TEXT_DTYPE),
+            "place": pd.array([v.place for v in videos], dtype="Int32"),
+        }
+    )
+
+
+def frame_to_videos(frame: pd.DataFrame) -> list[Video]:
+    """Converts the rows of a video DataFrame back into Video objects.
+
+    Args:
+        frame (pd.DataFrame): A frame with the columns VIDEO_COLUMNS, e.g. one
+                              page of a larger result set.
+
+    Returns:
+        list[Video]: The videos in row order.
+    """
+    videos = []
+    for video_id, title, channel, duration, views, upload, thumb, tags, place in (
+        frame[list(VIDEO_COLUMNS)].itertuples(index=False, name=None)
+    ):
+        videos.append(
+            Video(
+                video_id=video_id,
+                title=title,
+                channel_name=channel,
+                duration_s=int(duration),
+                views=int(views),
+                upload_date=None if pd.isna(upload) else upload.to_pydatetime(),
+                thumbnail=thumb,
+                tags=tags,
+                place=None if pd.isna(place) else int(place),
+            )
+        )
+    return videos
+
+
+def sort_by_upload_date(frame: pd.DataFrame, newest_first: bool = True) -> pd.DataFrame:
+    """Sorts a video frame by upload date. Unknown dates come last."""
+    return frame.sort_values(
+        "upload_date", ascending=not newest_first, na_position="last", kind="stable"
+    )
+
+
+def filter_by_duration(
+    frame: pd.DataFrame, min_seconds: int = 0, max_seconds: int | None = None
+) -> pd.DataFrame:
+    """Keeps the videos whose duration lies within [min_seconds, max_seconds].
+
+    Args:
+        frame (pd.DataFrame): The video frame.
+        min_seconds (int, optional): Minimum duration. Defaults to 0.
+        max_seconds (int | None, optional): Maximum duration. Defaults to no limit.
+
+    Returns:
+        pd.DataFrame: The matching rows.
+    """
+    mask = frame["duration_s"].to_numpy() >= min_seconds
+    if max_seconds is not None:
+        mask &= frame["duration_s"].to_numpy() <= max_seconds
+    return frame[mask]
+
+
+def dedup_videos(frame: pd.DataFrame) -> pd.DataFrame:
+    """Drops repeated videos, keeping the first occurrence of every video_id."""
+    return frame.drop_duplicates(subset="video_id", keep="first")
+
+
+def page_count(total: int, page_size: int = VIDEO_PAGE_SIZE) -> int:
+    """Returns the number of pages needed to show total videos, at least 1."""
+    return max(1, math.ceil(total / page_size))
+
+
+def get_page(
+    frame: pd.DataFrame, page: int, page_size: int = VIDEO_PAGE_SIZE
+) -> pd.DataFrame:
+    """Returns the rows of one page, counting pages from 1."""
+    start = (max(1, page) - 1) * page_size
+    return frame.iloc[start : start + page_size]
+
+
+def read_videos_csv(filename: str) -> pd.DataFrame:
+    """Reads a watch list or history CSV file into a deduplicated video frame.
+
+    Lengths ("MM:SS") and view counts are converted for the whole column at
+    once. Additional columns such as summarized_transcript are kept, the
+    length column is replaced by duration_s.
+
+    Args:
+        filename (str): Path to the CSV file, see save_video_to_csv.
+
+    Returns:
+        pd.DataFrame: The videos with the columns VIDEO_COLUMNS, in file
+                      order. Empty if the file has no rows.
+    """
+    raw = pd.read_csv(filename, dtype=str, keep_default_na=False)
+    if raw.empty or "video_id" not in raw:
+        return videos_to_frame([])
+
+    def text(column: str, default: str = "") -> pd.Series:
+        values = raw[column] if column in raw else pd.Series(default, index=raw.index)
+        return values.replace("", default).astype(TEXT_DTYPE)
+
+    length = (
+        raw["length"] if "length" in raw else pd.Series("", index=raw.index)
+    ).str.extract(_LENGTH_PATTERN).astype("float64")
+    views = raw["views"] if "views" in raw else pd.Series("", index=raw.index)
+
+    frame = pd.DataFrame(
+        {
+            "video_id": text("video_id"),
+            "title": text("title", DEFAULT_TITLE),
+            "channel_name": text("channel_name", DEFAULT_CHANNEL),
+            "duration_s": (
+                length[0].fillna(0) * 3600 + length[1] * 60 + length[2]
+            )
+            .fillna(0)
+            .astype(np.int32),
+            "views": pd.to_numeric(
+                views.str.replace(r"\D", "", regex=True), errors="coerce"
+            )
+            .fillna(0)
+            .astype(np.int64),
+            "upload_date": pd.to_datetime(
+                raw.get("upload_date", pd.Series("", index=raw.index)),
+                errors="coerce",
+                format="mixed",
+                utc=True,
+            ).dt.tz_localize(None),
+            "thumbnail": text("thumbnail"),
+            "tags": text("tags", NO_TAGS),
+            "place": pd.array([None] * len(raw), dtype="Int32"),
+        }
+    )
+    extra_columns = [
+        column for column in raw if column not in frame and column != "length"
+    ]
+    frame = pd.concat([frame, raw[extra_columns]], axis=1)
+    return dedup_videos(frame[frame["video_id"] != ""])
@@ -0,0 +1,170 @@
+from dataclasses import asdict, dataclass, fields
+from datetime import datetime, timezone
+from typing import Any, Iterator, Mapping
+
+DEFAULT_TITLE = "Unbekannter Titel"
+DEFAULT_CHANNEL = "Unbekannter Kanal"
+NO_TAGS = "Keine Tags"
+
+
+def parse_count(value: Any) -> int:
+    """Normalizes a view count to an int.
+
+    Args:
+        value (Any): An int, a numeric string such as "12345" or "12.345",
+                     or a placeholder such as "Unknown" or None.
+
+    Returns:
+        int: The count, or 0 if the value is not numeric.
+    """
+    if isinstance(value, bool):
+        return 0
+    if isinstance(value, (int, float)):
+        return max(0, int(value))
+    digits = "".join(char for char in str(value or "") if char.isdigit())
+    return int(digits) if digits else 0
+
+
+def parse_length(value: Any) -> int:
+    """Normalizes a video length to seconds.
+
+    Args:
+        value (Any): Seconds as a number, or a "MM:SS" / "HH:MM:SS" string.
+
+    Returns:
+        int: The length in seconds, or 0 if it cannot be parsed.
+    """
+    if isinstance(value, bool) or value is None:
+        return 0
+    if isinstance(value, (int, float)):
+        return max(0, int(value))
+    try:
+        seconds = 0
+        for part in str(value).split(":"):
+            seconds = seconds * 60 + int(part)
+        return max(0, seconds)
+    except ValueError:
+        return 0
+
+
+def format_length(seconds: int) -> str:
+    """Formats seconds as "MM:SS", the length format shown in the dashboard."""
+    return f"{seconds // 60:02}:{seconds % 60:02}"
+
+
+def parse_upload_date(value: Any) -> datetime | None:
+    """Normalizes an upload date to a naive UTC datetime.
+
+    Args:
+        value (Any): A datetime, a yt-dlp date ("YYYYMMDD"), an ISO 8601
+                     timestamp from the YouTube API or the search index, or a
+                     placeholder such as "Unknown".
+
+    Returns:
+        datetime | None: The upload date, or None if it is unknown.
+    """
+    if isinstance(value, datetime):
+        parsed = value
+    elif isinstance(value, str) and value:
+        try:
+            if len(value) == 8 and value.isdigit():
+                parsed = datetime.strptime(value, "%Y%m%d")
+            else:
+                parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    else:
+        return None
+
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+@dataclass(slots=True)
+class Video:
+    """Metadata of one video, shared by the API, yt-dlp, RSS and index paths.
+
+    Durations and view counts are numeric, upload dates are naive UTC
+    datetimes. Values from the different sources are normalized once by
+    from_mapping. For code written against the former dictionaries, fields
+    can also be read with video["title"], video.get("views") and
+    "video_id" in video, including the derived "length" ("MM:SS").
+    """
+
+    video_id: str
+    title: str = DEFAULT_TITLE
+    channel_name: str = DEFAULT_CHANNEL
+    duration_s: int = 0
+    views: int = 0
+    upload_date: datetime | None = None
+    thumbnail: str = ""
+    tags: str = NO_TAGS
+    place: int | None = None
+
+    @property
+    def length(self) -> str:
+        return format_length(self.duration_s)
+
+    @classmethod
+    def from_mapping(cls, data: Mapping[str, Any]) -> "Video":
+        """Builds a Video from a dictionary of any video source.
+
+        Args:
+            data (Mapping[str, Any]): A video dictionary, e.g. a watch list CSV
+                                      row, a search index row or a cached
+                                      entry. Unknown keys are ignored.
+
+        Returns:
+            Video: The normalized video.
+        """
+        if isinstance(data, Video):
+            return data
+        duration = data.get("duration_s")
+        if duration is None:
+            duration = data.get("length")
+        place = data.get("place")
+        return cls(
+            video_id=str(data.get("video_id") or ""),
+            title=data.get("title") or DEFAULT_TITLE,
+            channel_name=data.get("channel_name") or DEFAULT_CHANNEL,
+            duration_s=parse_length(duration),
+            views=parse_count(data.get("views")),
+            upload_date=parse_upload_date(data.get("upload_date")),
+            thumbnail=data.get("thumbnail") or "",
+            tags=data.get("tags") or NO_TAGS,
+            place=int(place) if place not in (None, "") else None,
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Returns the fields as a dictionary, e.g. for caches and DataFrames."""
+        return asdict(self)
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in _MAPPING_KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in _MAPPING_KEYS
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key) if key in _MAPPING_KEYS else default
+
+    def keys(self) -> Iterator[str]:
+        return iter(_MAPPING_KEYS)
+
+
+_MAPPING_KEYS = (*(field.name for field in fields(Video)), "length")
+
+
+def to_video(video: Mapping[str, Any] | Video) -> Video:
+    """Returns the video as a Video, normalizing dictionaries."""
+    return video if isinstance(video, Video) else Video.from_mapping(video)
+
+
+def sort_by_upload_date(videos: list[Video]) -> list[Video]:
+    """Sorts videos newest first. Videos without an upload date come last."""
+    return sorted(
+        videos, key=lambda video: video.upload_date or datetime.min, reverse=True
+    )
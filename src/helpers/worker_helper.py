@@ -0,0 +1,98 @@
+import os
+import subprocess
+import sys
+import threading
+import time
+
+from .logging_helper import get_logger
+
+logger = get_logger(__name__)
+
+# Written by the ingestion worker while it runs, see src/ingest_worker.py.
+INGEST_WORKER_PID_FILE = "ingest_worker.pid"
+# The app checks at most this often whether the worker is still running.
+WORKER_CHECK_INTERVAL_S = 60
+
+_lock = threading.Lock()
+_worker_process: subprocess.Popen | None = None
+_last_check = 0.0
+
+
+def ingest_worker_enabled() -> bool:
+    """The app starts the worker unless INGEST_WORKER is set to "0" in the .env file."""
+    return os.getenv("INGEST_WORKER", "1").strip() != "0"
+
+
+def read_worker_pid(pid_file: str = INGEST_WORKER_PID_FILE) -> int | None:
+    """Returns the process ID from the PID file of the worker, None if there is none."""
+    try:
+        with open(pid_file, "r", encoding="utf-8") as file:
+            return int(file.read().strip())
+    except (OSError, ValueError):
+        return None
+
+
+def is_worker_running(pid_file: str = INGEST_WORKER_PID_FILE) -> bool:
+    """Tells whether a worker started by this app or by hand is running.
+
+    Args:
+        pid_file (str, optional): PID file of the worker. Defaults to
+                                  INGEST_WORKER_PID_FILE.
+
+    Returns:
+        bool: True if the worker process of this app is alive or the process
+              of the PID file exists.
+    """
+    if _worker_process is not None and _worker_process.poll() is None:
+        return True
+    pid = read_worker_pid(pid_file)
+    # On Windows os.kill would terminate the process instead of probing it,
+    # there only workers started by this app are detected.
+    if pid is None or os.name == "nt":
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def ensure_ingest_worker(pid_file: str = INGEST_WORKER_PID_FILE) -> bool:
+    """Starts the ingestion worker if it is enabled and not running yet.
+
+    Called by the app on every script run. Only one check per
+    WORKER_CHECK_INTERVAL_S is done, so a worker that exited is restarted
+    within about a minute. A worker started by hand with
+    ``python -m src.ingest_worker`` is found by its PID file and not
+    started a second time. The worker runs as a child of the Streamlit
+    process.
+
+    Args:
+        pid_file (str, optional): PID file of the worker. Defaults to
+                                  INGEST_WORKER_PID_FILE.
+
+    Returns:
+        bool: True if a worker was started.
+    """
+    global _worker_process, _last_check
+
+    if not ingest_worker_enabled():
+        return False
+    with _lock:
+        now = time.monotonic()
+        if _last_check and now - _last_check < WORKER_CHECK_INTERVAL_S:
+            return False
+        _last_check = now
+        if is_worker_running(pid_file):
+            return False
+        try:
+            _worker_process = subprocess.Popen(
+                [sys.executable, "-m", "src.ingest_worker"], env=dict(os.environ)
+            )
+        except OSError as e:
+            logger.warning("Ingest-Worker konnte nicht gestartet werden: %s", e)
+            return False
+    logger.info("Ingest-Worker gestartet (PID %d).", _worker_process.pid)
+    return True
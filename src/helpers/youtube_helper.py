@@ -1,9 +1,8 @@
+import logging
 import re
 from googleapiclient.discovery import build, Resource
 import pandas as pd
-from datetime import datetime
 import streamlit as st
-import feedparser
 import yt_dlp
 from streamlit.runtime.scriptrunner import get_script_run_ctx
 from concurrent.futures import ThreadPoolExecutor
@@ -11,62 +10,222 @@ import multiprocessing
 import os
 from typing import Any
 import concurrent.futures
-from youtube_transcript_api import YouTubeTranscriptApi
+import sqlite3
+import threading
+from youtube_transcript_api import (
+    TranscriptsDisabled,
+    VideoUnavailable,
+    YouTubeTranscriptApi,
+)
+from .duration_helper import parse_iso_duration, parse_iso_durations
+from .feed_helper import fetch_channel_video_ids
+from .search_index_helper import get_indexed_transcript, index_transcript
+from .gitignore_helper import ensure_gitignored
+from .tracing_helper import continue_trace, set_attribute, span, traced
+from .logging_helper import get_logger, log_sampled
+from .video_helper import (
+    NO_TAGS,
+    Video,
+    format_length,
+    parse_count,
+    parse_length,
+    parse_upload_date,
+    sort_by_upload_date,
+)
+from .cache_helper import (
+    cache_get,
+    cache_set,
+    disk_cache,
+    single_flight,
+    get_cached_video_metadata,
+    store_video_metadata,
+    update_video_volatile_fields,
+)
+
+logger = get_logger(__name__)
+
+# Listings of the transcript tracks of a video. Videos without tracks are
+# listed again sooner, automatic captions often appear after the upload.
+TRANSCRIPT_TRACKS_NAMESPACE = "transcript_tracks"
+TRANSCRIPT_TRACKS_TTL = 7 * 24 * 3600
+NO_TRANSCRIPT_TRACKS_TTL = 6 * 3600
+# The search index keeps one transcript per video, the one fetched for
+# these languages. Other preferences bypass the index.
+DEFAULT_TRANSCRIPT_LANGUAGES = ["de", "en"]
+
+# Flat yt-dlp search results are completed with their full metadata within
+# this many seconds, see enrich_videos_dlp. 0 disables the enrichment.
+DEFAULT_ENRICH_BUDGET_S = 8.0
+ENRICH_WORKERS = 8
+
+# Background refreshes of volatile metadata (views) for cached videos.
+_refresh_executor = ThreadPoolExecutor(max_workers=2)
+_pending_refreshes: set[str] = set()
+_pending_refreshes_lock = threading.Lock()
+
+
+def select_transcript_track(
+    tracks: list[dict[str, Any]], languages: list[str]
+) -> tuple[dict[str, Any], str | None] | None:
+    """Picks the best transcript track for the preferred languages.
+
+    Manually created tracks in a preferred language come first, then
+    automatically generated ones. Without a track in a preferred language,
+    a translatable track is translated by YouTube into the first preferred
+    language. As a last resort, any track is used as it is.
 
+    Args:
+        tracks (list[dict[str, Any]]): The tracks of a video, each with
+            'language_code', 'is_generated' and 'translatable'.
+        languages (list[str]): Language codes in order of preference.
+
+    Returns:
+        tuple[dict[str, Any], str | None] | None: The track and the language
+            to translate it to (None for no translation), or None if the
+            video has no tracks.
+    """
+    ordered = sorted(tracks, key=lambda track: track["is_generated"])
+    for is_generated in (False, True):
+        for language in languages:
+            for track in ordered:
+                if (
+                    track["is_generated"] == is_generated
+                    and track["language_code"] == language
+                ):
+                    return track, None
+    if languages:
+        for track in ordered:
+            if track["translatable"]:
+                return track, languages[0]
+    return (ordered[0], None) if ordered else None
+
+
+def _fetch_transcript_text(video_id: str, languages: list[str]) -> str:
+    """Lists the transcript tracks of a video once and fetches the best one."""
+    try:
+        tracks = cache_get(TRANSCRIPT_TRACKS_NAMESPACE, video_id)
+    except sqlite3.Error as e:
+        logger.warning("Cache für Transkriptspuren nicht verfügbar: %s", e)
+        tracks = None
+    if tracks is not None and select_transcript_track(tracks, languages) is None:
+        set_attribute("tracks_cached", True)
+        return ""
 
-def get_transcript(video_id: str, required_languages: list[str] = ["de", "en"]) -> str:
-    """Gets the transcript of a YouTube video in the specified languages.
+    try:
+        with span("transcript.list", video_id=video_id):
+            transcripts = list(YouTubeTranscriptApi.list_transcripts(video_id))
+    except (TranscriptsDisabled, VideoUnavailable):
+        transcripts = []
+    tracks = [
+        {
+            "language_code": transcript.language_code,
+            "is_generated": transcript.is_generated,
+            "translatable": transcript.is_translatable,
+        }
+        for transcript in transcripts
+    ]
+    try:
+        cache_set(
+            TRANSCRIPT_TRACKS_NAMESPACE,
+            video_id,
+            tracks,
+            TRANSCRIPT_TRACKS_TTL if tracks else NO_TRANSCRIPT_TRACKS_TTL,
+        )
+    except sqlite3.Error as e:
+        logger.warning("Transkriptspuren konnten nicht gecacht werden: %s", e)
 
-    Uses the youtube_transcript_api library. Returns an empty string if
-    no transcript is found for the specified languages or if an error occurs.
+    selected = select_transcript_track(tracks, languages)
+    if selected is None:
+        return ""
+    track, translate_to = selected
+    transcript = transcripts[tracks.index(track)]
+    if translate_to:
+        transcript = transcript.translate(translate_to)
+    set_attribute("language", transcript.language_code)
+    set_attribute("translated", translate_to is not None)
+    set_attribute("generated", track["is_generated"])
+    with span("transcript.fetch", language=transcript.language_code):
+        return " ".join(snippet.text for snippet in transcript.fetch())
+
+
+@traced("youtube.get_transcript")
+def get_transcript(
+    video_id: str, required_languages: list[str] = DEFAULT_TRANSCRIPT_LANGUAGES
+) -> str:
+    """Gets the transcript of a YouTube video, preferably in the specified languages.
+
+    Uses the youtube_transcript_api library. The available tracks of a video
+    are listed once and the listing is cached, so videos without any track
+    cost no request until the listing expires. The best track is chosen by
+    select_transcript_track, translated by YouTube if no preferred language
+    is available, and fetched with a single request. Transcripts for
+    DEFAULT_TRANSCRIPT_LANGUAGES are stored in the local search index, so
+    repeated calls for the same video are answered without a network
+    request. The index does not record the language of a transcript, so
+    other language preferences are always fetched and never indexed.
+    Returns an empty string if the video has no transcript or if an error
+    occurs.
 
     Args:
         video_id (str): The unique identifier of the YouTube video.
         required_languages (list[str], optional): A list of language codes (e.g., 'en', 'de')
                                                   in order of preference.
-                                                  Defaults to ["de", "en"].
+                                                  Defaults to DEFAULT_TRANSCRIPT_LANGUAGES.
 
     Returns:
         str: The video transcript text concatenated into a single string,
              or an empty string if unavailable or on error.
     """
-    try:
+    use_index = list(required_languages) == DEFAULT_TRANSCRIPT_LANGUAGES
+    cached_transcript = ""
+    if use_index:
+        try:
+            cached_transcript = get_indexed_transcript(video_id)
+        except sqlite3.Error as e:
+            logger.warning("Lokaler Index nicht verfügbar: %s", e)
+    set_attribute("cache_hit", bool(cached_transcript))
+    if cached_transcript:
+        return cached_transcript
 
-        transcript = YouTubeTranscriptApi.get_transcript(
-            video_id, languages=required_languages
+    try:
+        transcript_text = single_flight(
+            f"transcript:{video_id}:{','.join(required_languages)}",
+            _fetch_transcript_text,
+            video_id,
+            list(required_languages),
         )
-        transcript_text = " ".join([entry["text"] for entry in transcript])
-        return transcript_text
-    except:
-        print(f"Video {video_id} hat kein Transkript und wird ignoriert")
+    except Exception as e:
+        logger.info("Transkript von %s nicht verfügbar: %s", video_id, e)
         return ""
+    if not transcript_text:
+        logger.info("Video %s hat kein Transkript und wird ignoriert", video_id)
+        return ""
+    set_attribute("bytes", len(transcript_text.encode("utf-8")))
+
+    if use_index:
+        try:
+            index_transcript(video_id, transcript_text)
+        except sqlite3.Error as e:
+            logger.warning("Transkript konnte nicht indexiert werden: %s", e)
+    return transcript_text
 
 
 def parse_duration(duration: str) -> str:
     """Parses an ISO 8601 duration string (YouTube format) into MM:SS format.
 
+    Hours and days are counted as minutes, so "PT1H2M3S" becomes "62:03".
+
     Args:
-        duration_str (str): The duration string in ISO 8601 format (e.g., "PT5M10S").
+        duration (str): The duration string in ISO 8601 format (e.g., "PT5M10S").
 
     Returns:
-        str: The duration formatted as "MM:SS". Returns "00:00" if parsing fails
-             or if minutes/seconds are not present.
+        str: The duration formatted as "MM:SS". Returns "00:00" if parsing fails.
     """
-    minutes = 0
-    seconds = 0
-
-    min_match = re.search(r"(\d+)M", duration)
-    if min_match:
-        minutes = int(min_match.group(1))
+    return format_length(parse_iso_duration(duration))
 
-    sec_match = re.search(r"(\d+)S", duration)
-    if sec_match:
-        seconds = int(sec_match.group(1))
 
-    return f"{minutes:02}:{seconds:02}"
-
-
-def get_video_length(youtube: Resource, video_id: str) -> str:
+@traced("youtube.videos.list", part="contentDetails", quota_units=1)
+def get_video_length(youtube: Resource, video_id: str) -> int:
     """Retrieves the duration of a YouTube video using the YouTube Data API.
 
     Args:
@@ -75,28 +234,99 @@ def get_video_length(youtube: Resource, video_id: str) -> str:
         video_id (str): The unique identifier of the YouTube video.
 
     Returns:
-        str: The video duration formatted as "MM:SS". Returns "00:00" if the
-             video is not found or an API error occurs.
+        int: The video duration in seconds. Returns 0 if the video is not
+             found or an API error occurs.
     """
     request = youtube.videos().list(part="snippet,contentDetails", id=video_id)
     response = request.execute()
     if "items" not in response or len(response["items"]) == 0:
-        print(f"Fehler: Kein Video gefunden für ID {video_id}")
-        return "00:00"
+        logger.warning("Kein Video gefunden für ID %s", video_id)
+        return 0
 
     duration = response["items"][0]["contentDetails"]["duration"]
-    return parse_duration(duration)
+    return parse_iso_duration(duration)
+
+
+def get_video_lengths(youtube: Resource, video_ids: list[str]) -> dict[str, int]:
+    """Retrieves the durations of many videos with batched API requests.
+
+    Up to 50 videos share one videos.list request (1 quota unit).
+
+    Args:
+        youtube (Resource): The authenticated YouTube API client resource.
+        video_ids (list[str]): The video IDs.
+
+    Returns:
+        dict[str, int]: Duration in seconds per video ID. Videos that were not
+            found or whose batch failed are missing.
+    """
+    lengths: dict[str, int] = {}
+    video_ids = list(dict.fromkeys(video_ids))
+    for start in range(0, len(video_ids), 50):
+        batch = video_ids[start : start + 50]
+        try:
+            request = youtube.videos().list(part="contentDetails", id=",".join(batch))
+            with span(
+                "youtube.videos.list",
+                part="contentDetails",
+                quota_units=1,
+                video_count=len(batch),
+            ):
+                response = request.execute()
+        except Exception as e:
+            logger.warning("Videolängen konnten nicht geladen werden: %s", e)
+            continue
+        items = response.get("items", [])
+        durations = parse_iso_durations(
+            item.get("contentDetails", {}).get("duration") for item in items
+        )
+        lengths.update(
+            (item.get("id"), int(seconds)) for item, seconds in zip(items, durations)
+        )
+    return lengths
+
+
+def _response_lengths(youtube: Resource, items: list[dict[str, Any]]) -> dict[str, int]:
+    """Returns the duration of every item of an API response in seconds.
+
+    Responses of videos.list with contentDetails (e.g. the trending chart)
+    already contain the durations, they are parsed in bulk. The durations of
+    the other items, e.g. search results, are loaded with get_video_lengths.
+    """
+    # videos.list items have the ID as string, search.list items as object.
+    video_ids = [
+        (
+            item["id"].get("videoId")
+            if isinstance(item.get("id"), dict)
+            else item.get("id")
+        )
+        for item in items
+    ]
+    durations = [item.get("contentDetails", {}).get("duration") for item in items]
+    lengths = {
+        video_id: int(seconds)
+        for video_id, duration, seconds in zip(
+            video_ids, durations, parse_iso_durations(durations)
+        )
+        if video_id and duration
+    }
+    missing = [
+        video_id for video_id in video_ids if video_id and video_id not in lengths
+    ]
+    if missing:
+        lengths.update(get_video_lengths(youtube, missing))
+    return lengths
 
 
-def get_video_length_dlp(video_id: str) -> str:
+def get_video_length_dlp(video_id: str) -> int:
     """Fetches the duration of a YouTube video using yt-dlp (no API key needed).
 
     Args:
         video_id (str): The unique identifier of the YouTube video.
 
     Returns:
-        str: The video duration formatted as "MM:SS". Returns "00:00" if fetching
-             fails or duration is not found.
+        int: The video duration in seconds, like get_video_length. Returns 0
+             if fetching fails or duration is not found.
     """
     video_url = f"https://www.youtube.com/watch?v={video_id}"
     ydl_opts = {
@@ -109,77 +339,107 @@ def get_video_length_dlp(video_id: str) -> str:
     try:
         with yt_dlp.YoutubeDL(ydl_opts) as ydl:
             info = ydl.extract_info(video_url, download=False)
-            duration = info.get("duration")  # in Seconds
+            return parse_length(info.get("duration"))  # in Seconds
+    except Exception as e:
+        logger.warning("Fehler beim Abrufen der Videolänge für %s: %s", video_id, e)
+        return 0
 
-            if duration:
-                return f"{duration // 60:02}:{duration % 60:02}"
-            else:
-                return "00:00"
+
+@traced("ytdlp.extract_info")
+def _extract_video_info_dlp(video_id: str) -> dict[str, Any]:
+    """Runs a full yt-dlp page extraction for one video."""
+    ydl_opts = {"quiet": True, "noplaylist": True, "no_warnings": True}
+    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+        return ydl.extract_info(
+            f"https://www.youtube.com/watch?v={video_id}", download=False
+        )
+
+
+def _refresh_video_views(video_id: str) -> None:
+    """Re-fetches the volatile fields of a cached video in the background."""
+    try:
+        info = _extract_video_info_dlp(video_id)
+        update_video_volatile_fields(video_id, {"views": info.get("view_count", 0)})
     except Exception as e:
-        print(f"Fehler beim Abrufen der Videolänge für {video_id}: {e}")
-        return "00:00"
+        logger.warning("Views für %s konnten nicht aktualisiert werden: %s", video_id, e)
+    finally:
+        with _pending_refreshes_lock:
+            _pending_refreshes.discard(video_id)
+
+
+def _schedule_views_refresh(video_id: str) -> None:
+    """Queues a background refresh unless one is already pending for the video."""
+    with _pending_refreshes_lock:
+        if video_id in _pending_refreshes:
+            return
+        _pending_refreshes.add(video_id)
+    _refresh_executor.submit(_refresh_video_views, video_id)
 
 
-def get_video_data_dlp(video_id: str) -> dict[str, Any]:
+@traced("youtube.get_video_data_dlp")
+def get_video_data_dlp(video_id: str) -> Video | None:
     """Retrieves metadata for a YouTube video using yt-dlp.
 
     Fetches title, tags, thumbnail, length, upload date, channel name,
-    and view count without using the YouTube API.
+    and view count without using the YouTube API. Results are kept in the
+    persistent metadata cache: immutable fields are served for
+    IMMUTABLE_TTL, stale view counts are returned immediately and refreshed
+    in the background.
 
     Args:
         video_id (str): The unique identifier of the YouTube video.
 
     Returns:
-        dict[str, Any]: A dictionary containing video metadata. Keys include:
-                        'video_id' (str), 'title' (str), 'tags' (str),
-                        'thumbnail' (str), 'length' (str, "MM:SS"),
-                        'upload_date' (Optional[datetime]),
-                        'channel_name' (str), 'views' (int).
-                        Returns an empty dictionary if an error occurs.
+        Video | None: The video metadata, or None if an error occurs.
     """
-    ydl_opts = {"quiet": True, "noplaylist": True, "no_warnings": True}
-
-    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-        try:
-            info = ydl.extract_info(
-                f"https://www.youtube.com/watch?v={video_id}", download=False
-            )
-            length_str = (
-                f"{info.get('duration', 0) // 60:02}:{info.get('duration', 0) % 60:02}"
-            )
-            upload_date = info.get("upload_date", "")
-            formatted_date = (
-                datetime.strptime(upload_date, "%Y%m%d") if upload_date else None
-            )
+    try:
+        cached_video, views_stale = get_cached_video_metadata(video_id)
+    except sqlite3.Error as e:
+        logger.warning("Metadaten-Cache nicht verfügbar: %s", e)
+        cached_video, views_stale = None, False
+    set_attribute("cache_hit", bool(cached_video))
+    if cached_video:
+        if views_stale:
+            _schedule_views_refresh(video_id)
+        return Video.from_mapping(cached_video)
 
-            video_dict = {
+    try:
+        info = single_flight(f"ytdlp:{video_id}", _extract_video_info_dlp, video_id)
+        video = Video.from_mapping(
+            {
                 "video_id": video_id,
-                "title": info.get("title", "Unbekannter Titel"),
-                "tags": (
-                    ", ".join(info.get("tags", []))
-                    if info.get("tags")
-                    else "Keine Tags"
-                ),
+                "title": info.get("title"),
+                "tags": ", ".join(info.get("tags") or []),
                 "thumbnail": info.get("thumbnail", "Keine Thumbnail-URL"),
-                "length": length_str,
-                "upload_date": formatted_date,
-                "channel_name": info.get("uploader", "Unbekannter Kanal"),
-                "views": info.get("view_count", 0),
+                "duration_s": info.get("duration"),
+                "upload_date": info.get("upload_date"),
+                "channel_name": info.get("uploader"),
+                "views": info.get("view_count"),
             }
-        except Exception:
-            print("Fehler beim Abrufen der Video-Metadaten")
+        )
+    except Exception as e:
+        logger.warning("Fehler beim Abrufen der Video-Metadaten für %s: %s", video_id, e)
+        return None
 
-    return video_dict
+    try:
+        store_video_metadata(video.to_dict())
+    except sqlite3.Error as e:
+        logger.warning("Metadaten für %s konnten nicht gecacht werden: %s", video_id, e)
+
+    return video
 
 
+@traced("youtube.get_video_data")
 def get_video_data(
     youtube: Resource, response: dict[str, Any], mode: str | None = None
-) -> list[dict[str, Any]]:
+) -> list[Video]:
     """Extracts and formats video metadata from a YouTube Data API response.
 
     Parses items from an API response (e.g., from search or videos list).
-    Also fetches view counts and video length using separate API calls.
-    Handles different response structures based on the 'mode'.
+    Video lengths are taken from the contentDetails of the response or
+    fetched for all items together (see get_video_lengths); view counts are
+    fetched per video. Handles different response structures based on the
+    'mode'.
 
     Args:
         youtube (Resource): An authenticated YouTube API client resource.
@@ -190,13 +450,11 @@ def get_video_data(
                                         are extracted. Defaults to None.
 
     Returns:
-        list[dict[str, Any]]: A list of dictionaries, each containing metadata
-                              for a video. Keys include 'place', 'title', 'tags',
-                              'video_id', 'thumbnail', 'length', 'channel_name',
-                              'views', 'upload_date'. Returns an empty list if
-                              no items are found or errors occur.
+        list[Video]: The videos, sorted by upload date (descending). Returns
+                     an empty list if no items are found or errors occur.
     """
 
+    @traced("youtube.videos.list", part="statistics", quota_units=1)
     def get_views_with_youtube_api(youtube: Resource, video_id: str) -> str:
         """Retrieves the view count for a video using the YouTube API.
 
@@ -214,14 +472,18 @@ def get_video_data(
             view_count = response["items"][0]["statistics"].get("viewCount", "Unknown")
             return view_count
         except Exception as e:
-            print(
-                f"Fehler beim Abrufen der Views für Video {video_id} mit der YouTube API: {e}"
+            logger.warning(
+                "Fehler beim Abrufen der Views für Video %s mit der YouTube API: %s",
+                video_id,
+                e,
             )
             return "Unknown"
 
+    items = response.get("items", [])
+    lengths = _response_lengths(youtube, items)
     videos = []
 
-    for index, item in enumerate(response.get("items", []), start=1):
+    for index, item in enumerate(items, start=1):
         try:
             if mode == "trends":
                 video_id = item["id"]
@@ -231,13 +493,14 @@ def get_video_data(
             channel_name = item["snippet"]["channelTitle"]
             tags = item["snippet"].get("tags", [])
             thumbnail = item["snippet"]["thumbnails"]["medium"]["url"]
-            length = get_video_length(youtube, video_id)
+            length = lengths.get(video_id, 0)
             views = get_views_with_youtube_api(youtube, video_id)
             upload_date = item["snippet"].get("publishedAt", "Unknown")
 
         except KeyError:
-            print(
-                f"Warnung: Unerwartete API-Struktur für Item {index}, alternative Verarbeitung wird versucht."
+            logger.warning(
+                "Unerwartete API-Struktur für Item %d, alternative Verarbeitung wird versucht.",
+                index,
             )
             try:
                 video_id = item.get("id", {}).get("videoId", "Unknown")
@@ -252,38 +515,60 @@ def get_video_data(
                     .get("medium", {})
                     .get("url", "")
                 )
-                length = "Unknown"
+                length = lengths.get(video_id, 0)
                 views = get_views_with_youtube_api(youtube, video_id)
                 upload_date = item.get("snippet", {}).get("publishedAt", "Unknown")
             except Exception as e:
-                print(f"Fehler beim Verarbeiten des Items {index}: {e}")
+                logger.warning("Fehler beim Verarbeiten des Items %d: %s", index, e)
                 continue
         
         if video_id != "Unknown":
             videos.append(
-                {
-                    "place": index,
-                    "title": title,
-                    "tags": ", ".join(tags) if tags else "Keine Tags",
-                    "video_id": video_id,
-                    "thumbnail": thumbnail,
-                    "length": length,
-                    "channel_name": channel_name,
-                    "views": views,
-                    "upload_date": upload_date,
-                }
+                Video.from_mapping(
+                    {
+                        "place": index,
+                        "title": title,
+                        "tags": ", ".join(tags),
+                        "video_id": video_id,
+                        "thumbnail": thumbnail,
+                        "length": length,
+                        "channel_name": channel_name,
+                        "views": views,
+                        "upload_date": upload_date,
+                    }
+                )
             )
 
-    videos = [d for d in videos if d]
+    set_attribute("video_count", len(videos))
+
+    return sort_by_upload_date(videos)
+
 
-    return sorted(videos, key=lambda v: v["upload_date"] or datetime.min, reverse=True)
+def _video_from_flat_entry(entry: dict[str, Any], place: int) -> Video:
+    """Builds a Video from a flat yt-dlp playlist entry."""
+    return Video(
+        video_id=entry.get("id"),
+        title=entry.get("title") or "Unbekannter Titel",
+        channel_name=entry.get("uploader") or "Unbekannter Kanal",
+        duration_s=parse_length(entry.get("duration")),
+        views=parse_count(entry.get("view_count")),
+        upload_date=parse_upload_date(entry.get("upload_date")),
+        thumbnail=entry.get("thumbnail") or "",
+        tags=", ".join(entry.get("tags") or []) or "Keine Tags",
+        place=place,
+    )
 
 
 @st.cache_data(ttl=3600)
-def search_videos_dlp(query: str, max_results: int = 100) -> list[dict[str, Any]]:
+@disk_cache("search_videos_dlp", ttl=3600)
+@traced("ytdlp.search")
+def search_videos_dlp(query: str, max_results: int = 100) -> list[Video]:
     """Performs a Youtube using yt-dlp and returns video metadata.
 
-    Extracts flat list of search results up to max_results.
+    Extracts flat list of search results up to max_results. Flat results
+    often lack the upload date, tags and view count, they can be completed
+    with enrich_videos_dlp. Results are cached in memory and in the
+    persistent cache, so they survive restarts.
 
     Args:
         query (str): The search term.
@@ -292,11 +577,8 @@ def search_videos_dlp(query: str, max_results: int = 100) -> list[dict[str, Any]
                                      Defaults to 100.
 
     Returns:
-        list[dict[str, Any]]: A list of dictionaries, each containing metadata for a
-                              found video. Keys include 'place', 'title', 'video_id',
-                              'thumbnail', 'channel_name', 'length', 'tags',
-                              'upload_date' (Optional[datetime]), 'views' (int).
-                              Returns an empty list on error or if no results.
+        list[Video]: The found videos in order of relevance (see place).
+                     Returns an empty list on error or if no results.
     """
 
     max_results = min(max_results, 1000)
@@ -314,35 +596,210 @@ def search_videos_dlp(query: str, max_results: int = 100) -> list[dict[str, Any]
             f"ytsearch{max_results}:{query}", download=False
         )
 
-    videos = []
-    if "entries" in search_results:
-        for index, entry in enumerate(search_results["entries"], start=1):
-            upload_date = entry.get("upload_date", "")
-            formatted_date = (
-                datetime.strptime(upload_date, "%Y%m%d") if upload_date else None
-            )
-            view_count = entry.get("view_count", 0)
+    videos = [
+        _video_from_flat_entry(entry, index)
+        for index, entry in enumerate(search_results.get("entries") or [], start=1)
+    ]
 
-            videos.append(
-                {
-                    "place": index,
-                    "title": entry.get("title", "Unbekannter Titel"),
-                    "video_id": entry.get("id"),
-                    "thumbnail": entry.get("thumbnail"),
-                    "channel_name": entry.get("uploader", "Unbekannter Kanal"),
-                    "length": f"{int(entry.get('duration', 0)) // 60:02}:{int(entry.get('duration', 0)) % 60:02}",
-                    "tags": (
-                        ", ".join(entry.get("tags", []))
-                        if entry.get("tags")
-                        else "Keine Tags"
-                    ),
-                    "upload_date": formatted_date,
-                    "views": view_count,
-                }
-            )
+    set_attribute("video_count", len(videos))
+    return videos
+
+
+@traced("ytdlp.search_range")
+def search_videos_dlp_range(query: str, start: int, end: int) -> list[Video]:
+    """Returns the yt-dlp search results from position start to end.
 
-    videos = [d for d in videos if d]
-    return sorted(videos, key=lambda v: v["upload_date"] or datetime.min, reverse=True)
+    yt-dlp loads the result list of YouTube in continuation pages and stops
+    after the last requested entry, so a page of results does not wait for
+    all results before it to be extracted.
+
+    Args:
+        query (str): The search term.
+        start (int): Position of the first result (1-based).
+        end (int): Position of the last result (inclusive, max. 1000).
+
+    Returns:
+        list[Video]: The found videos; place is their position in the whole
+                     result list. Empty if there are no more results.
+    """
+    end = min(end, 1000)
+    if start > end:
+        return []
+    ydl_opts = {
+        "quiet": True,
+        "skip_download": True,
+        "default_search": "ytsearch",
+        "noplaylist": True,
+        "extract_flat": True,
+        "no_warnings": True,
+        "playliststart": start,
+        "playlistend": end,
+    }
+
+    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+        search_results = ydl.extract_info(f"ytsearch{end}:{query}", download=False)
+
+    videos = [
+        _video_from_flat_entry(entry, index)
+        for index, entry in enumerate(search_results.get("entries") or [], start=start)
+    ]
+    set_attribute("video_count", len(videos))
+    return videos
+
+
+def enrich_budget_s() -> float:
+    """Returns the enrichment time budget from DLP_ENRICH_BUDGET_S in seconds."""
+    try:
+        return max(0.0, float(os.getenv("DLP_ENRICH_BUDGET_S", DEFAULT_ENRICH_BUDGET_S)))
+    except ValueError:
+        return DEFAULT_ENRICH_BUDGET_S
+
+
+def needs_enrichment(video: Video) -> bool:
+    """Tells whether a flat yt-dlp result lacks fields that get_video_data_dlp provides."""
+    return video.upload_date is None or not video.views or video.tags == NO_TAGS
+
+
+def _merge_metadata(flat: Video, full: Video) -> Video:
+    """Fills the missing fields of a flat result, keeping its search position."""
+    return Video(
+        video_id=flat.video_id,
+        title=full.title,
+        channel_name=full.channel_name,
+        duration_s=full.duration_s or flat.duration_s,
+        views=full.views or flat.views,
+        upload_date=full.upload_date or flat.upload_date,
+        thumbnail=flat.thumbnail or full.thumbnail,
+        tags=full.tags if full.tags != NO_TAGS else flat.tags,
+        place=flat.place,
+    )
+
+
+@traced("ytdlp.enrich")
+def enrich_videos_dlp(
+    videos: list[Video], budget_s: float | None = None
+) -> list[Video]:
+    """Completes flat yt-dlp results with their full metadata, within a time budget.
+
+    The missing fields are fetched concurrently with get_video_data_dlp, so
+    videos already in the metadata cache cost no request. Videos whose
+    metadata does not arrive within the budget keep their flat fields.
+    Fetches that are already running finish in the background and fill the
+    cache for the next search.
+
+    Args:
+        videos (list[Video]): The flat results, e.g. from search_videos_dlp.
+        budget_s (float | None, optional): Seconds to wait for metadata.
+                                           Defaults to DLP_ENRICH_BUDGET_S.
+
+    Returns:
+        list[Video]: The videos in the given order, completed where possible.
+    """
+    budget_s = enrich_budget_s() if budget_s is None else budget_s
+    pending = list(
+        dict.fromkeys(video.video_id for video in videos if needs_enrichment(video))
+    )
+    set_attribute("pending", len(pending))
+    if not pending or budget_s <= 0:
+        return list(videos)
+
+    full: dict[str, Video] = {}
+    executor = ThreadPoolExecutor(
+        max_workers=min(len(pending), ENRICH_WORKERS), initializer=continue_trace()
+    )
+    try:
+        futures = {
+            executor.submit(get_video_data_dlp, video_id): video_id
+            for video_id in pending
+        }
+        for future in concurrent.futures.as_completed(futures, timeout=budget_s):
+            video = future.result()
+            if video is not None:
+                full[futures[future]] = video
+    except concurrent.futures.TimeoutError:
+        logger.info(
+            "Metadaten für %d von %d Videos nicht rechtzeitig geladen.",
+            len(pending) - len(full),
+            len(pending),
+        )
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    set_attribute("enriched", len(full))
+    return [
+        _merge_metadata(video, full[video.video_id]) if video.video_id in full else video
+        for video in videos
+    ]
+
+
+@disk_cache("search_videos_api", ttl=3600, api_key_env="YOUTUBE_API_KEY")
+@traced("youtube.search_videos")
+def search_videos(
+    youtube: Resource, query: str, max_results: int = 10
+) -> list[Video]:
+    """Searches YouTube videos using the YouTube Data API.
+
+    Results are cached per API key, so repeated searches do not use quota.
+
+    Args:
+        youtube (Resource): The authenticated YouTube API client resource.
+        query (str): The search term.
+        max_results (int, optional): Maximum number of results. Defaults to 10.
+
+    Returns:
+        list[Video]: The found videos, see get_video_data.
+
+    Raises:
+        googleapiclient.errors.HttpError: If the API call fails.
+    """
+    request = youtube.search().list(
+        part="snippet", q=query, type="video", maxResults=max_results
+    )
+    with span("youtube.search.list", quota_units=100):
+        response = request.execute()
+    return get_video_data(youtube, response)
+
+
+@traced("youtube.search_videos_page")
+def search_videos_page(
+    youtube: Resource,
+    query: str,
+    max_results: int = 20,
+    page_token: str | None = None,
+) -> tuple[list[Video], str | None]:
+    """Loads one page of YouTube Data API search results.
+
+    Every page costs 100 quota units, no matter how many results it has.
+
+    Args:
+        youtube (Resource): The authenticated YouTube API client resource.
+        query (str): The search term.
+        max_results (int, optional): Results per page (max. 50). Defaults to 20.
+        page_token (str | None, optional): The nextPageToken of the previous
+                                           page. Defaults to None (first page).
+
+    Returns:
+        tuple[list[Video], str | None]: The videos of the page in order of
+            relevance (place counts from 1 within the page) and the token of
+            the next page, None on the last page.
+
+    Raises:
+        googleapiclient.errors.HttpError: If the API call fails.
+    """
+    params: dict[str, Any] = {
+        "part": "snippet",
+        "q": query,
+        "type": "video",
+        "maxResults": min(max_results, 50),
+    }
+    if page_token:
+        params["pageToken"] = page_token
+    request = youtube.search().list(**params)
+    with span("youtube.search.list", quota_units=100):
+        response = request.execute()
+    videos = get_video_data(youtube, response)
+    videos.sort(key=lambda video: video.place if video.place is not None else 0)
+    return videos, response.get("nextPageToken")
 
 
 def get_category_name(youtube: Resource, category_id: str) -> str:
@@ -405,8 +862,13 @@ def get_subscriptions(
                 maxResults=50,
                 pageToken=next_page_token,
             )
-            response = request.execute()
-            print(response)
+            with span("youtube.subscriptions.list", quota_units=1):
+                response = request.execute()
+            logger.debug(
+                "subscriptions.list: %d Abos, nextPageToken=%s",
+                len(response.get("items", [])),
+                response.get("nextPageToken"),
+            )
         except Exception as e:
             st.write("API Tokens aufgebraucht oder Fehler aufgetreten:", str(e))
             return pd.DataFrame()
@@ -438,23 +900,16 @@ def get_subscriptions(
 
     subs.to_csv(csv_filename, index=False, encoding="utf-8")
 
-    if os.path.isfile(gitignore_path):
-        with open(gitignore_path, "r", encoding="utf-8") as gitignore_file:
-            gitignore_content = gitignore_file.readlines()
-
-        if csv_filename not in [line.strip() for line in gitignore_content]:
-            with open(gitignore_path, "a", encoding="utf-8") as gitignore_file:
-                gitignore_file.write(f"\n{csv_filename}\n")
-    else:
-        with open(gitignore_path, "w", encoding="utf-8") as gitignore_file:
-            gitignore_file.write(f"{csv_filename}\n")
+    ensure_gitignored([csv_filename], gitignore_path)
 
     return subs
 
 
+@disk_cache("recent_videos_api", ttl=3600, api_key_env="YOUTUBE_API_KEY")
+@traced("youtube.get_recent_videos_from_subscriptions")
 def get_recent_videos_from_subscriptions(
     youtube: Resource, channel_ids: list[str], number_of_videos: int
-) -> list[dict[str, Any]]:
+) -> list[Video]:
     """Retrieves the most recent videos from a list of YouTube channels using the API.
 
     Performs one search API call per channel ID to get recent videos.
@@ -466,9 +921,8 @@ def get_recent_videos_from_subscriptions(
                                 per channel (API max is 50, usually lower is better).
 
     Returns:
-        list[dict[str, Any]]: A list of dictionaries, where each dictionary contains
-                              metadata for a recent video from the specified channels.
-                              Returns an empty list if errors occur or no videos found.
+        list[Video]: The recent videos of the specified channels. Returns an
+                     empty list if errors occur or no videos found.
     """
     videos = []
     for channel_id in channel_ids:
@@ -480,10 +934,16 @@ def get_recent_videos_from_subscriptions(
                 order="date",
                 type="video",
             )
-            response = request.execute()
-            print()
-            print(channel_id)
-            print(f"------------------\n{response}--------------------\n")
+            with span("youtube.search.list", quota_units=100, channel_id=channel_id):
+                response = request.execute()
+            log_sampled(
+                logger,
+                logging.DEBUG,
+                "search.list",
+                "search.list für Kanal %s: %s",
+                channel_id,
+                response,
+            )
             video_data = get_video_data(youtube, response)
             for video in video_data:
                 videos.append(video)
@@ -494,13 +954,16 @@ def get_recent_videos_from_subscriptions(
 
 
 @st.cache_data(ttl=3600)
+@disk_cache("recent_videos_rss", ttl=3600)
+@traced("youtube.get_recent_videos_rss")
 def get_recent_videos_from_channels_RSS(
     channel_ids: list[str], max_videos: int = 1
-) -> list[dict[str, Any]]:
+) -> list[Video]:
     """Retrieves recent videos from YouTube channels using RSS feeds and yt-dlp.
 
     Fetches video IDs from RSS feeds concurrently and then fetches detailed
-    metadata for each video using yt-dlp concurrently.
+    metadata for each video using yt-dlp concurrently. Metadata comes from the
+    persistent metadata cache where possible.
 
     Args:
         channel_ids (list[str]): A list of YouTube channel IDs.
@@ -508,9 +971,8 @@ def get_recent_videos_from_channels_RSS(
                                     per channel's RSS feed. Defaults to 1.
 
     Returns:
-        list[dict[str, Any]]: A list of dictionaries, each containing metadata
-                              for a recent video, sorted by upload date (descending).
-                              Returns an empty list on errors or if no videos found.
+        list[Video]: The recent videos, sorted by upload date (descending).
+                     Returns an empty list on errors or if no videos found.
     """
     videos = []
     num_threads = min(len(channel_ids), multiprocessing.cpu_count() * 2)
@@ -520,29 +982,16 @@ def get_recent_videos_from_channels_RSS(
     def fetch_videos(channel_id: str) -> list[str]:
         """Fetches the latest video IDs for one channel via its RSS feed."""
         try:
-            feed_url = (
-                f"https://www.youtube.com/feeds/videos.xml?channel_id={channel_id}"
-            )
-            feed = feedparser.parse(feed_url)
-            video_urls = [entry.link for entry in feed.entries[:max_videos]]
-
-            video_ids = []
-            for video in video_urls:
-                match = re.search(
-                    r"(?:https?://)?(?:www\.)?youtube\.com/watch\?v=([a-zA-Z0-9_-]+)",
-                    video,
-                )
-                if match:
-                    video_ids.append(match.group(1))
-
-            return list(set(video_ids))
+            return fetch_channel_video_ids(channel_id, max_videos)
 
         except Exception as e:
             st.warning(f"Fehler beim Abrufen der Videos für Kanal {channel_id}: {e}")
             return []
 
     video_id_lists = []
-    with ThreadPoolExecutor(max_workers=num_threads) as executor:
+    with ThreadPoolExecutor(
+        max_workers=num_threads, initializer=continue_trace()
+    ) as executor:
         future_to_channel = {
             executor.submit(fetch_videos, channel): channel for channel in channel_ids
         }
@@ -551,16 +1000,18 @@ def get_recent_videos_from_channels_RSS(
 
     video_ids = [video_id for sublist in video_id_lists for video_id in sublist]
 
-    def fetch_video_data(video_id: str) -> dict[str, Any]:
+    def fetch_video_data(video_id: str) -> Video | None:
         """Fetches metadata for a single video ID using yt-dlp."""
         try:
             return get_video_data_dlp(video_id)
         except Exception as e:
             st.warning(f"Fehler beim Abrufen der Metadaten für Video {video_id}: {e}")
-            return {}
+            return None
 
     video_data_list: list = []
-    with ThreadPoolExecutor(max_workers=num_threads) as executor:
+    with ThreadPoolExecutor(
+        max_workers=num_threads, initializer=continue_trace()
+    ) as executor:
         future_to_video = {
             executor.submit(fetch_video_data, video_id): video_id
             for video_id in video_ids
@@ -568,10 +1019,9 @@ def get_recent_videos_from_channels_RSS(
         for future in future_to_video:
             video_data_list.append(future.result())
 
-    video_data_list = [d for d in video_data_list if d]
-    videos = sorted(
-        video_data_list, key=lambda v: v.get("upload_date", datetime.min), reverse=True
-    )
+    videos = sort_by_upload_date([video for video in video_data_list if video])
+    set_attribute("channel_count", len(channel_ids))
+    set_attribute("video_count", len(videos))
 
     return videos
 
@@ -609,9 +1059,11 @@ def create_youtube_client(api_key: str) -> Resource:
     return build(api_service_name, api_version, developerKey=api_key)
 
 
+@disk_cache("trending_videos_api", ttl=3600, api_key_env="YOUTUBE_API_KEY")
+@traced("youtube.get_trending_videos")
 def get_trending_videos(
     youtube: Resource, region_code: str
-) -> list[dict[str, Any]]:  # Corrected return type
+) -> list[Video]:
     """Retrieves current trending videos for a specific region using the YouTube API.
 
     Args:
@@ -619,10 +1071,8 @@ def get_trending_videos(
         region_code (str): The ISO 3166-1 alpha-2 country code (e.g., "DE", "US").
 
     Returns:
-        list[dict[str, Any]]: A list of dictionaries containing metadata for trending
-                              videos, sorted by upload date (descending). Returns an
-                              empty list if errors occur or no videos are found.
-                              See get_video_data for dict structure.
+        list[Video]: The trending videos, sorted by upload date (descending).
+                     Returns an empty list if errors occur or no videos are found.
 
     Raises:
         googleapiclient.errors.HttpError: If the API call fails.
@@ -635,14 +1085,16 @@ def get_trending_videos(
         maxResults=50,
     )
 
-    response = request.execute()
+    with span("youtube.videos.list", chart="mostPopular", quota_units=1):
+        response = request.execute()
 
     return get_video_data(youtube, response, "trends")
 
 
+@traced("youtube.get_trending_videos_dlp")
 def get_trending_videos_dlp(
     region_code: str = "DE", max_results: int = 50
-) -> list[dict[str, Any]]:
+) -> list[Video]:
     """Retrieves current trending videos for a specific region using yt-dlp.
 
     Fetches trending video IDs and then retrieves metadata for each using yt-dlp.
@@ -654,9 +1106,8 @@ def get_trending_videos_dlp(
                                      Defaults to 50.
 
     Returns:
-        list[dict[str, Any]]: A list of dictionaries containing metadata for trending
-                              videos. Returns an empty list if errors occur or no
-                              videos found. See get_video_data_dlp for dict structure.
+        list[Video]: The trending videos. Returns an empty list if errors occur
+                     or no videos found.
     """
     url = f"https://www.youtube.com/feed/trending?gl={region_code}"
 
@@ -666,7 +1117,7 @@ def get_trending_videos_dlp(
         "force_generic_extractor": True,
     }
 
-    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+    with yt_dlp.YoutubeDL(ydl_opts) as ydl, span("ytdlp.extract_info", url=url):
         info_dict = ydl.extract_info(url, download=False)
 
     trending_video_ids = [
@@ -674,11 +1125,13 @@ def get_trending_videos_dlp(
     ][:max_results]
 
     if not trending_video_ids:
-        print("Keine Trend-Videos gefunden.")
+        logger.info("Keine Trend-Videos gefunden.")
         return []
 
     videos = []
-    with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=10, initializer=continue_trace()
+    ) as executor:
         future_to_video_id = {
             executor.submit(get_video_data_dlp, video_id): video_id
             for video_id in trending_video_ids
@@ -686,8 +1139,12 @@ def get_trending_videos_dlp(
 
         for future in concurrent.futures.as_completed(future_to_video_id):
             try:
-                videos.append(future.result())
+                video = future.result()
             except Exception as e:
-                print(f"Fehler beim Abrufen von Videodaten: {e}")
+                logger.warning("Fehler beim Abrufen von Videodaten: %s", e)
+                continue
+            if video:
+                videos.append(video)
 
+    set_attribute("video_count", len(videos))
     return videos
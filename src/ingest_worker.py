@@ -0,0 +1,158 @@
+"""Hintergrund-Worker, der die Videos der abonnierten Kanäle regelmäßig lädt.
+
+Die App startet den Worker selbst und startet ihn neu, wenn er beendet
+wurde (siehe helpers/worker_helper.py, abschaltbar mit INGEST_WORKER=0).
+Von Hand läuft er mit ``python -m src.ingest_worker``. Der Worker fragt die RSS-Feeds aller Abos ab,
+ergänzt neue Videos um ihre Metadaten, lädt ihre Transkripte in den lokalen
+Index und legt alles in cache.db ab. Der Abos-Tab liest diese Ergebnisse,
+statt beim Laden selbst alle Kanäle abzufragen. Außerdem hält er die
+Trend-Snapshots der Regionen aus TRENDING_REGIONS aktuell.
+
+Meldungen laufen über den Paket-Logger (siehe helpers/logging_helper.py).
+Fehler erscheinen ab LOG_LEVEL=WARNING, die Statuszeilen der Durchläufe
+erst mit LOG_LEVEL=INFO.
+"""
+
+import argparse
+import os
+import signal
+import threading
+import time
+
+import pandas as pd
+from dotenv import load_dotenv
+
+from src.env_management.api_key_management import create_youtube_client, get_api_key
+from src.env_management.youtube_channel_id import load_channel_id
+from src.helpers.ingest_helper import ingest_channels, ingest_interval_s
+from src.helpers.logging_helper import configure_logging, get_logger
+from src.helpers.trending_helper import refresh_trending_regions
+from src.helpers.user_helper import SUBSCRIPTIONS_FILE, USER_DATA_DIR, all_user_paths
+from src.helpers.worker_helper import INGEST_WORKER_PID_FILE
+from src.helpers.youtube_helper import get_subscriptions
+
+# Mit -m gestartet heißt das Modul __main__ und läge außerhalb des Paket-Loggers.
+logger = get_logger("src.ingest_worker")
+
+PID_FILE = INGEST_WORKER_PID_FILE
+
+
+def create_client():
+    """Erstellt den YouTube-API-Client, falls ein API-Schlüssel hinterlegt ist."""
+    api_key = get_api_key("YOUTUBE_API_KEY")
+    return create_youtube_client(api_key) if api_key else None
+
+
+def load_subscribed_channel_ids(youtube=None) -> list[str]:
+    """Lädt die Kanal-IDs der Abos aller Nutzer.
+
+    Die Abos des Standardnutzers kommen aus subscriptions.csv oder über die
+    API, dazu kommen die Abo-Listen der Nutzer in user_data/. Fehlt die
+    CHANNEL_ID oder schlägt das Laden der Standard-Abos fehl, werden die
+    Listen der anderen Nutzer trotzdem geladen.
+    """
+    frames = []
+    try:
+        frames.append(
+            get_subscriptions(
+                channel_Id=load_channel_id(),
+                youtube=youtube,
+                csv_filename=SUBSCRIPTIONS_FILE,
+            )
+        )
+    except Exception as e:
+        logger.warning("Abos des Standardnutzers konnten nicht geladen werden: %s", e)
+    for path in all_user_paths(SUBSCRIPTIONS_FILE):
+        if not path.startswith(USER_DATA_DIR + os.sep):
+            continue
+        try:
+            frames.append(pd.read_csv(path))
+        except (OSError, ValueError) as e:
+            logger.warning("%s konnte nicht gelesen werden: %s", path, e)
+
+    channel_ids = [frame["channel_id"] for frame in frames if "channel_id" in frame]
+    if not channel_ids:
+        return []
+    return pd.concat(channel_ids).dropna().astype(str).unique().tolist()
+
+
+def run_cycle() -> None:
+    """Führt einen Durchlauf über alle abonnierten Kanäle und Trend-Regionen aus."""
+    started = time.perf_counter()
+    try:
+        youtube = create_client()
+    except Exception as e:
+        logger.warning("YouTube-API-Client konnte nicht erstellt werden: %s", e)
+        youtube = None
+
+    refreshed = refresh_trending_regions(youtube=youtube)
+    if refreshed:
+        logger.info("%d Trend-Snapshots aktualisiert", refreshed)
+
+    try:
+        channel_ids = load_subscribed_channel_ids(youtube)
+    except Exception as e:
+        logger.warning("Abos konnten nicht geladen werden: %s", e)
+        return
+
+    stats = ingest_channels(channel_ids)
+    logger.info(
+        "%d Kanäle geprüft (%d Fehler), %d neue Videos, %d Transkripte in %.1f s",
+        stats.channels,
+        stats.failed_channels,
+        stats.new_videos,
+        stats.transcripts,
+        time.perf_counter() - started,
+    )
+
+
+def write_pid_file() -> None:
+    """Schreibt die Prozess-ID, damit die App den laufenden Worker erkennt und
+    restart_app.py ihn beenden kann."""
+    with open(PID_FILE, "w", encoding="utf-8") as pid_file:
+        pid_file.write(str(os.getpid()))
+
+
+def remove_pid_file() -> None:
+    """Entfernt die PID-Datei, wenn sie zu diesem Prozess gehört."""
+    try:
+        with open(PID_FILE, "r", encoding="utf-8") as pid_file:
+            if pid_file.read().strip() != str(os.getpid()):
+                return
+        os.remove(PID_FILE)
+    except OSError:
+        pass
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Lädt die Videos der Abos im Hintergrund.")
+    parser.add_argument(
+        "--once", action="store_true", help="Nur einen Durchlauf ausführen."
+    )
+    args = parser.parse_args(argv)
+
+    load_dotenv()
+    configure_logging(force=True)
+
+    stop = threading.Event()
+    previous_handlers = {}
+    if threading.current_thread() is threading.main_thread():
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            previous_handlers[signum] = signal.signal(signum, lambda *_: stop.set())
+
+    write_pid_file()
+    try:
+        while not stop.is_set():
+            run_cycle()
+            if args.once:
+                break
+            stop.wait(ingest_interval_s())
+    finally:
+        remove_pid_file()
+        for signum, handler in previous_handlers.items():
+            signal.signal(signum, handler)
+    logger.info("Ingest-Worker beendet.")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,7 @@ import platform
 from dotenv import dotenv_values
 
 APP_FILE = "run.py"
+INGEST_WORKER_PID_FILE = "ingest_worker.pid"
 
 
 def kill_existing_streamlit() -> None:
@@ -38,7 +39,11 @@ def kill_existing_streamlit() -> None:
 
 
 def clear_streamlit_cache() -> None:
-    """Löscht bekannte Cache-Ordner von Streamlit."""
+    """Löscht bekannte Cache-Ordner von Streamlit.
+
+    Die persistenten Caches der App (cache.db, search_index.db) liegen nicht
+    in diesen Ordnern und bleiben beim Neustart erhalten.
+    """
     cache_paths = [
         os.path.expanduser("~/.streamlit/cache"),
         os.path.expanduser("~/.cache/streamlit"),
@@ -61,8 +66,26 @@ def restart_app() -> None:
     subprocess.Popen(["streamlit", "run", APP_FILE], env={**os.environ, **env_vars})
 
 
+def stop_ingest_worker() -> None:
+    """Beendet einen laufenden Ingest-Worker anhand seiner PID-Datei.
+
+    Die neu gestartete App startet danach selbst einen neuen Worker.
+    """
+    try:
+        with open(INGEST_WORKER_PID_FILE, "r", encoding="utf-8") as pid_file:
+            pid = int(pid_file.read().strip())
+    except (OSError, ValueError):
+        return
+    try:
+        os.kill(pid, signal.SIGTERM)
+        print(f"🔪 Beende Ingest-Worker {pid}")
+    except OSError:
+        print("ℹ️ Kein laufender Ingest-Worker gefunden.")
+
+
 def main():
     kill_existing_streamlit()
+    stop_ingest_worker()
     clear_streamlit_cache()
     time.sleep(1)
     restart_app()
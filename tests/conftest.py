@@ -28,3 +28,38 @@ def prevent_load_dotenv_globally(monkeypatch):
         print(
             "\nWARNING: Could not patch load_dotenv in src.env_management.config_env (AttributeError)."
         )
+
+
+@pytest.fixture(autouse=True)
+def isolate_local_databases(monkeypatch, tmp_path):
+    """
+    Redirect the local SQLite databases into the test's temporary directory.
+
+    get_transcript, get_video_data_dlp, build_video_list and update_history_csv
+    write to the search index and the metadata cache as a side effect. Without
+    this fixture the test run would create database files in the working
+    directory and share cached results between tests.
+    """
+    import src.helpers.search_index_helper
+    import src.helpers.cache_helper
+
+    monkeypatch.setattr(
+        src.helpers.search_index_helper,
+        "INDEX_DB",
+        str(tmp_path / "search_index.db"),
+    )
+    monkeypatch.setattr(
+        src.helpers.cache_helper,
+        "CACHE_DB",
+        str(tmp_path / "cache.db"),
+    )
+
+
+@pytest.fixture(autouse=True)
+def disable_ingest_worker(monkeypatch):
+    """
+    Keep initialize() from starting the ingestion worker as a subprocess.
+
+    Tests of worker_helper enable it again and replace subprocess.Popen.
+    """
+    monkeypatch.setenv("INGEST_WORKER", "0")
@@ -0,0 +1,91 @@
+import os
+import sys
+from unittest.mock import patch, MagicMock
+
+
+def test_invalidate_changed_settings(tmp_path):
+    """Tests that only caches tied to changed settings are invalidated."""
+    from src.env_management.settings_management import invalidate_changed_settings
+
+    subscriptions_file = tmp_path / "subscriptions.csv"
+    subscriptions_file.write_text("channel_name,channel_id\n")
+    previous_env = {"YOUTUBE_API_KEY": "yt", "TOKEN_GOOGLEAPI": "g", "CHANNEL_ID": "c"}
+
+    with patch(
+        "src.env_management.settings_management.invalidate_api_key_scope"
+    ) as mock_invalidate:
+        changed = invalidate_changed_settings(
+            previous_env,
+            {**previous_env, "TOKEN_GOOGLEAPI": "g2"},
+            subscriptions_file=str(subscriptions_file),
+        )
+        assert changed == ["TOKEN_GOOGLEAPI"]
+        mock_invalidate.assert_called_once_with("TOKEN_GOOGLEAPI", "g")
+        assert subscriptions_file.exists()
+
+        changed = invalidate_changed_settings(
+            previous_env,
+            {**previous_env, "CHANNEL_ID": "c2"},
+            subscriptions_file=str(subscriptions_file),
+        )
+        assert changed == ["CHANNEL_ID"]
+        assert mock_invalidate.call_count == 1
+        assert not subscriptions_file.exists()
+
+
+def test_invalidate_changed_channel_id_removes_subscriptions_of_all_users(
+    tmp_path, monkeypatch
+):
+    """Tests that a new channel ID drops the subscription lists of named users too."""
+    from src.env_management.settings_management import invalidate_changed_settings
+
+    monkeypatch.chdir(tmp_path)
+    files = [
+        tmp_path / "subscriptions.csv",
+        tmp_path / "user_data" / "alice" / "subscriptions.csv",
+        tmp_path / "user_data" / "bob" / "subscriptions.csv",
+    ]
+    for path in files:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("channel_name,channel_id\n")
+    interests = tmp_path / "user_data" / "alice" / "interests.txt"
+    interests.write_text("KI")
+
+    changed = invalidate_changed_settings({"CHANNEL_ID": "c"}, {"CHANNEL_ID": "c2"})
+
+    assert changed == ["CHANNEL_ID"]
+    assert not any(path.exists() for path in files)
+    assert interests.exists()
+
+
+def test_reload_settings(tmp_path, monkeypatch):
+    """Tests that saved keys are applied to the environment and the Gemini client."""
+    from src.env_management.settings_management import reload_settings
+
+    env_path = tmp_path / ".env"
+    env_path.write_text("YOUTUBE_API_KEY=new_yt\nTOKEN_GOOGLEAPI=new_gemini\n")
+    monkeypatch.setenv("YOUTUBE_API_KEY", "old_yt")
+    monkeypatch.setenv("TOKEN_GOOGLEAPI", "old_gemini")
+    mock_gemini_helper = MagicMock()
+    monkeypatch.setitem(sys.modules, "src.helpers.gemini_helper", mock_gemini_helper)
+
+    reload_settings(str(env_path))
+
+    assert os.environ["YOUTUBE_API_KEY"] == "new_yt"
+    assert os.environ["TOKEN_GOOGLEAPI"] == "new_gemini"
+    mock_gemini_helper.reload_client.assert_called_once_with("new_gemini")
+
+
+def test_reload_settings_gemini_not_loaded(tmp_path, monkeypatch):
+    """Tests that the Gemini module is not imported by the reload."""
+    from src.env_management.settings_management import reload_settings
+
+    env_path = tmp_path / ".env"
+    env_path.write_text("TOKEN_GOOGLEAPI=new_gemini\n")
+    monkeypatch.setenv("TOKEN_GOOGLEAPI", "old_gemini")
+    monkeypatch.delitem(sys.modules, "src.helpers.gemini_helper", raising=False)
+
+    reload_settings(str(env_path))
+
+    assert os.environ["TOKEN_GOOGLEAPI"] == "new_gemini"
+    assert "src.helpers.gemini_helper" not in sys.modules
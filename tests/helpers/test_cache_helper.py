@@ -0,0 +1,173 @@
+import datetime as dt
+from unittest.mock import patch, MagicMock
+
+
+MOCK_VIDEO = {
+    "video_id": "v1",
+    "title": "Cached Title",
+    "tags": "a, b",
+    "thumbnail": "thumb",
+    "length": "01:35",
+    "upload_date": dt.datetime(2023, 1, 15),
+    "channel_name": "Channel",
+    "views": 100,
+}
+
+
+def test_cache_set_get_and_expiry(tmp_path):
+    """Tests storing values including datetimes and their expiry."""
+    from src.helpers.cache_helper import cache_get, cache_set
+
+    db_path = str(tmp_path / "cache.db")
+    value = [{"upload_date": dt.datetime(2024, 1, 1), "views": 3}]
+
+    cache_set("ns", "key", value, ttl=60, db_path=db_path)
+    assert cache_get("ns", "key", db_path=db_path) == value
+    assert cache_get("other", "key", db_path=db_path) is None
+
+    with patch("src.helpers.cache_helper.time.time", return_value=10**12):
+        assert cache_get("ns", "key", db_path=db_path) is None
+
+
+def test_disk_cache_decorator():
+    """Tests that results are persisted and empty results are not cached."""
+    from src.helpers.cache_helper import disk_cache
+
+    inner = MagicMock(side_effect=lambda query, max_results=1: [query] * max_results)
+    cached_function = disk_cache("test_ns", ttl=60)(inner)
+
+    assert cached_function("a", max_results=2) == ["a", "a"]
+    assert cached_function("a", max_results=2) == ["a", "a"]
+    assert inner.call_count == 1
+
+    assert cached_function("b", max_results=0) == []
+    assert cached_function("b", max_results=0) == []
+    assert inner.call_count == 3
+
+
+def test_video_metadata_freshness_tiers(tmp_path):
+    """Tests that views go stale before the immutable metadata does."""
+    from src.helpers.cache_helper import (
+        get_cached_video_metadata,
+        store_video_metadata,
+        update_video_volatile_fields,
+        VOLATILE_TTL,
+        IMMUTABLE_TTL,
+    )
+
+    db_path = str(tmp_path / "cache.db")
+    assert get_cached_video_metadata("v1", db_path=db_path) == (None, False)
+
+    with patch("src.helpers.cache_helper.time.time", return_value=1000.0):
+        store_video_metadata(MOCK_VIDEO, db_path=db_path)
+        assert get_cached_video_metadata("v1", db_path=db_path) == (MOCK_VIDEO, False)
+
+    with patch(
+        "src.helpers.cache_helper.time.time", return_value=1000.0 + VOLATILE_TTL + 1
+    ):
+        video, views_stale = get_cached_video_metadata("v1", db_path=db_path)
+        assert video == MOCK_VIDEO
+        assert views_stale
+
+        update_video_volatile_fields("v1", {"views": 150}, db_path=db_path)
+        video, views_stale = get_cached_video_metadata("v1", db_path=db_path)
+        assert video["views"] == 150
+        assert not views_stale
+
+    with patch(
+        "src.helpers.cache_helper.time.time", return_value=1000.0 + IMMUTABLE_TTL + 1
+    ):
+        assert get_cached_video_metadata("v1", db_path=db_path) == (None, False)
+
+
+def test_api_key_scoped_cache_invalidation(monkeypatch):
+    """Tests that only entries of a changed API key are invalidated."""
+    from src.helpers.cache_helper import disk_cache, invalidate_api_key_scope
+
+    monkeypatch.setenv("YOUTUBE_API_KEY", "old-key")
+    api_inner = MagicMock(side_effect=lambda client, query: [query])
+    public_inner = MagicMock(side_effect=lambda query: [query])
+    api_function = disk_cache("api_ns", ttl=60, api_key_env="YOUTUBE_API_KEY")(
+        api_inner
+    )
+    public_function = disk_cache("public_ns", ttl=60)(public_inner)
+
+    # Clients are not serializable, they are keyed by their type.
+    assert api_function(object(), "a") == ["a"]
+    assert api_function(object(), "a") == ["a"]
+    assert public_function("a") == ["a"]
+    assert api_inner.call_count == 1
+
+    monkeypatch.setenv("YOUTUBE_API_KEY", "new-key")
+    api_function(object(), "a")
+    assert api_inner.call_count == 2
+
+    assert invalidate_api_key_scope("YOUTUBE_API_KEY", "old-key") == 1
+    assert invalidate_api_key_scope("YOUTUBE_API_KEY", "old-key") == 0
+
+    public_function("a")
+    api_function(object(), "a")
+    assert public_inner.call_count == 1
+    assert api_inner.call_count == 2
+
+
+def test_disk_cache_should_cache():
+    """Tests that results rejected by should_cache are not stored."""
+    from src.helpers.cache_helper import disk_cache
+
+    inner = MagicMock(return_value="Fehler")
+    cached_function = disk_cache(
+        "error_ns", ttl=60, should_cache=lambda text: text != "Fehler"
+    )(inner)
+
+    cached_function("a")
+    cached_function("a")
+    assert inner.call_count == 2
+
+
+def test_cache_round_trips_videos(tmp_path):
+    from src.helpers.cache_helper import cache_get, cache_set
+    from src.helpers.video_helper import Video
+
+    db_path = str(tmp_path / "cache.db")
+    video = Video(video_id="v1", duration_s=95, upload_date=dt.datetime(2024, 1, 1))
+    cache_set("search_dlp", "query", [video], ttl=60, db_path=db_path)
+
+    assert cache_get("search_dlp", "query", db_path=db_path) == [video]
+
+
+def test_single_flight_runs_concurrent_calls_once():
+    """Tests that concurrent callers with the same key share one call."""
+    import threading
+    import time
+
+    from src.helpers.cache_helper import single_flight
+
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def slow_fetch():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return ["result"]
+
+    results = []
+    leader = threading.Thread(
+        target=lambda: results.append(single_flight("k", slow_fetch))
+    )
+    leader.start()
+    started.wait(5)
+    follower = threading.Thread(
+        target=lambda: results.append(single_flight("k", slow_fetch))
+    )
+    follower.start()
+    time.sleep(0.1)  # let the follower reach the in-flight call
+    release.set()
+    leader.join(5)
+    follower.join(5)
+
+    assert results == [["result"], ["result"]]
+    assert len(calls) == 1
+    assert single_flight("k", lambda: "again") == "again"
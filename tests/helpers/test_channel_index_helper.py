@@ -0,0 +1,60 @@
+from unittest.mock import patch
+
+
+CHANNEL_NAMES = ["Kurzgesagt – In a Nutshell", "MrBeast", "Mr Beast Gaming", "ARTE.tv"]
+CHANNEL_IDS = ["ch_kurz", "ch_beast", "ch_beast_gaming", "ch_arte"]
+
+
+def test_normalize_channel_name():
+    from src.helpers.channel_index_helper import normalize_channel_name
+
+    assert normalize_channel_name("  ARTE.tv ") == "artetv"
+    assert normalize_channel_name("Kurzgesagt – In a Nutshell") == "kurzgesagtinanutshell"
+
+
+def test_lookup_exact_substring_and_fuzzy():
+    """Tests the three matching stages of the index."""
+    from src.helpers.channel_index_helper import ChannelNameIndex
+
+    index = ChannelNameIndex(CHANNEL_NAMES, CHANNEL_IDS)
+
+    assert len(index) == 4
+    assert index.lookup(" mr beast ") == "ch_beast"
+    assert index.lookup("Kurzgesagt") == "ch_kurz"
+    assert index.lookup("gaming") == "ch_beast_gaming"
+    assert index.lookup("ar") == "ch_arte"
+    assert index.lookup("Arte TV!") == "ch_arte"
+    assert index.lookup("MrBaest") == "ch_beast"
+    assert index.lookup("Unbekannt") is None
+    assert index.lookup(" - ") is None
+
+
+def test_resolve_keeps_order_and_removes_duplicates():
+    from src.helpers.channel_index_helper import ChannelNameIndex
+
+    index = ChannelNameIndex(CHANNEL_NAMES, CHANNEL_IDS)
+
+    assert index.resolve(["ARTE.tv", " MrBeast", "Unbekannt", "arte tv"]) == [
+        "ch_arte",
+        "ch_beast",
+    ]
+
+
+def test_get_channel_name_index_is_cached():
+    """Tests that the index is only built once per subscription list."""
+    from src.helpers import channel_index_helper
+
+    channel_index_helper._cached_index.cache_clear()
+    with patch.object(
+        channel_index_helper,
+        "ChannelNameIndex",
+        wraps=channel_index_helper.ChannelNameIndex,
+    ) as mock_index_cls:
+        first = channel_index_helper.get_channel_name_index(CHANNEL_NAMES, CHANNEL_IDS)
+        second = channel_index_helper.get_channel_name_index(
+            list(CHANNEL_NAMES), list(CHANNEL_IDS)
+        )
+
+    assert first is second
+    mock_index_cls.assert_called_once()
+    channel_index_helper._cached_index.cache_clear()
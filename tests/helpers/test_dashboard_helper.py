@@ -262,7 +262,7 @@ def test_load_interests_file_exists(tmp_path):
 @patch("src.helpers.dashboard_helper.write_filename_to_gitignore")
 def test_save_interests_new_file(mock_write_git, mock_load, tmp_path):
     """Test save_interests creating a new file."""
-    from src.helpers.dashboard_helper import save_interests
+    from src.helpers.dashboard_helper import flush_interests, save_interests
 
     interests_file_path = tmp_path / "interests.txt"
     gitignore_path = tmp_path / ".gitignore"
@@ -275,6 +275,8 @@ def test_save_interests_new_file(mock_write_git, mock_load, tmp_path):
     ), patch("src.helpers.dashboard_helper.gitignore", str(gitignore_path)):
 
         save_interests(new_interests)
+        assert not interests_file_path.exists()
+        flush_interests()
 
     assert interests_file_path.exists()
     assert interests_file_path.read_text(encoding="utf-8") == new_interests
@@ -288,7 +290,7 @@ def test_save_interests_new_file(mock_write_git, mock_load, tmp_path):
 @patch("src.helpers.dashboard_helper.write_filename_to_gitignore")
 def test_save_interests_overwrite_file(mock_write_git, mock_load, tmp_path):
     """Test save_interests overwriting existing file with different content."""
-    from src.helpers.dashboard_helper import save_interests
+    from src.helpers.dashboard_helper import flush_interests, save_interests
 
     interests_file_path = tmp_path / "interests.txt"
     gitignore_path = tmp_path / ".gitignore"
@@ -303,6 +305,7 @@ def test_save_interests_overwrite_file(mock_write_git, mock_load, tmp_path):
     ), patch("src.helpers.dashboard_helper.gitignore", str(gitignore_path)):
 
         save_interests(new_interests)
+        flush_interests()
 
     assert interests_file_path.read_text(encoding="utf-8") == new_interests
     mock_load.assert_called_once()
@@ -340,6 +343,29 @@ def test_save_interests_same_content(mock_write_git, mock_load, tmp_path):
     )
 
 
+def test_save_interests_debounces_reruns(tmp_path):
+    """Test that reruns cost no disk access and only the last change is written."""
+    from src.helpers.dashboard_helper import (
+        flush_interests,
+        load_interests,
+        save_interests,
+    )
+
+    interests_file_path = tmp_path / "interests.txt"
+    with patch(
+        "src.helpers.dashboard_helper.Interests_file", str(interests_file_path)
+    ), patch("src.helpers.dashboard_helper.gitignore", str(tmp_path / ".gitignore")):
+        for interests in ("KI", "KI, Sport", "KI, Sport", "KI, Sport"):
+            save_interests(interests)
+        assert load_interests() == "KI, Sport"
+        assert not interests_file_path.exists()
+        flush_interests()
+
+    assert interests_file_path.read_text(encoding="utf-8") == "KI, Sport"
+    gitignore_lines = (tmp_path / ".gitignore").read_text(encoding="utf-8").splitlines()
+    assert gitignore_lines == [str(interests_file_path)]
+
+
 @patch("src.helpers.dashboard_helper.datetime")
 def test_save_feedback_new_file(mock_datetime, tmp_path, mock_streamlit):
     """Test save_feedback when the feedback file doesn't exist."""
@@ -500,12 +526,13 @@ def test_update_history_csv_source_empty_or_missing(tmp_path):
 # --- Tests for Orchestration / Logic Functions ---
 
 
+@patch("src.helpers.dashboard_helper.ensure_ingest_worker")
 @patch("src.helpers.dashboard_helper.get_api_key")
 @patch("src.helpers.dashboard_helper.create_youtube_client")
 @patch("src.helpers.dashboard_helper.build_settings_pop_up")
 @patch("src.helpers.dashboard_helper.st")
 def test_initialize_success(
-    mock_st_obj, mock_build_popup, mock_create_client, mock_get_key
+    mock_st_obj, mock_build_popup, mock_create_client, mock_get_key, mock_ensure_worker
 ):
     """Tests successful initialization when API keys are found."""
     from src.helpers.dashboard_helper import initialize
@@ -523,9 +550,36 @@ def test_initialize_success(
     mock_create_client.assert_called_once_with("fake_youtube_key")
     mock_build_popup.assert_not_called()
     mock_st_obj.stop.assert_not_called()
+    mock_ensure_worker.assert_called_once_with()
     assert result_client is mock_yt_client
 
 
+@patch("src.helpers.dashboard_helper.create_youtube_client")
+@patch("src.helpers.dashboard_helper.st")
+def test_initialize_uses_reloaded_youtube_key(
+    mock_st_obj, mock_create_client, tmp_path, monkeypatch
+):
+    """Tests that the rerun after saving builds the YouTube client with the new key."""
+    from src.env_management.settings_management import reload_settings
+    from src.helpers.dashboard_helper import initialize
+
+    monkeypatch.setenv("YOUTUBE_API_KEY", "old_yt")
+    monkeypatch.setenv("TOKEN_GOOGLEAPI", "gemini")
+    monkeypatch.delitem(sys.modules, "src.helpers.gemini_helper", raising=False)
+    env_path = tmp_path / ".env"
+    env_path.write_text("YOUTUBE_API_KEY=new_yt\n")
+
+    initialize()
+    reload_settings(str(env_path))
+    # st.rerun() runs run.py again, which starts with initialize().
+    initialize()
+
+    assert [c.args for c in mock_create_client.call_args_list] == [
+        ("old_yt",),
+        ("new_yt",),
+    ]
+
+
 @patch("src.helpers.dashboard_helper.get_api_key")
 @patch("src.helpers.dashboard_helper.create_youtube_client")
 @patch("src.helpers.dashboard_helper.build_settings_pop_up")
@@ -552,13 +606,10 @@ def test_initialize_missing_key(
 # --- Example Test for a Tab Builder ---
 
 
-@patch("src.helpers.dashboard_helper.get_trending_videos")
-@patch("src.helpers.dashboard_helper.get_trending_videos_dlp")
+@patch("src.helpers.dashboard_helper.load_trending_videos")
 @patch("src.helpers.dashboard_helper.build_video_list")
 @patch("src.helpers.dashboard_helper.st")
-def test_build_trending_videos_tab_api(
-    mock_st_obj, mock_build_list, mock_get_dlp, mock_get_api
-):
+def test_build_trending_videos_tab_api(mock_st_obj, mock_build_list, mock_load):
     """Tests build_trending_videos_tab logic when using API method."""
     from src.helpers.dashboard_helper import build_trending_videos_tab
 
@@ -567,7 +618,7 @@ def test_build_trending_videos_tab_api(
     mock_st_obj.radio.return_value = "DE"
     mock_st_obj.button.return_value = True
 
-    mock_get_api.return_value = MOCK_VIDEO_DATA_LIST
+    mock_load.return_value = MOCK_VIDEO_DATA_LIST
 
     build_trending_videos_tab(
         spoiler=True, search_method="YouTube API", youtube=mock_youtube
@@ -577,23 +628,19 @@ def test_build_trending_videos_tab_api(
     mock_st_obj.radio.assert_called_with("Region wählen:", ("DE", "US", "GB"))
     mock_st_obj.button.assert_called_with("🔄 Trending Videos laden")
     mock_st_obj.spinner.assert_called_with("Lade Trending Videos...")
-    mock_get_api.assert_called_once_with(mock_youtube, "DE")
-    mock_get_dlp.assert_not_called()
+    mock_load.assert_called_once_with("DE", mock_youtube)
     mock_build_list.assert_called_once_with(
         True, MOCK_VIDEO_DATA_LIST, key_id="trending_videos"
     )
 
 
-@patch("src.helpers.dashboard_helper.get_trending_videos")
-@patch("src.helpers.dashboard_helper.get_trending_videos_dlp")
+@patch("src.helpers.dashboard_helper.load_trending_videos")
 @patch("src.helpers.dashboard_helper.build_video_list")
-def test_build_trending_videos_tab_dlp(
-    mock_build_list, mock_get_dlp, mock_get_api, mock_streamlit
-):
+def test_build_trending_videos_tab_dlp(mock_build_list, mock_load, mock_streamlit):
     """Test trending tab using yt-dlp."""
     from src.helpers.dashboard_helper import build_trending_videos_tab
 
-    mock_get_dlp.return_value = [{"video_id": "dlp1"}]
+    mock_load.return_value = [{"video_id": "dlp1"}]
     mock_streamlit.button.return_value = True
 
     build_trending_videos_tab(spoiler=False, search_method="yt-dlp", youtube=None)
@@ -601,15 +648,14 @@ def test_build_trending_videos_tab_dlp(
     mock_streamlit.header.assert_called_with("Trending Videos")
     mock_streamlit.radio.assert_called_with("Region wählen:", ("DE", "US", "GB"))
     mock_streamlit.button.assert_called_with("🔄 Trending Videos laden")
-    mock_get_api.assert_not_called()
-    mock_get_dlp.assert_called_once_with(mock_streamlit.radio.return_value)
+    mock_load.assert_called_once_with(mock_streamlit.radio.return_value, None)
     mock_build_list.assert_called_once_with(
         False, [{"video_id": "dlp1"}], key_id="trending_videos"
     )
 
 
-@patch("src.helpers.dashboard_helper.get_trending_videos_dlp")
-@patch("src.helpers.dashboard_helper.combine_video_id_title_and_transcript")
+@patch("src.helpers.dashboard_helper.load_trending_videos")
+@patch("src.helpers.dashboard_helper.combine_video_digests")
 @patch("src.helpers.dashboard_helper.get_recommendation")
 @patch("src.helpers.dashboard_helper.extract_video_id_and_reason")
 @patch("src.helpers.dashboard_helper.get_video_data_dlp")
@@ -645,7 +691,7 @@ def test_build_trend_recommendations_dlp(
         spoiler=True, search_method="yt-dlp", youtube=None, user_interests="testing"
     )
 
-    mock_get_trending_dlp.assert_called_once_with(region_code="DE")
+    mock_get_trending_dlp.assert_called_once_with("DE", None)
     mock_combine.assert_called_once_with(mock_get_trending_dlp.return_value)
     mock_get_rec.assert_called_once_with(
         video_ids_titles_and_transcripts=mock_combine.return_value, interests="testing"
@@ -664,3 +710,135 @@ def test_build_trend_recommendations_dlp(
 
     mock_streamlit.spinner.assert_called_once()
     mock_streamlit.empty.assert_called_once()
+
+
+@patch("src.helpers.dashboard_helper.get_embeddings")
+def test_get_interest_matched_channel_ids(mock_get_embeddings, tmp_path):
+    """Tests local channel matching and that known channels are not re-embedded."""
+    from src.helpers.dashboard_helper import get_interest_matched_channel_ids
+
+    subscriptions = pd.DataFrame(
+        {
+            "channel_name": ["Koch Kanal", "KI Kanal", "Sport Kanal"],
+            "channel_id": ["ch_cook", "ch_ai", "ch_sport"],
+            "description": ["Rezepte", "Machine Learning", None],
+        }
+    )
+    vectors = {
+        "Koch Kanal: Rezepte": [1.0, 0.0, 0.0],
+        "KI Kanal: Machine Learning": [0.0, 1.0, 0.0],
+        "Sport Kanal: ": [0.0, 0.0, 1.0],
+        "KI": [0.1, 1.0, 0.0],
+        "Sport": [0.0, 0.2, 1.0],
+    }
+    mock_get_embeddings.side_effect = lambda texts, task_type="RETRIEVAL_DOCUMENT": [
+        vectors[text] for text in texts
+    ]
+    index_path = str(tmp_path / "channels.npz")
+
+    matched = get_interest_matched_channel_ids(subscriptions, "KI, Sport", 2, index_path)
+
+    assert matched == ["ch_ai", "ch_sport"]
+    assert os.path.exists(index_path)
+
+    mock_get_embeddings.reset_mock()
+    get_interest_matched_channel_ids(subscriptions, "KI", 1, index_path)
+    mock_get_embeddings.assert_called_once_with(["KI"], task_type="RETRIEVAL_QUERY")
+
+
+@patch("src.helpers.dashboard_helper.get_embeddings", return_value=None)
+def test_get_interest_matched_channel_ids_without_embeddings(
+    mock_get_embeddings, tmp_path
+):
+    """Tests that None is returned so the caller can fall back to Gemini."""
+    from src.helpers.dashboard_helper import get_interest_matched_channel_ids
+
+    subscriptions = pd.DataFrame(
+        {"channel_name": ["A"], "channel_id": ["ch_a"], "description": ["desc"]}
+    )
+
+    assert (
+        get_interest_matched_channel_ids(
+            subscriptions, "KI", 1, str(tmp_path / "channels.npz")
+        )
+        is None
+    )
+
+
+
+def test_trace_to_dataframe():
+    """Tests that spans are listed as an indented call tree."""
+    from src.helpers.dashboard_helper import trace_to_dataframe
+    from src.helpers.tracing_helper import clear_traces, get_recent_traces, span
+
+    clear_traces()
+    with span("render.trending_videos_tab"):
+        with span("youtube.get_trending_videos", quota_units=1):
+            with span("youtube.videos.list"):
+                pass
+        with span("render.video_list", video_count=2):
+            pass
+
+    table = trace_to_dataframe(get_recent_traces()[0])
+    clear_traces()
+
+    assert list(table["Span"]) == [
+        "render.trending_videos_tab",
+        "  youtube.get_trending_videos",
+        "    youtube.videos.list",
+        "  render.video_list",
+    ]
+    assert table["Anteil (%)"].iloc[0] == 100.0
+    assert table["Attribute"].iloc[1] == "quota_units=1"
+
+
+@patch("src.helpers.dashboard_helper.lazy_button")
+@patch("src.helpers.dashboard_helper.lazy_expander")
+@patch("src.helpers.dashboard_helper.st")
+def test_build_video_list_renders_one_page(mock_st, mock_expander, mock_button, tmp_path):
+    from src.helpers.dashboard_helper import build_video_list
+    from src.helpers.search_index_helper import search_local_index
+    from src.helpers.video_frame_helper import videos_to_frame
+
+    frame = videos_to_frame(
+        {"video_id": f"vid{i}", "title": f"Video {i}", "length": "01:00"}
+        for i in range(45)
+    )
+    mock_st.session_state = {}
+    mock_st.number_input.return_value = 2
+
+    with patch("src.helpers.dashboard_helper.watch_later_csv", str(tmp_path / "w.csv")):
+        build_video_list(False, frame, key_id="search", page_size=20)
+
+    assert mock_st.number_input.call_args.kwargs["max_value"] == 3
+    titles = [c.args[0] for c in mock_st.subheader.call_args_list]
+    assert titles == [f"Video {i}" for i in range(20, 40)]
+    assert {v["video_id"] for v in search_local_index("Video", max_results=100)} == {
+        f"vid{i}" for i in range(20, 40)
+    }
+
+
+@patch("src.helpers.dashboard_helper.score_videos_by_interests")
+def test_plan_watch_list(mock_score):
+    from src.helpers.dashboard_helper import plan_watch_list
+    from src.helpers.video_frame_helper import videos_to_frame
+
+    videos = videos_to_frame(
+        [
+            {"video_id": "short", "title": "Kurz", "length": "10:00"},
+            {"video_id": "match", "title": "Passend", "length": "20:00"},
+            {"video_id": "long", "title": "Lang", "length": "50:00"},
+            {"video_id": "unknown", "title": "Ohne Länge", "length": ""},
+        ]
+    )
+    mock_score.return_value = [0.1, 0.9, 0.8]
+
+    plan = plan_watch_list(videos, "KI", free_minutes=30)
+
+    assert list(plan["video_id"]) == ["match", "short"]
+    assert [v["video_id"] for v in mock_score.call_args.args[0]] == [
+        "short",
+        "match",
+        "long",
+    ]
+    assert plan_watch_list(videos, "", free_minutes=5).empty
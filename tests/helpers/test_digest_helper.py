@@ -0,0 +1,58 @@
+from unittest.mock import patch
+
+from src.helpers.video_helper import Video
+
+
+def test_make_digest_removes_filler():
+    """Tests that short transcripts are only cleaned of filler words."""
+    from src.helpers.digest_helper import make_digest
+
+    assert make_digest("Ähm, also [Musik] das ist, äh, gut.\n Um zehn Uhr.") == (
+        "also das ist, gut. Um zehn Uhr."
+    )
+
+
+def test_make_digest_keeps_budget_and_topic_sentences():
+    """Tests that long transcripts are compressed to the budget without repeats."""
+    from src.helpers.digest_helper import estimate_tokens, make_digest
+
+    topic = "Der Sauerteig braucht Mehl, Wasser und eine warme Temperatur zum Gären."
+    filler = "Danke fürs Zuschauen und bis zum nächsten Mal."
+    transcript = " ".join(
+        [topic] + [f"Schritt {i}: Sauerteig füttern mit Mehl und Wasser." for i in range(60)]
+        + [filler] * 40
+    )
+
+    digest = make_digest(transcript, token_budget=60)
+
+    assert estimate_tokens(transcript) > 10 * estimate_tokens(digest)
+    assert estimate_tokens(digest) <= 60
+    assert digest.startswith(topic)
+    assert digest.count(filler) <= 1
+
+
+def test_combine_video_digests_fetches_only_new_videos():
+    """Tests that a repeated run only loads the transcripts of new videos."""
+    from src.helpers import digest_helper
+
+    transcripts = {"v1": "Transkript eins", "v2": "", "v3": "Transkript drei"}
+    with patch.object(
+        digest_helper, "get_transcript", side_effect=transcripts.get
+    ) as get_transcript:
+        first = digest_helper.combine_video_digests(
+            [Video(video_id="v1", title="Eins"), Video(video_id="v2", title="Zwei")]
+        )
+        second = digest_helper.combine_video_digests(
+            [
+                {"video_id": "v3", "title": "Drei"},
+                {"video_id": "v1", "title": "Eins"},
+                {"video_id": "v2", "title": "Zwei"},
+            ]
+        )
+
+    assert first == ["Titel: Eins\nTranskript: Transkript eins\nVideo-ID: v1\n"]
+    assert second == [
+        "Titel: Drei\nTranskript: Transkript drei\nVideo-ID: v3\n",
+        "Titel: Eins\nTranskript: Transkript eins\nVideo-ID: v1\n",
+    ]
+    assert sorted(c.args[0] for c in get_transcript.call_args_list) == ["v1", "v2", "v3"]
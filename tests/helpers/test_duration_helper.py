@@ -0,0 +1,36 @@
+import numpy as np
+
+DURATIONS = {
+    "PT1H2M3S": 3723,
+    "PT5S": 5,
+    "PT10M": 600,
+    "P1DT12H30M5S": 131405,
+    "P1W": 604800,
+    "P0D": 0,
+    "PT1.5S": 1,
+    "pt2m": 120,
+    "PT": 0,
+    "P1Y": 0,
+    "Invalid": 0,
+    "": 0,
+    None: 0,
+}
+
+
+def test_parse_iso_duration():
+    """Tests that hours, days and weeks count and invalid values become 0."""
+    from src.helpers.duration_helper import parse_iso_duration
+
+    for value, seconds in DURATIONS.items():
+        assert parse_iso_duration(value) == seconds, value
+
+
+def test_parse_iso_durations_matches_single_parser():
+    """Tests that the bulk parser gives the same seconds in input order."""
+    from src.helpers.duration_helper import parse_iso_durations
+
+    durations = parse_iso_durations(list(DURATIONS))
+
+    assert durations.dtype == np.int64
+    assert durations.tolist() == list(DURATIONS.values())
+    assert parse_iso_durations([]).tolist() == []
@@ -0,0 +1,94 @@
+from unittest.mock import MagicMock, patch
+
+ENTRY = (
+    "<entry><yt:videoId>{video_id}</yt:videoId>"
+    '<link rel="alternate" href="https://www.youtube.com/watch?v={video_id}"/>'
+    "</entry>"
+)
+FEED = (
+    '<?xml version="1.0" encoding="UTF-8"?>'
+    '<feed xmlns:yt="http://www.youtube.com/xml/schemas/2015" '
+    'xmlns="http://www.w3.org/2005/Atom"><title>Kanal</title>{entries}</feed>'
+)
+
+
+def make_feed(video_ids):
+    entries = "".join(ENTRY.format(video_id=video_id) for video_id in video_ids)
+    return FEED.format(entries=entries).encode("utf-8")
+
+
+def make_response(status_code, body=b"", headers=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.iter_content.side_effect = lambda chunk_size: (
+        body[i : i + chunk_size] for i in range(0, len(body), chunk_size)
+    )
+    return response
+
+
+def test_parse_feed_video_ids_stops_after_max_videos():
+    """Tests that parsing stops early and leaves the remaining chunks unread."""
+    from src.helpers.feed_helper import parse_feed_video_ids
+
+    body = make_feed([f"vid{i:08d}" for i in range(15)])
+    chunks = iter([body[i : i + 64] for i in range(0, len(body), 64)])
+
+    video_ids, truncated = parse_feed_video_ids(chunks, 2)
+
+    assert video_ids == ["vid00000000", "vid00000001"]
+    assert truncated is True
+    assert next(chunks, None) is not None
+
+
+def test_parse_feed_video_ids_reads_short_feed_completely():
+    """Tests feeds with fewer entries and the fallback to the watch link."""
+    from src.helpers.feed_helper import parse_feed_video_ids
+
+    body = make_feed(["vid00000001"]).replace(
+        b"<yt:videoId>vid00000001</yt:videoId>", b""
+    )
+
+    assert parse_feed_video_ids([body], 5) == (["vid00000001"], False)
+
+
+def test_fetch_channel_video_ids_sends_validators_and_handles_304():
+    """Tests the conditional request and the 304 short-circuit."""
+    from src.helpers import feed_helper
+
+    body = make_feed(["vid00000001", "vid00000002", "vid00000003"])
+    session = MagicMock()
+    session.get.side_effect = [
+        make_response(200, body, {"ETag": '"abc"', "Last-Modified": "Mon"}),
+        make_response(304),
+    ]
+
+    with patch.object(feed_helper, "_session", session):
+        first = feed_helper.fetch_channel_video_ids("UC1", max_videos=2)
+        second = feed_helper.fetch_channel_video_ids("UC1", max_videos=2)
+
+    assert first == second == ["vid00000001", "vid00000002"]
+    assert session.get.call_args_list[0].kwargs["headers"] == {}
+    assert session.get.call_args_list[1].kwargs["headers"] == {
+        "If-None-Match": '"abc"',
+        "If-Modified-Since": "Mon",
+    }
+
+
+def test_fetch_channel_video_ids_refetches_when_more_videos_are_needed():
+    """Tests that a truncated parse is not reused for a larger max_videos."""
+    from src.helpers import feed_helper
+
+    body = make_feed(["vid00000001", "vid00000002", "vid00000003"])
+    session = MagicMock()
+    session.get.side_effect = [
+        make_response(200, body, {"ETag": '"abc"'}),
+        make_response(200, body, {"ETag": '"abc"'}),
+    ]
+
+    with patch.object(feed_helper, "_session", session):
+        feed_helper.fetch_channel_video_ids("UC1", max_videos=1)
+        video_ids = feed_helper.fetch_channel_video_ids("UC1", max_videos=5)
+
+    assert video_ids == ["vid00000001", "vid00000002", "vid00000003"]
+    assert session.get.call_args_list[1].kwargs["headers"] == {}
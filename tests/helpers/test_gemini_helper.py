@@ -340,3 +340,47 @@ def test_get_subscriptions_based_on_interests_api_error(
     )
 
     assert "Fehler beim Erzeugen der Empfehlung: API Error" in filtered_channels
+
+
+@patch("src.helpers.gemini_helper.ai_embedding_batch_size", 2)
+@patch("src.helpers.gemini_helper.ai_client")
+def test_get_embeddings_batches(mock_client_instance):
+    """Tests that texts are embedded in batches and returned in order."""
+    from src.helpers.gemini_helper import get_embeddings
+
+    def embed_side_effect(model, contents, config):
+        response = MagicMock()
+        response.embeddings = [MagicMock(values=[float(len(text))]) for text in contents]
+        return response
+
+    mock_client_instance.models.embed_content.side_effect = embed_side_effect
+
+    embeddings = get_embeddings(["a", "bb", "ccc"])
+
+    assert embeddings == [[1.0], [2.0], [3.0]]
+    assert mock_client_instance.models.embed_content.call_count == 2
+
+
+@patch("src.helpers.gemini_helper.ai_client")
+def test_get_embeddings_api_error(mock_client_instance):
+    """Tests that API errors are reported as None."""
+    from src.helpers.gemini_helper import get_embeddings
+
+    mock_client_instance.models.embed_content.side_effect = Exception("API Error")
+
+    assert get_embeddings(["a"]) is None
+
+
+@patch("src.helpers.gemini_helper.get_api_key", return_value="fake_gemini_key")
+def test_reload_client(mock_get_api_key):
+    """Tests that reload_client swaps the module-level client."""
+    import src.helpers.gemini_helper as gemini_helper
+
+    new_client = MagicMock(name="NewClient")
+    with patch("src.helpers.gemini_helper.ai_client"), patch(
+        "src.helpers.gemini_helper.genai.Client", return_value=new_client
+    ) as mock_client_class:
+        gemini_helper.reload_client("new_key")
+
+        mock_client_class.assert_called_once_with(api_key="new_key")
+        assert gemini_helper.ai_client is new_client
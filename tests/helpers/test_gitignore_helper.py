@@ -0,0 +1,43 @@
+from unittest.mock import patch
+
+
+def test_ensure_gitignored_reads_file_once(tmp_path):
+    """Tests that known entries are answered from memory without file access."""
+    from src.helpers.gitignore_helper import ensure_gitignored
+
+    gitignore_path = tmp_path / ".gitignore"
+    gitignore_path.write_text("*.log\nwatch_later.csv\n", encoding="utf-8")
+
+    assert ensure_gitignored(["watch_later.csv"], str(gitignore_path)) == []
+    with patch("builtins.open") as mock_open, patch("os.path.isfile") as mock_isfile:
+        for _ in range(10):
+            assert ensure_gitignored(["watch_later.csv", "*.log"], str(gitignore_path)) == []
+    mock_open.assert_not_called()
+    mock_isfile.assert_not_called()
+
+
+def test_ensure_gitignored_appends_missing_entries_in_one_write(tmp_path):
+    """Tests that all missing entries are added together and only once."""
+    from src.helpers.gitignore_helper import ensure_gitignored
+
+    gitignore_path = tmp_path / ".gitignore"
+    gitignore_path.write_text("*.log\n", encoding="utf-8")
+    entries = ["feedback.csv", "*.log", "user_data/alice/interests.txt", "user_data/bob/feedback.csv"]
+
+    assert ensure_gitignored(entries, str(gitignore_path)) == ["feedback.csv", "user_data/"]
+    assert ensure_gitignored(entries, str(gitignore_path)) == []
+    assert gitignore_path.read_text(encoding="utf-8") == "*.log\n\nfeedback.csv\nuser_data/\n"
+
+
+def test_ensure_gitignored_uses_registry(tmp_path):
+    """Tests that registered data files are ignored by a call without entries."""
+    from src.helpers import gitignore_helper
+
+    gitignore_path = tmp_path / ".gitignore"
+    with patch.object(gitignore_helper, "MANAGED_FILES", []):
+        gitignore_helper.register_data_files("cache.db*", "watch_later.csv", "cache.db*")
+        assert gitignore_helper.ensure_gitignored(gitignore_path=str(gitignore_path)) == [
+            "cache.db*",
+            "watch_later.csv",
+        ]
+    assert gitignore_path.read_text(encoding="utf-8") == "cache.db*\nwatch_later.csv\n"
@@ -0,0 +1,70 @@
+import datetime as dt
+from unittest.mock import patch
+
+from src.helpers.video_helper import Video
+
+
+def make_video(video_id, day):
+    return Video(video_id=video_id, upload_date=dt.datetime(2025, 4, day))
+
+
+def test_ingest_channel_enriches_only_new_videos():
+    """Tests that known videos are neither enriched nor fetched again."""
+    from src.helpers import ingest_helper
+
+    videos = {"v1": make_video("v1", 1), "v2": make_video("v2", 2)}
+    with patch.object(
+        ingest_helper, "fetch_channel_video_ids", return_value=["v2", "v1"]
+    ), patch.object(
+        ingest_helper, "get_video_data_dlp", side_effect=videos.get
+    ) as get_video_data_dlp, patch.object(
+        ingest_helper, "get_transcript", return_value="Transkript"
+    ) as get_transcript:
+        first = ingest_helper.ingest_channel("UC1", max_videos=2)
+        second = ingest_helper.ingest_channel("UC1", max_videos=2)
+
+    assert (first.new_videos, first.transcripts) == (2, 2)
+    assert (second.new_videos, second.transcripts) == (0, 0)
+    assert get_video_data_dlp.call_count == 2
+    assert get_transcript.call_count == 2
+
+
+def test_ingest_channels_skips_failing_channels():
+    """Tests that one failing feed does not stop the cycle."""
+    from src.helpers import ingest_helper
+
+    def fetch(channel_id, max_videos, db_path=None):
+        if channel_id == "UCbroken":
+            raise OSError("offline")
+        return ["v1"]
+
+    with patch.object(
+        ingest_helper, "fetch_channel_video_ids", side_effect=fetch
+    ), patch.object(
+        ingest_helper, "get_video_data_dlp", return_value=make_video("v1", 1)
+    ):
+        stats = ingest_helper.ingest_channels(
+            ["UC1", "UCbroken"], max_videos=1, fetch_transcripts=False
+        )
+
+    assert (stats.channels, stats.failed_channels, stats.new_videos) == (2, 1, 1)
+
+
+def test_load_ingested_videos_reports_missing_and_stale_channels():
+    """Tests reading the store, the per-channel limit and the staleness check."""
+    from src.helpers import ingest_helper
+    from src.helpers.cache_helper import store_ingested_videos
+
+    store_ingested_videos(
+        "UC1", [make_video("v1", 1), make_video("v2", 3), make_video("v3", 2)], keep=2
+    )
+
+    videos, missing = ingest_helper.load_ingested_videos(["UC1", "UC2"], max_videos=5)
+    assert [video.video_id for video in videos] == ["v2", "v3"]
+    assert missing == ["UC2"]
+
+    videos, _ = ingest_helper.load_ingested_videos(["UC1"], max_videos=1)
+    assert [video.video_id for video in videos] == ["v2"]
+
+    with patch("src.helpers.cache_helper.time.time", return_value=10**12):
+        assert ingest_helper.load_ingested_videos(["UC1"], 5) == ([], ["UC1"])
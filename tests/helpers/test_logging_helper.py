@@ -0,0 +1,81 @@
+import logging
+
+import pytest
+
+from src.helpers import logging_helper
+from src.helpers.logging_helper import (
+    LOGGER_NAME,
+    configure_logging,
+    get_logger,
+    log_sampled,
+    reset_sampling,
+)
+
+
+@pytest.fixture(autouse=True)
+def restore_logging(monkeypatch):
+    """Reconfigures the package logger after each test from a clean environment."""
+    monkeypatch.delenv("LOG_LEVEL", raising=False)
+    monkeypatch.delenv("LOG_SAMPLE_EVERY", raising=False)
+    reset_sampling()
+    yield
+    monkeypatch.delenv("LOG_LEVEL", raising=False)
+    configure_logging(force=True)
+    reset_sampling()
+
+
+def test_configure_logging_reads_level_from_env(monkeypatch):
+    monkeypatch.setenv("LOG_LEVEL", "debug")
+    logger = configure_logging(force=True)
+
+    assert logger.name == LOGGER_NAME
+    assert logger.level == logging.DEBUG
+    assert get_logger("src.helpers.youtube_helper").isEnabledFor(logging.DEBUG)
+
+
+def test_configure_logging_falls_back_on_invalid_level(monkeypatch):
+    monkeypatch.setenv("LOG_LEVEL", "LAUT")
+    logger = configure_logging(force=True)
+
+    assert logger.level == logging.WARNING
+
+
+def test_configure_logging_keeps_a_single_handler():
+    configure_logging(force=True)
+    logger = configure_logging(force=True)
+
+    handlers = [h for h in logger.handlers if isinstance(h, logging_helper._PackageHandler)]
+    assert len(handlers) == 1
+    assert logger.propagate is False
+
+
+def test_disabled_debug_skips_payload_formatting(monkeypatch):
+    monkeypatch.setenv("LOG_LEVEL", "WARNING")
+    configure_logging(force=True)
+
+    class Payload:
+        formatted = False
+
+        def __str__(self):
+            Payload.formatted = True
+            return "payload"
+
+    logger = get_logger("src.test")
+    logger.debug("Antwort: %s", Payload())
+    log_sampled(logger, logging.DEBUG, "test", "Antwort: %s", Payload())
+
+    assert Payload.formatted is False
+
+
+def test_log_sampled_logs_every_nth_occurrence(monkeypatch):
+    monkeypatch.setenv("LOG_LEVEL", "DEBUG")
+    logger = get_logger("src.test")
+    configure_logging(force=True)
+    records = []
+    monkeypatch.setattr(logger, "handle", records.append)
+
+    for i in range(7):
+        log_sampled(logger, logging.DEBUG, "loop", "Item %d", i, every=3)
+
+    assert [record.getMessage() for record in records] == ["Item 0", "Item 3", "Item 6"]
+    assert [record.sample_count for record in records] == [1, 4, 7]
@@ -0,0 +1,61 @@
+import itertools
+
+import numpy as np
+
+from src.helpers.planner_helper import MAX_DP_CELLS, interest_values, plan_watch_time
+
+
+def _best_total(durations, scores, free_time_s):
+    best = 0.0
+    for size in range(len(durations) + 1):
+        for subset in itertools.combinations(range(len(durations)), size):
+            minutes = sum(-(-durations[i] // 60) for i in subset)
+            if minutes <= free_time_s // 60:
+                best = max(best, sum(scores[i] for i in subset))
+    return best
+
+
+def test_plan_watch_time_is_optimal():
+    rng = np.random.default_rng(7)
+    for _ in range(50):
+        durations = rng.integers(60, 1800, 7)
+        scores = rng.random(7) + 0.01
+        free_time_s = int(rng.integers(0, 4000))
+
+        chosen = plan_watch_time(durations, scores, free_time_s)
+
+        assert np.ceil(durations[chosen] / 60).sum() <= free_time_s // 60
+        assert np.isclose(
+            scores[chosen].sum(), _best_total(durations, scores, free_time_s)
+        )
+
+
+def test_plan_watch_time_prefers_value_over_count():
+    durations = np.array([600, 600, 1200])
+    scores = np.array([0.1, 0.1, 1.0])
+
+    assert list(plan_watch_time(durations, scores, 1200)) == [2]
+
+
+def test_plan_watch_time_skips_unknown_durations_and_empty_budget():
+    durations = np.array([0, 300])
+    scores = np.array([1.0, 0.5])
+
+    assert list(plan_watch_time(durations, scores, 600)) == [1]
+    assert list(plan_watch_time(durations, scores, 0)) == []
+
+
+def test_plan_watch_time_greedy_fallback(monkeypatch):
+    monkeypatch.setattr("src.helpers.planner_helper.MAX_DP_CELLS", 1)
+    durations = np.array([180, 240, 300])
+    scores = np.array([1.0, 1.0, 3.0])
+
+    assert list(plan_watch_time(durations, scores, 480)) == [0, 2]
+    assert MAX_DP_CELLS > 1
+
+
+def test_interest_values():
+    assert list(interest_values(None, 2)) == [1.0, 1.0]
+    assert list(interest_values([0.5, 0.5], 2)) == [1.0, 1.0]
+    values = interest_values([0.2, 0.6, 0.4], 3)
+    assert np.allclose(values, [0.05, 1.05, 0.55])
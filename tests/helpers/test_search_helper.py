@@ -0,0 +1,61 @@
+from unittest.mock import MagicMock, patch
+
+from src.helpers.video_helper import Video
+
+
+def test_load_search_page_api_follows_cached_tokens():
+    """Tests that deep API pages reuse the tokens of cached earlier pages."""
+    from src.helpers import search_helper
+
+    responses = {
+        None: ([Video(video_id="a1", place=1), Video(video_id="a2", place=2)], "tok2"),
+        "tok2": ([Video(video_id="b1", place=1)], "tok3"),
+        "tok3": ([Video(video_id="c1", place=1)], None),
+    }
+    youtube = MagicMock()
+    with patch.object(
+        search_helper,
+        "search_videos_page",
+        side_effect=lambda youtube, query, max_results, page_token: responses[page_token],
+    ) as search_videos_page:
+        first = search_helper.load_search_page("ki", 1, youtube)
+        third = search_helper.load_search_page("ki", 3, youtube)
+        again = search_helper.load_search_page("ki", 2, youtube)
+
+    assert [video.video_id for video in first.videos] == ["a1", "a2"]
+    assert first.has_more
+    assert [video.video_id for video in third.videos] == ["c1"]
+    assert third.videos[0].place == 2 * search_helper.SEARCH_PAGE_SIZE + 1
+    assert not third.has_more
+    assert [video.video_id for video in again.videos] == ["b1"]
+    assert [c.kwargs["page_token"] for c in search_videos_page.call_args_list] == [
+        None,
+        "tok2",
+        "tok3",
+    ]
+
+
+def test_load_search_page_dlp_slices_results():
+    """Tests that yt-dlp pages are loaded as slices and cached by query and page."""
+    from src.helpers import search_helper
+
+    size = search_helper.SEARCH_PAGE_SIZE
+
+    def search_range(query, start, end):
+        return [Video(video_id=f"v{i}", place=i) for i in range(start, min(end, 30) + 1)]
+
+    with patch.object(
+        search_helper, "search_videos_dlp_range", side_effect=search_range
+    ) as search_videos_dlp_range:
+        first = search_helper.load_search_page("ki", 1)
+        second = search_helper.prefetch_search_page("ki", 2).result()
+        cached = search_helper.load_search_page("ki", 2)
+
+    assert len(first.videos) == size and first.has_more
+    assert [video.place for video in second.videos] == list(range(size + 1, 31))
+    assert not second.has_more
+    assert cached == second
+    assert [c.args for c in search_videos_dlp_range.call_args_list] == [
+        ("ki", 1, size),
+        ("ki", size + 1, 2 * size),
+    ]
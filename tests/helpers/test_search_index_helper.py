@@ -0,0 +1,106 @@
+import datetime as dt
+
+
+MOCK_VIDEOS = [
+    {
+        "video_id": "vid1",
+        "title": "Machine Learning Grundlagen",
+        "channel_name": "KI Kanal",
+        "tags": "ki, python",
+        "thumbnail": "thumb1",
+        "length": "12:30",
+        "views": 1000,
+        "upload_date": dt.datetime(2024, 1, 10),
+    },
+    {
+        "video_id": "vid2",
+        "title": "Kochen für Anfänger",
+        "channel_name": "Küchen Kanal",
+        "tags": "Keine Tags",
+        "thumbnail": "thumb2",
+        "length": "08:00",
+        "views": 50,
+        "upload_date": None,
+    },
+]
+
+
+def test_index_and_search_by_title(tmp_path):
+    """Tests that indexed videos are found by words from their title."""
+    from src.helpers.search_index_helper import index_videos, search_local_index
+
+    db_path = str(tmp_path / "index.db")
+    assert index_videos(MOCK_VIDEOS, db_path=db_path) == 2
+
+    results = search_local_index("machine", db_path=db_path)
+
+    assert len(results) == 1
+    assert results[0]["video_id"] == "vid1"
+    assert results[0]["place"] == 1
+    assert results[0]["channel_name"] == "KI Kanal"
+    assert results[0]["length"] == "12:30"
+    assert results[0]["upload_date"] == dt.datetime(2024, 1, 10)
+
+
+def test_search_channel_tags_and_diacritics(tmp_path):
+    """Tests matching on channel names, tags and accent-insensitive input."""
+    from src.helpers.search_index_helper import index_videos, search_local_index
+
+    db_path = str(tmp_path / "index.db")
+    index_videos(MOCK_VIDEOS, db_path=db_path)
+
+    assert [v["video_id"] for v in search_local_index("python", db_path=db_path)] == [
+        "vid1"
+    ]
+    assert [v["video_id"] for v in search_local_index("kuchen", db_path=db_path)] == [
+        "vid2"
+    ]
+    assert search_local_index("vid2", db_path=db_path) == []
+    no_tags = search_local_index("kochen", db_path=db_path)[0]
+    assert no_tags["tags"] == "Keine Tags"
+    assert no_tags["upload_date"] is None
+
+
+def test_transcript_is_searchable_and_keeps_metadata(tmp_path):
+    """Tests that a transcript update merges with existing metadata."""
+    from src.helpers.search_index_helper import (
+        index_videos,
+        index_transcript,
+        get_indexed_transcript,
+        search_local_index,
+    )
+
+    db_path = str(tmp_path / "index.db")
+    index_videos(MOCK_VIDEOS, db_path=db_path)
+    index_transcript("vid1", "Heute erklären wir neuronale Netze", db_path=db_path)
+
+    results = search_local_index("neuronale netze", db_path=db_path)
+    assert len(results) == 1
+    assert results[0]["title"] == "Machine Learning Grundlagen"
+    assert get_indexed_transcript("vid1", db_path=db_path) == (
+        "Heute erklären wir neuronale Netze"
+    )
+
+    index_videos([{"video_id": "vid1", "title": "Neuer Titel"}], db_path=db_path)
+    assert get_indexed_transcript("vid1", db_path=db_path) != ""
+    assert search_local_index("machine", db_path=db_path) == []
+    assert search_local_index("neuer", db_path=db_path)[0]["channel_name"] == (
+        "KI Kanal"
+    )
+
+
+def test_search_ignores_fts_syntax(tmp_path):
+    """Tests that user input with FTS5 operators does not raise."""
+    from src.helpers.search_index_helper import (
+        index_videos,
+        search_local_index,
+        get_indexed_transcript,
+    )
+
+    db_path = str(tmp_path / "index.db")
+    index_videos(MOCK_VIDEOS, db_path=db_path)
+
+    results = search_local_index('machine" (*', db_path=db_path)
+    assert results[0]["video_id"] == "vid1"
+    assert search_local_index("   ", db_path=db_path) == []
+    assert get_indexed_transcript("does_not_exist", db_path=db_path) == ""
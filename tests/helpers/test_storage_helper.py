@@ -0,0 +1,97 @@
+import csv
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+HEADER = ["video_id", "title"]
+
+
+def read_rows(path):
+    with open(path, newline="", encoding="utf-8") as file:
+        return list(csv.reader(file))
+
+
+def test_append_csv_rows_from_many_threads(tmp_path):
+    """Tests that concurrent appends keep every row and write one header."""
+    from src.helpers.storage_helper import append_csv_rows
+
+    path = str(tmp_path / "watch_later.csv")
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        list(
+            executor.map(
+                lambda i: append_csv_rows(path, HEADER, [{"video_id": f"v{i}", "title": "T"}]),
+                range(200),
+            )
+        )
+
+    rows = read_rows(path)
+    assert rows[0] == HEADER
+    assert sorted(row[0] for row in rows[1:]) == sorted(f"v{i}" for i in range(200))
+
+
+def test_append_new_csv_rows_skips_existing_rows(tmp_path):
+    """Tests that rows already in the file are not appended again."""
+    from src.helpers.storage_helper import append_new_csv_rows
+
+    path = str(tmp_path / "history.csv")
+    assert append_new_csv_rows(path, HEADER, [["v1", "A"], ["v2", "B"]]) == [
+        ["v1", "A"],
+        ["v2", "B"],
+    ]
+    assert append_new_csv_rows(path, HEADER, [["v2", "B"], ["v3", "C"], ["v3", "C"]]) == [
+        ["v3", "C"]
+    ]
+    assert read_rows(path) == [HEADER, ["v1", "A"], ["v2", "B"], ["v3", "C"]]
+
+
+def test_rewrite_csv_is_atomic(tmp_path):
+    """Tests that a failing rewrite leaves the old file and no temporary files."""
+    from src.helpers.storage_helper import rewrite_csv
+
+    path = str(tmp_path / "watch_later.csv")
+    with open(path, "w", newline="", encoding="utf-8") as file:
+        csv.writer(file).writerows([HEADER, ["v1", "A"], ["v2", "B"]])
+
+    rewrite_csv(path, HEADER, lambda rows: [r for r in rows if r["video_id"] != "v1"])
+    assert read_rows(path) == [HEADER, ["v2", "B"]]
+
+    def fail(rows):
+        raise RuntimeError("abgebrochen")
+
+    with pytest.raises(RuntimeError):
+        rewrite_csv(path, HEADER, fail)
+    assert read_rows(path) == [HEADER, ["v2", "B"]]
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".tmp")]
+
+
+def test_file_lock_is_reentrant(tmp_path):
+    """Tests that nested locks of one thread do not deadlock."""
+    from src.helpers.storage_helper import append_new_csv_rows, file_lock
+
+    path = str(tmp_path / "history.csv")
+    with file_lock(path):
+        with file_lock(path, shared=True):
+            append_new_csv_rows(path, HEADER, [["v1", "A"]])
+    assert read_rows(path) == [HEADER, ["v1", "A"]]
+
+
+def test_debounced_writer_writes_last_content_once(tmp_path):
+    """Tests that only the last scheduled content is written after the delay."""
+    import time
+
+    from src.helpers.storage_helper import DebouncedWriter
+
+    path = str(tmp_path / "interests.txt")
+    writer = DebouncedWriter(delay=0.05)
+    writer.schedule(path, "KI")
+    writer.schedule(path, "KI, Sport")
+    assert writer.pending(path) == "KI, Sport"
+
+    deadline = time.monotonic() + 5
+    while not os.path.exists(path) and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    with open(path, encoding="utf-8") as file:
+        assert file.read() == "KI, Sport"
+    assert writer.pending(path) is None
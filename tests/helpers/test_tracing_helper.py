@@ -0,0 +1,135 @@
+import json
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def fresh_traces(monkeypatch):
+    from src.helpers.tracing_helper import clear_traces
+
+    monkeypatch.delenv("TRACING", raising=False)
+    monkeypatch.delenv("TRACE_EXPORT_FILE", raising=False)
+    monkeypatch.delenv("OTEL_EXPORTER_OTLP_ENDPOINT", raising=False)
+    clear_traces()
+    yield
+    clear_traces()
+
+
+def test_nested_spans_form_one_trace():
+    """Tests parent/child relations, attributes and the traced decorator."""
+    from src.helpers.tracing_helper import get_recent_traces, set_attribute, span, traced
+
+    @traced("inner", quota_units=1)
+    def inner():
+        set_attribute("video_count", 3)
+
+    with span("outer", tab="trending"):
+        inner()
+        inner()
+
+    traces = get_recent_traces()
+    assert len(traces) == 1
+    spans = {s.name: s for s in traces[0]}
+    inner_spans = [s for s in traces[0] if s.name == "inner"]
+    assert len(inner_spans) == 2
+    assert all(s.parent_id == spans["outer"].span_id for s in inner_spans)
+    assert all(s.trace_id == spans["outer"].trace_id for s in inner_spans)
+    assert inner_spans[0].attributes == {"quota_units": 1, "video_count": 3}
+    assert spans["outer"].duration_ms >= inner_spans[0].duration_ms
+
+
+def test_span_marks_errors():
+    """Tests that exceptions fail the span and are re-raised."""
+    from src.helpers.tracing_helper import STATUS_ERROR, get_recent_traces, span
+
+    with pytest.raises(ValueError):
+        with span("failing"):
+            raise ValueError("kaputt")
+
+    failed = get_recent_traces()[0][0]
+    assert failed.status_code == STATUS_ERROR
+    assert "kaputt" in failed.status_message
+
+
+def test_continue_trace_in_worker_threads():
+    """Tests that spans in executor threads stay children of the creating span."""
+    from concurrent.futures import ThreadPoolExecutor
+    from src.helpers.tracing_helper import continue_trace, get_recent_traces, span
+
+    def work():
+        with span("worker"):
+            pass
+
+    with span("root") as root:
+        with ThreadPoolExecutor(max_workers=2, initializer=continue_trace()) as executor:
+            list(executor.map(lambda _: work(), range(3)))
+
+    trace = get_recent_traces()[0]
+    workers = [s for s in trace if s.name == "worker"]
+    assert len(workers) == 3
+    assert all(worker.parent_id == root.span_id for worker in workers)
+
+
+def test_late_child_spans_do_not_reopen_traces(tmp_path, monkeypatch):
+    """Tests that spans of workers outliving their root are kept with the trace only."""
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+    from src.helpers import tracing_helper
+    from src.helpers.tracing_helper import continue_trace, get_recent_traces, span
+
+    export_file = tmp_path / "traces.jsonl"
+    monkeypatch.setenv("TRACE_EXPORT_FILE", str(export_file))
+    root_finished = threading.Event()
+
+    def work():
+        root_finished.wait(timeout=5)
+        with span("late"):
+            pass
+
+    with span("root"):
+        executor = ThreadPoolExecutor(max_workers=2, initializer=continue_trace())
+        futures = [executor.submit(work) for _ in range(2)]
+    root_finished.set()
+    for future in futures:
+        future.result()
+    executor.shutdown()
+    tracing_helper._export_executor.submit(lambda: None).result()
+
+    assert tracing_helper._open_traces == {}
+    (trace,) = get_recent_traces()
+    assert sorted(s.name for s in trace) == ["late", "late", "root"]
+    exported = [json.loads(line) for line in export_file.read_text().splitlines()]
+    assert len(exported) == 3
+
+
+def test_tracing_disabled(monkeypatch):
+    """Tests that no spans are recorded when TRACING is off."""
+    from src.helpers.tracing_helper import get_recent_traces, span
+
+    monkeypatch.setenv("TRACING", "0")
+    with span("ignored") as current:
+        assert current is None
+    assert get_recent_traces() == []
+
+
+def test_export_spans_to_file(tmp_path, monkeypatch):
+    """Tests the OTLP/JSON file export."""
+    from src.helpers.tracing_helper import export_spans, get_recent_traces, span
+
+    with span("root", video_count=2, cached=True):
+        with span("child"):
+            pass
+
+    export_file = tmp_path / "traces.jsonl"
+    monkeypatch.setenv("TRACE_EXPORT_FILE", str(export_file))
+    export_spans(get_recent_traces()[0])
+
+    payload = json.loads(export_file.read_text().splitlines()[0])
+    spans = payload["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    root = next(s for s in spans if s["name"] == "root")
+    child = next(s for s in spans if s["name"] == "child")
+    assert child["parentSpanId"] == root["spanId"]
+    assert "parentSpanId" not in root
+    assert len(root["traceId"]) == 32 and len(root["spanId"]) == 16
+    assert {"key": "video_count", "value": {"intValue": "2"}} in root["attributes"]
+    assert {"key": "cached", "value": {"boolValue": True}} in root["attributes"]
+    assert int(root["endTimeUnixNano"]) >= int(root["startTimeUnixNano"])
@@ -0,0 +1,54 @@
+from unittest.mock import MagicMock, patch
+
+from src.helpers.video_helper import Video
+
+
+def test_load_trending_videos_serves_latest_snapshot():
+    """Tests that repeated loads share one fetch per region."""
+    from src.helpers import trending_helper
+
+    videos = [Video(video_id="t1"), Video(video_id="t2")]
+    with patch.object(
+        trending_helper, "get_trending_videos_dlp", return_value=videos
+    ) as get_trending_videos_dlp:
+        first = trending_helper.load_trending_videos("DE")
+        second = trending_helper.load_trending_videos("DE")
+        trending_helper.load_trending_videos("US")
+
+    assert [video.video_id for video in first] == ["t1", "t2"]
+    assert [video.video_id for video in second] == ["t1", "t2"]
+    assert [c.args for c in get_trending_videos_dlp.call_args_list] == [("DE",), ("US",)]
+
+
+def test_load_trending_videos_falls_back_to_stale_snapshot(monkeypatch):
+    """Tests that a failed refresh shows the last snapshot instead of nothing."""
+    from src.helpers import trending_helper
+
+    youtube = MagicMock()
+    with patch.object(
+        trending_helper, "get_trending_videos", return_value=[Video(video_id="old")]
+    ):
+        trending_helper.load_trending_videos("GB", youtube)
+
+    monkeypatch.setattr(trending_helper, "trending_interval_s", lambda: 0)
+    with patch.object(
+        trending_helper, "get_trending_videos", side_effect=OSError("offline")
+    ) as get_trending_videos:
+        videos = trending_helper.load_trending_videos("GB", youtube)
+
+    get_trending_videos.assert_called_once_with(youtube, "GB")
+    assert [video.video_id for video in videos] == ["old"]
+
+
+def test_refresh_trending_regions_skips_fresh_snapshots(monkeypatch):
+    """Tests that the worker only refreshes regions whose snapshot is due."""
+    from src.helpers import trending_helper
+
+    monkeypatch.setenv("TRENDING_REGIONS", "de, us,xyz")
+    with patch.object(
+        trending_helper, "get_trending_videos_dlp", return_value=[Video(video_id="t1")]
+    ) as get_trending_videos_dlp:
+        assert trending_helper.refresh_trending_regions() == 2
+        assert trending_helper.refresh_trending_regions() == 0
+
+    assert get_trending_videos_dlp.call_count == 2
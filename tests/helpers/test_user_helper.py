@@ -0,0 +1,43 @@
+import os
+from unittest.mock import MagicMock, patch
+
+
+def test_user_path_keeps_default_user_files_in_place(tmp_path, monkeypatch):
+    """Tests the legacy layout for the default user and directories for others."""
+    from src.helpers.user_helper import DEFAULT_USER, USER_DATA_DIR, user_path
+
+    monkeypatch.chdir(tmp_path)
+
+    assert user_path("watch_later.csv", DEFAULT_USER) == "watch_later.csv"
+    path = user_path("watch_later.csv", "anna")
+    assert path == os.path.join(USER_DATA_DIR, "anna", "watch_later.csv")
+    assert os.path.isdir(os.path.dirname(path))
+
+
+def test_get_user_id_prefers_login_over_query_parameter():
+    """Tests resolving the user from st.user, the query parameter and the default."""
+    from src.helpers import user_helper
+
+    def resolve(logged_in, query_params):
+        fake_st = MagicMock()
+        fake_st.session_state = {}
+        fake_st.user.is_logged_in = logged_in
+        fake_st.user.get.side_effect = {"email": "Anna@Example.org"}.get
+        fake_st.query_params = query_params
+        with patch.object(user_helper, "st", fake_st):
+            return user_helper.get_user_id()
+
+    assert resolve(True, {"user": "bob"}) == user_helper.user_id_from_identity(
+        "anna@example.org"
+    )
+    assert resolve(False, {"user": "bob"}) == "bob"
+    assert resolve(False, {"user": "../etc"}) == user_helper.DEFAULT_USER
+    assert resolve(False, {}) == user_helper.DEFAULT_USER
+
+
+def test_gitignore_entry_covers_user_directory():
+    """Tests that per-user files map to one .gitignore entry."""
+    from src.helpers.user_helper import gitignore_entry
+
+    assert gitignore_entry(os.path.join("user_data", "anna", "x.csv")) == "user_data/"
+    assert gitignore_entry("watch_later.csv") == "watch_later.csv"
@@ -0,0 +1,84 @@
+import numpy as np
+import pytest
+from unittest.mock import MagicMock
+
+
+def test_upsert_and_top_k():
+    """Tests cosine ranking with several query vectors."""
+    from src.helpers.vector_index_helper import VectorIndex
+
+    index = VectorIndex()
+    index.upsert(
+        ["a", "b", "c"],
+        ["text a", "text b", "text c"],
+        [[1.0, 0.0], [0.0, 2.0], [1.0, 1.0]],
+    )
+
+    assert len(index) == 3
+    assert index.dirty
+    results = index.top_k([[1.0, 0.0]], 2)
+    assert [key for key, _ in results] == ["a", "c"]
+    assert results[0][1] == pytest.approx(1.0)
+    assert results[1][1] == pytest.approx(np.sqrt(0.5))
+    top_for_both = [key for key, _ in index.top_k([[1.0, 0.0], [0.0, 1.0]], 2)]
+    assert sorted(top_for_both) == ["a", "b"]
+    assert [key for key, _ in index.top_k([[0.0, 1.0]], 5, keys=["a", "c", "x"])] == [
+        "c",
+        "a",
+    ]
+
+
+def test_upsert_replaces_changed_rows():
+    """Tests that an existing key is overwritten instead of duplicated."""
+    from src.helpers.vector_index_helper import VectorIndex
+
+    index = VectorIndex()
+    index.upsert(["a"], ["old"], [[1.0, 0.0]])
+    assert index.stale_keys({"a": "old", "b": "new"}) == ["b"]
+    assert index.stale_keys({"a": "changed"}) == ["a"]
+
+    index.upsert(["a"], ["changed"], [[0.0, 1.0]])
+    assert len(index) == 1
+    np.testing.assert_allclose(index.matrix[0], [0.0, 1.0])
+
+    with pytest.raises(ValueError):
+        index.upsert(["b"], ["b"], [[1.0, 0.0, 0.0]])
+
+
+def test_save_and_load_roundtrip(tmp_path):
+    """Tests persisting the index as an .npz archive."""
+    from src.helpers.vector_index_helper import VectorIndex
+
+    path = str(tmp_path / "index.npz")
+    index = VectorIndex()
+    index.upsert(["a", "b"], ["text a", "text b"], [[3.0, 4.0], [0.0, 1.0]])
+    index.save(path)
+    assert not index.dirty
+
+    loaded = VectorIndex.load(path)
+    assert loaded.keys == ["a", "b"]
+    assert "b" in loaded
+    assert loaded.stale_keys({"a": "text a", "b": "text b"}) == []
+    np.testing.assert_allclose(loaded.matrix[0], [0.6, 0.8], rtol=1e-6)
+
+    assert len(VectorIndex.load(str(tmp_path / "missing.npz"))) == 0
+
+
+def test_update_vector_index_only_embeds_stale_texts():
+    """Tests that the embedding function is only called for new texts."""
+    from src.helpers.vector_index_helper import VectorIndex, update_vector_index
+
+    index = VectorIndex()
+    embed = MagicMock(
+        side_effect=lambda texts: [[1.0, float(i)] for i in range(len(texts))]
+    )
+
+    assert update_vector_index(index, {"a": "A", "b": "B"}, embed)
+    assert update_vector_index(index, {"a": "A", "b": "B", "c": "C"}, embed)
+
+    assert embed.call_args_list[0].args[0] == ["A", "B"]
+    assert embed.call_args_list[1].args[0] == ["C"]
+
+    failing_embed = MagicMock(return_value=None)
+    assert not update_vector_index(index, {"d": "D"}, failing_embed)
+    assert "d" not in index
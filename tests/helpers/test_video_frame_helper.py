@@ -0,0 +1,74 @@
+import datetime as dt
+
+from src.helpers.video_frame_helper import (
+    dedup_videos,
+    filter_by_duration,
+    frame_to_videos,
+    get_page,
+    page_count,
+    read_videos_csv,
+    sort_by_upload_date,
+    videos_to_frame,
+)
+from src.helpers.video_helper import Video
+
+VIDEOS = [
+    Video(video_id="a", duration_s=60, upload_date=dt.datetime(2024, 1, 1), place=1),
+    Video(video_id="b", duration_s=600, place=2),
+    Video(video_id="c", duration_s=3600, upload_date=dt.datetime(2024, 3, 1), place=3),
+    Video(video_id="a", duration_s=60, upload_date=dt.datetime(2024, 1, 1), place=4),
+]
+
+
+def test_frame_round_trip():
+    frame = videos_to_frame(VIDEOS)
+
+    assert list(frame["duration_s"]) == [60, 600, 3600, 60]
+    assert str(frame["duration_s"].dtype) == "int32"
+    assert frame_to_videos(frame) == VIDEOS
+    assert frame_to_videos(videos_to_frame([])) == []
+
+
+def test_sort_filter_and_dedup():
+    frame = dedup_videos(videos_to_frame(VIDEOS))
+
+    assert list(frame["video_id"]) == ["a", "b", "c"]
+    assert list(sort_by_upload_date(frame)["video_id"]) == ["c", "a", "b"]
+    assert list(filter_by_duration(frame, 120, 1200)["video_id"]) == ["b"]
+    assert list(filter_by_duration(frame, 120)["video_id"]) == ["b", "c"]
+
+
+def test_paging():
+    frame = videos_to_frame(Video(video_id=str(i)) for i in range(45))
+
+    assert page_count(len(frame), 20) == 3
+    assert page_count(0, 20) == 1
+    assert list(get_page(frame, 3, 20)["video_id"]) == [str(i) for i in range(40, 45)]
+
+
+def test_read_videos_csv(tmp_path):
+    path = tmp_path / "watch_later.csv"
+    path.write_text(
+        "title,channel_name,video_id,video_url,length,views,summarized_transcript\n"
+        "A,B,v1,u1,05:30,100,Kurz\n"
+        "A,B,v1,u1,05:30,100,Kurz\n"
+        "C,D,v2,u2,1:02:03,Unknown,\n",
+        encoding="utf-8",
+    )
+
+    frame = read_videos_csv(str(path))
+
+    assert list(frame["video_id"]) == ["v1", "v2"]
+    assert list(frame["duration_s"]) == [330, 3723]
+    assert list(frame["views"]) == [100, 0]
+    assert list(frame["summarized_transcript"]) == ["Kurz", ""]
+    assert frame_to_videos(frame)[0] == Video(
+        video_id="v1", title="A", channel_name="B", duration_s=330, views=100
+    )
+
+
+def test_read_videos_csv_without_rows(tmp_path):
+    path = tmp_path / "watch_later.csv"
+    path.write_text("title,channel_name,video_id\n", encoding="utf-8")
+
+    assert read_videos_csv(str(path)).empty
@@ -0,0 +1,78 @@
+import datetime as dt
+import pickle
+
+from src.helpers.video_helper import (
+    Video,
+    parse_count,
+    parse_length,
+    parse_upload_date,
+    sort_by_upload_date,
+    to_video,
+)
+
+
+def test_parse_count():
+    assert parse_count(12345) == 12345
+    assert parse_count("12345") == 12345
+    assert parse_count("12.345") == 12345
+    assert parse_count("Unknown") == 0
+    assert parse_count(None) == 0
+
+
+def test_parse_length():
+    assert parse_length(95) == 95
+    assert parse_length("01:35") == 95
+    assert parse_length("1:02:03") == 3723
+    assert parse_length("abc") == 0
+    assert parse_length(None) == 0
+
+
+def test_parse_upload_date_sources():
+    assert parse_upload_date("20230115") == dt.datetime(2023, 1, 15)
+    assert parse_upload_date("2023-10-27T11:00:00Z") == dt.datetime(2023, 10, 27, 11)
+    assert parse_upload_date("2023-10-27T13:00:00+02:00") == dt.datetime(
+        2023, 10, 27, 11
+    )
+    assert parse_upload_date(dt.datetime(2024, 1, 1)) == dt.datetime(2024, 1, 1)
+    assert parse_upload_date("Unknown") is None
+    assert parse_upload_date("") is None
+
+
+def test_from_mapping_normalizes_csv_row():
+    row = {
+        "title": "Titel",
+        "channel_name": "Kanal",
+        "video_id": "v1",
+        "video_url": "https://www.youtube.com/watch?v=v1",
+        "length": "05:30",
+        "views": "100",
+        "summarized_transcript": "Kurz",
+    }
+
+    video = Video.from_mapping(row)
+
+    assert video == Video(
+        video_id="v1", title="Titel", channel_name="Kanal", duration_s=330, views=100
+    )
+    assert to_video(video) is video
+
+
+def test_mapping_access_for_existing_callers():
+    video = Video(video_id="v1", title="Titel", duration_s=65, views=3)
+
+    assert video["title"] == "Titel"
+    assert video["length"] == "01:05"
+    assert video.get("views") == 3
+    assert video.get("summarized_transcript", "") == ""
+    assert "video_id" in video
+    assert "video_url" not in video
+    assert dict(video)["duration_s"] == 65
+
+
+def test_sort_by_upload_date_and_pickle():
+    old = Video(video_id="old", upload_date=dt.datetime(2020, 1, 1))
+    new = Video(video_id="new", upload_date=dt.datetime(2024, 1, 1))
+    unknown = Video(video_id="unknown")
+
+    assert sort_by_upload_date([unknown, old, new]) == [new, old, unknown]
+    assert pickle.loads(pickle.dumps(new)) == new
@@ -0,0 +1,55 @@
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+
+@pytest.fixture
+def worker_helper(monkeypatch):
+    from src.helpers import worker_helper
+
+    monkeypatch.setenv("INGEST_WORKER", "1")
+    monkeypatch.setattr(worker_helper, "_worker_process", None)
+    monkeypatch.setattr(worker_helper, "_last_check", 0.0)
+    return worker_helper
+
+
+def test_ensure_ingest_worker_starts_and_restarts_worker(worker_helper, tmp_path):
+    """Tests that the app starts the worker once and again after it exited."""
+    process = MagicMock(pid=4711)
+    process.poll.return_value = None
+    pid_file = str(tmp_path / "ingest_worker.pid")
+
+    with patch.object(
+        worker_helper.subprocess, "Popen", return_value=process
+    ) as mock_popen:
+        assert worker_helper.ensure_ingest_worker(pid_file)
+        worker_helper._last_check = 0.0
+        assert not worker_helper.ensure_ingest_worker(pid_file)
+
+        process.poll.return_value = 1
+        # Within the check interval nothing is checked.
+        assert not worker_helper.ensure_ingest_worker(pid_file)
+        worker_helper._last_check = 0.0
+        assert worker_helper.ensure_ingest_worker(pid_file)
+
+    assert mock_popen.call_count == 2
+    assert mock_popen.call_args.args[0][1:] == ["-m", "src.ingest_worker"]
+
+
+@pytest.mark.skipif(os.name == "nt", reason="PID probing is not used on Windows")
+def test_ensure_ingest_worker_respects_running_and_disabled_worker(
+    worker_helper, tmp_path, monkeypatch
+):
+    """Tests that a worker started by hand or INGEST_WORKER=0 prevent a start."""
+    pid_file = tmp_path / "ingest_worker.pid"
+    pid_file.write_text(str(os.getpid()))
+
+    with patch.object(worker_helper.subprocess, "Popen") as mock_popen:
+        assert not worker_helper.ensure_ingest_worker(str(pid_file))
+        worker_helper._last_check = 0.0
+        monkeypatch.setenv("INGEST_WORKER", "0")
+        pid_file.unlink()
+        assert not worker_helper.ensure_ingest_worker(str(pid_file))
+
+    mock_popen.assert_not_called()
@@ -6,6 +6,7 @@ import pandas as pd
 from unittest.mock import patch, MagicMock, mock_open, call, ANY
 from pathlib import Path
 from concurrent.futures import Future
+from src.helpers.video_helper import Video
 
 
 # === Mock Data ===
@@ -242,6 +243,26 @@ def test_search_videos_dlp(mock_yt_dlp_cls):
     assert videos[1]["length"] == "02:05"
 
 
+@patch("src.helpers.youtube_helper.yt_dlp.YoutubeDL")
+def test_search_videos_dlp_range(mock_yt_dlp_cls):
+    """Tests that a range of search results is extracted as a playlist slice."""
+    from src.helpers.youtube_helper import search_videos_dlp_range
+
+    mock_ydl_instance = MagicMock()
+    mock_yt_dlp_cls.return_value.__enter__.return_value = mock_ydl_instance
+    mock_ydl_instance.extract_info.return_value = MOCK_YT_DLP_SEARCH_RESULT
+
+    videos = search_videos_dlp_range("test query", 21, 40)
+
+    ydl_opts = mock_yt_dlp_cls.call_args.args[0]
+    assert (ydl_opts["playliststart"], ydl_opts["playlistend"]) == (21, 40)
+    mock_ydl_instance.extract_info.assert_called_once_with(
+        "ytsearch40:test query", download=False
+    )
+    assert [video.place for video in videos] == [21, 22]
+    assert search_videos_dlp_range("test query", 1001, 1020) == []
+
+
 @patch("googleapiclient.discovery.Resource")
 def test_get_category_name(MockResource):
     """Tests getting category name from YouTube API."""
@@ -577,29 +598,138 @@ def test_get_trending_videos_dlp(
     assert MOCK_TREND_DLP_3 in videos
 
 
-@patch("src.helpers.youtube_helper.YouTubeTranscriptApi.get_transcript")
-def test_get_transcript_success(mock_api_get_transcript):
-    """Tests getting transcript successfully."""
-    from src.helpers.youtube_helper import get_transcript
+def test_enrich_videos_dlp_fills_missing_fields():
+    """Tests that flat results get their upload date and keep their position."""
+    from src.helpers import youtube_helper
 
-    mock_api_get_transcript.return_value = [
-        {"text": "Hello world", "start": 0.5, "duration": 1.2},
-        {"text": "this is a test", "start": 2.0, "duration": 1.8},
+    flat = [
+        Video(
+            video_id="a",
+            title="A",
+            views=5,
+            tags="x",
+            upload_date=dt.datetime(2024, 1, 1),
+            place=1,
+        ),
+        Video(video_id="b", title="B", place=2),
     ]
+    full = Video(
+        video_id="b", title="B", views=42, tags="ki", upload_date=dt.datetime(2025, 3, 1)
+    )
+    with patch.object(
+        youtube_helper, "get_video_data_dlp", return_value=full
+    ) as get_video_data_dlp:
+        videos = youtube_helper.enrich_videos_dlp(flat, budget_s=5)
+
+    get_video_data_dlp.assert_called_once_with("b")
+    assert videos[0] is flat[0]
+    assert (videos[1].views, videos[1].tags, videos[1].place) == (42, "ki", 2)
+    assert videos[1].upload_date == dt.datetime(2025, 3, 1)
+
+
+def test_enrich_videos_dlp_respects_budget():
+    """Tests that slow metadata fetches do not delay the results past the budget."""
+    import threading
+    import time
+
+    from src.helpers import youtube_helper
+
+    release = threading.Event()
+
+    def slow(video_id):
+        release.wait(5)
+        return None
+
+    flat = [Video(video_id="slow", title="Langsam")]
+    with patch.object(youtube_helper, "get_video_data_dlp", side_effect=slow):
+        started = time.perf_counter()
+        videos = youtube_helper.enrich_videos_dlp(flat, budget_s=0.05)
+        elapsed = time.perf_counter() - started
+        release.set()
+
+    assert videos == flat
+    assert elapsed < 2
+
+
+def make_track(language_code, is_generated=False, text="Hallo Welt"):
+    """Builds a fake transcript track as listed by YouTubeTranscriptApi."""
+    track = MagicMock(
+        language_code=language_code, is_generated=is_generated, is_translatable=True
+    )
+    track.fetch.return_value = [MagicMock(text=text), MagicMock(text="Test")]
+    translated = MagicMock(language_code="de")
+    translated.fetch.return_value = [MagicMock(text="Übersetzt")]
+    track.translate.return_value = translated
+    return track
+
+
+@patch("src.helpers.youtube_helper.YouTubeTranscriptApi.list_transcripts")
+def test_get_transcript_success(mock_list_transcripts):
+    """Tests that a manual track is preferred over a generated one."""
+    from src.helpers.youtube_helper import get_transcript
+
+    generated = make_track("en", is_generated=True, text="generated")
+    manual = make_track("en", text="Hello world")
+    mock_list_transcripts.return_value = [generated, manual]
+
     transcript = get_transcript("v1", required_languages=["en"])
-    assert transcript == "Hello world this is a test"
-    mock_api_get_transcript.assert_called_once_with("v1", languages=["en"])
+
+    assert transcript == "Hello world Test"
+    mock_list_transcripts.assert_called_once_with("v1")
+    generated.fetch.assert_not_called()
+
+
+@patch("src.helpers.youtube_helper.YouTubeTranscriptApi.list_transcripts")
+def test_get_transcript_translates_other_languages(mock_list_transcripts):
+    """Tests that a track in another language is translated by YouTube."""
+    from src.helpers.youtube_helper import get_transcript
+
+    track = make_track("ja")
+    mock_list_transcripts.return_value = [track]
+
+    assert get_transcript("v3") == "Übersetzt"
+    track.translate.assert_called_once_with("de")
+    track.fetch.assert_not_called()
 
 
-@patch("src.helpers.youtube_helper.YouTubeTranscriptApi.get_transcript")
-def test_get_transcript_failure(mock_api_get_transcript):
+@patch("src.helpers.youtube_helper.YouTubeTranscriptApi.list_transcripts")
+def test_get_transcript_index_only_serves_default_languages(mock_list_transcripts):
+    """Tests that a translated default transcript is not returned for other languages."""
+    from src.helpers.search_index_helper import get_indexed_transcript
+    from src.helpers.youtube_helper import get_transcript
+
+    mock_list_transcripts.return_value = [make_track("ja", text="こんにちは")]
+
+    assert get_transcript("v5") == "Übersetzt"
+    assert get_transcript("v5", required_languages=["ja"]) == "こんにちは Test"
+    assert get_transcript("v5") == "Übersetzt"
+    assert get_indexed_transcript("v5") == "Übersetzt"
+    assert mock_list_transcripts.call_count == 2
+
+
+@patch("src.helpers.youtube_helper.YouTubeTranscriptApi.list_transcripts")
+def test_get_transcript_caches_missing_tracks(mock_list_transcripts):
+    """Tests that videos without tracks are not listed again."""
+    from youtube_transcript_api import TranscriptsDisabled
+
+    from src.helpers.youtube_helper import get_transcript
+
+    mock_list_transcripts.side_effect = TranscriptsDisabled("v4")
+
+    assert get_transcript("v4") == ""
+    assert get_transcript("v4") == ""
+    mock_list_transcripts.assert_called_once_with("v4")
+
+
+@patch("src.helpers.youtube_helper.YouTubeTranscriptApi.list_transcripts")
+def test_get_transcript_failure(mock_list_transcripts):
     """Tests getting transcript when the API fails."""
     from src.helpers.youtube_helper import get_transcript
 
-    mock_api_get_transcript.side_effect = Exception("API Error")
+    mock_list_transcripts.side_effect = Exception("API Error")
     transcript = get_transcript("v2")
     assert transcript == ""
-    mock_api_get_transcript.assert_called_once_with("v2", languages=["de", "en"])
+    mock_list_transcripts.assert_called_once_with("v2")
 
 
 def test_parse_duration():
@@ -609,8 +739,8 @@ def test_parse_duration():
     assert parse_duration("PT1M30S") == "01:30"
     assert parse_duration("PT5S") == "00:05"
     assert parse_duration("PT10M") == "10:00"
-    assert parse_duration("PT1H5M10S") == "05:10"
-    assert parse_duration("P1DT12H30M5S") == "30:05"
+    assert parse_duration("PT1H5M10S") == "65:10"
+    assert parse_duration("P1DT12H30M5S") == "2190:05"
     assert parse_duration("PT") == "00:00"
     assert parse_duration("Invalid") == "00:00"
 
@@ -627,7 +757,7 @@ def test_get_video_length_api(MockResource):
 
     length = get_video_length(mock_youtube, "v1")
 
-    assert length == "02:15"
+    assert length == 135
     mock_videos_list.assert_called_once_with(part="snippet,contentDetails", id="v1")
     mock_execute.assert_called_once()
 
@@ -642,7 +772,7 @@ def test_get_video_length_api_not_found(MockResource):
     mock_execute.return_value = {"items": []}
 
     length = get_video_length(mock_youtube, "v_nonexistent")
-    assert length == "00:00"
+    assert length == 0
 
 
 @patch("yt_dlp.YoutubeDL")
@@ -656,7 +786,7 @@ def test_get_video_length_dlp(mock_yt_dlp_cls):
 
     length = get_video_length_dlp("v1")
 
-    assert length == "02:15"
+    assert length == 135
     mock_ydl_instance.extract_info.assert_called_once_with(
         f"https://www.youtube.com/watch?v=v1", download=False
     )
@@ -671,10 +801,10 @@ def test_get_video_length_dlp_failure(mock_yt_dlp_cls):
     mock_yt_dlp_cls.return_value.__enter__.return_value = mock_ydl_instance
 
     mock_ydl_instance.extract_info.return_value = {}
-    assert get_video_length_dlp("v_nodur") == "00:00"
+    assert get_video_length_dlp("v_nodur") == 0
 
     mock_ydl_instance.extract_info.side_effect = Exception("yt-dlp error")
-    assert get_video_length_dlp("v_error") == "00:00"
+    assert get_video_length_dlp("v_error") == 0
 
 
 @patch("yt_dlp.YoutubeDL")
@@ -697,22 +827,26 @@ def test_get_video_data_dlp(mock_yt_dlp_cls):
 
     video_data = get_video_data_dlp("v1")
 
-    expected_data = {
-        "video_id": "v1",
-        "title": "Test Title",
-        "tags": "tag1, tag2",
-        "thumbnail": "thumb_url",
-        "length": "01:35",
-        "upload_date": dt.datetime(2023, 1, 15),
-        "channel_name": "Test Uploader",
-        "views": 12345,
-    }
+    expected_data = Video(
+        video_id="v1",
+        title="Test Title",
+        tags="tag1, tag2",
+        thumbnail="thumb_url",
+        duration_s=95,
+        upload_date=dt.datetime(2023, 1, 15),
+        channel_name="Test Uploader",
+        views=12345,
+    )
     assert video_data == expected_data
+    assert video_data["length"] == "01:35"
 
 
-@patch("src.helpers.youtube_helper.get_video_length", return_value="05:10")
+@patch(
+    "src.helpers.youtube_helper.get_video_lengths",
+    return_value={"vid1": 310, "vid2": 310},
+)
 @patch("googleapiclient.discovery.Resource")
-def test_get_video_data_api(MockResource, mock_get_len):
+def test_get_video_data_api(MockResource, mock_get_lengths):
     """Tests getting video data from API response (e.g., search results)."""
     from src.helpers.youtube_helper import get_video_data
 
@@ -758,8 +892,9 @@ def test_get_video_data_api(MockResource, mock_get_len):
     assert videos[0]["tags"] == "Keine Tags"
     assert videos[0]["thumbnail"] == "thumb2_url"
     assert videos[0]["length"] == "05:10"
-    assert videos[0]["views"] == "12345"
-    assert videos[0]["upload_date"] == "2023-10-27T11:00:00Z"
+    assert videos[0]["views"] == 12345
+    assert videos[0].duration_s == 310
+    assert videos[0]["upload_date"] == dt.datetime(2023, 10, 27, 11, 0)
 
     assert videos[1]["video_id"] == "vid1"
     assert videos[1]["title"] == "Title 1"
@@ -767,12 +902,10 @@ def test_get_video_data_api(MockResource, mock_get_len):
     assert videos[1]["tags"] == "api, test"
     assert videos[1]["thumbnail"] == "thumb1_url"
     assert videos[1]["length"] == "05:10"
-    assert videos[1]["views"] == "12345"
-    assert videos[1]["upload_date"] == "2023-10-26T10:00:00Z"
+    assert videos[1]["views"] == 12345
+    assert videos[1]["upload_date"] == dt.datetime(2023, 10, 26, 10, 0)
 
-    mock_get_len.assert_has_calls(
-        [call(mock_youtube, "vid1"), call(mock_youtube, "vid2")]
-    )
+    mock_get_lengths.assert_called_once_with(mock_youtube, ["vid1", "vid2"])
     mock_stats_execute.assert_has_calls([call(), call()])
 
 
@@ -802,3 +935,58 @@ def test_create_youtube_client(mock_build):
     client = create_youtube_client(api_key)
     mock_build.assert_called_once_with("youtube", "v3", developerKey=api_key)
     assert client == mock_build.return_value
+
+
+@patch("src.helpers.youtube_helper._schedule_views_refresh")
+@patch("yt_dlp.YoutubeDL")
+def test_get_video_data_dlp_uses_metadata_cache(mock_yt_dlp_cls, mock_schedule):
+    """Tests that a second call is served from the persistent metadata cache."""
+    from src.helpers.youtube_helper import get_video_data_dlp
+
+    mock_ydl_instance = MagicMock()
+    mock_yt_dlp_cls.return_value.__enter__.return_value = mock_ydl_instance
+    mock_ydl_instance.extract_info.return_value = {
+        "title": "Cached",
+        "duration": 60,
+        "upload_date": "20240101",
+        "uploader": "Uploader",
+        "view_count": 5,
+    }
+
+    first = get_video_data_dlp("cache_me")
+    second = get_video_data_dlp("cache_me")
+
+    assert first == second
+    assert second["upload_date"] == dt.datetime(2024, 1, 1)
+    mock_ydl_instance.extract_info.assert_called_once()
+    mock_schedule.assert_not_called()
+
+
+@patch("src.helpers.youtube_helper._refresh_executor")
+@patch("src.helpers.youtube_helper._extract_video_info_dlp")
+def test_get_video_data_dlp_refreshes_stale_views(mock_extract, mock_executor):
+    """Tests that stale views are served from cache and refreshed in the background."""
+    from src.helpers.youtube_helper import get_video_data_dlp
+    from src.helpers.cache_helper import store_video_metadata, VOLATILE_TTL
+
+    mock_executor.submit.side_effect = lambda func, *args: func(*args)
+
+    with patch("src.helpers.cache_helper.time.time", return_value=1000.0):
+        store_video_metadata({"video_id": "stale", "title": "Old", "views": 1})
+    mock_extract.return_value = {"view_count": 99}
+
+    with patch(
+        "src.helpers.cache_helper.time.time", return_value=1000.0 + VOLATILE_TTL + 1
+    ):
+        video = get_video_data_dlp("stale")
+
+    assert video == Video(video_id="stale", title="Old", views=1)
+    mock_extract.assert_called_once_with("stale")
+
+    with patch(
+        "src.helpers.cache_helper.time.time", return_value=1000.0 + VOLATILE_TTL + 2
+    ):
+        refreshed = get_video_data_dlp("stale")
+
+    assert refreshed == Video(video_id="stale", title="Old", views=99)
+    mock_extract.assert_called_once_with("stale")
@@ -0,0 +1,63 @@
+import json
+import copy
+import pytest
+
+
+def test_run_benchmarks_report():
+    """Tests that a benchmark run yields comparable call counts and quota units."""
+    from benchmarks.run_benchmarks import run_benchmarks
+
+    report = run_benchmarks(
+        ["get_trending_videos", "get_recent_videos_from_channels_RSS"],
+        size=3,
+        repeat=1,
+    )
+
+    assert report["meta"]["size"] == 3
+    trending = report["results"]["get_trending_videos"]
+    # One chart request with the lengths plus one views request per video.
+    assert trending["cold"]["calls"] == {"youtube.videos.list": 4}
+    assert trending["cold"]["quota_units"] == 4
+    assert trending["warm"]["calls"] == {}
+    assert set(trending["cold"]["wall_time_s"]) == {"min", "median", "mean", "max"}
+
+    rss = report["results"]["get_recent_videos_from_channels_RSS"]
+    assert rss["cold"]["calls"] == {"rss.feed": 3, "ytdlp.extract_info": 3}
+    json.dumps(report)
+
+
+def test_run_benchmarks_unknown_case():
+    """Tests that unknown case names are rejected."""
+    from benchmarks.run_benchmarks import run_benchmarks
+
+    with pytest.raises(ValueError):
+        run_benchmarks(["does_not_exist"], size=1, repeat=1)
+
+
+def test_compare_reports():
+    """Tests detection of slower runs and additional calls or quota."""
+    from benchmarks.run_benchmarks import compare_reports
+
+    baseline = {
+        "results": {
+            "case": {
+                "cold": {
+                    "wall_time_s": {"median": 1.0},
+                    "calls": {"youtube.videos.list": 2},
+                    "quota_units": 2,
+                }
+            }
+        }
+    }
+    assert compare_reports(baseline, baseline) == []
+
+    current = copy.deepcopy(baseline)
+    current["results"]["case"]["cold"]["wall_time_s"]["median"] = 1.5
+    current["results"]["case"]["cold"]["calls"]["youtube.search.list"] = 1
+    current["results"]["case"]["cold"]["quota_units"] = 102
+
+    regressions = compare_reports(baseline, current, tolerance=0.25)
+    assert len(regressions) == 3
+    assert compare_reports(baseline, current, tolerance=1.0)[0].startswith(
+        "case (cold): Quota"
+    )
@@ -0,0 +1,83 @@
+import os
+from unittest.mock import patch
+
+import pandas as pd
+
+
+@patch("src.ingest_worker.refresh_trending_regions", return_value=3)
+@patch("src.ingest_worker.ingest_channels")
+@patch("src.ingest_worker.get_subscriptions")
+def test_main_once_ingests_subscribed_channels(
+    mock_get_subscriptions, mock_ingest_channels, mock_refresh, tmp_path, monkeypatch
+):
+    """Testet einen einzelnen Durchlauf über die abonnierten Kanäle."""
+    from src.helpers.ingest_helper import IngestStats
+    from src.ingest_worker import PID_FILE, main
+
+    monkeypatch.chdir(tmp_path)
+    mock_get_subscriptions.return_value = pd.DataFrame(
+        {"channel_id": ["UC1", "UC2", "UC1"]}
+    )
+    mock_ingest_channels.return_value = IngestStats(channels=2, new_videos=3)
+
+    main(["--once"])
+
+    mock_ingest_channels.assert_called_once_with(["UC1", "UC2"])
+    mock_refresh.assert_called_once()
+    assert not os.path.exists(PID_FILE)
+
+
+@patch("src.ingest_worker.get_subscriptions")
+def test_load_subscribed_channel_ids_includes_all_users(
+    mock_get_subscriptions, tmp_path, monkeypatch
+):
+    """Testet, dass auch die Abos der Nutzer in user_data/ geladen werden."""
+    from src.ingest_worker import load_subscribed_channel_ids
+
+    monkeypatch.chdir(tmp_path)
+    mock_get_subscriptions.return_value = pd.DataFrame({"channel_id": ["UC1", "UC2"]})
+    for user, channel_ids in (("alice", ["UC2", "UC3"]), ("bob", ["UC4"])):
+        directory = tmp_path / "user_data" / user
+        directory.mkdir(parents=True)
+        pd.DataFrame({"channel_id": channel_ids}).to_csv(
+            directory / "subscriptions.csv", index=False
+        )
+    (tmp_path / "user_data" / "carol").mkdir()
+
+    assert load_subscribed_channel_ids() == ["UC1", "UC2", "UC3", "UC4"]
+
+
+@patch("src.ingest_worker.get_subscriptions")
+def test_load_subscribed_channel_ids_without_channel_id(
+    mock_get_subscriptions, tmp_path, monkeypatch
+):
+    """Testet, dass die Abos der Nutzer auch ohne CHANNEL_ID geladen werden."""
+    from src.ingest_worker import load_subscribed_channel_ids
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("CHANNEL_ID", raising=False)
+    directory = tmp_path / "user_data" / "alice"
+    directory.mkdir(parents=True)
+    pd.DataFrame({"channel_id": ["UC3"]}).to_csv(
+        directory / "subscriptions.csv", index=False
+    )
+
+    assert load_subscribed_channel_ids() == ["UC3"]
+    mock_get_subscriptions.assert_not_called()
+
+
+@patch("src.ingest_worker.refresh_trending_regions", return_value=0)
+@patch("src.ingest_worker.load_subscribed_channel_ids", side_effect=ValueError("kaputt"))
+@patch("src.ingest_worker.create_client", return_value=None)
+def test_run_cycle_logs_instead_of_printing(
+    mock_create_client, mock_load, mock_refresh, capsys
+):
+    """Testet, dass Fehler über den Logger statt über stdout gemeldet werden."""
+    from src.ingest_worker import run_cycle
+
+    with patch("src.ingest_worker.logger") as mock_logger:
+        run_cycle()
+
+    mock_logger.warning.assert_called_once()
+    assert "Abos konnten nicht geladen werden" in mock_logger.warning.call_args.args[0]
+    assert capsys.readouterr().out == ""
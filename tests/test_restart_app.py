@@ -146,14 +146,34 @@ def test_restart_app(mock_popen, mock_load_env, monkeypatch):
     assert popen_kwargs["env"] == expected_env
 
 
+# === Tests für den Ingest-Worker ===
+
+
+@patch("src.restart_app.os.kill")
+def test_stop_ingest_worker_uses_pid_file(mock_os_kill, tmp_path, monkeypatch):
+    """Testet, dass der Worker aus der PID-Datei beendet wird."""
+    from src.restart_app import stop_ingest_worker
+
+    monkeypatch.chdir(tmp_path)
+    stop_ingest_worker()
+    mock_os_kill.assert_not_called()
+
+    (tmp_path / "ingest_worker.pid").write_text("4711")
+    stop_ingest_worker()
+    mock_os_kill.assert_called_once_with(4711, signal.SIGTERM)
+
+
 # === Test für den __main__ Block mit runpy ===
 
 
+@patch("src.restart_app.stop_ingest_worker")
 @patch("src.restart_app.kill_existing_streamlit")
 @patch("src.restart_app.clear_streamlit_cache")
 @patch("src.restart_app.restart_app")
 @patch("time.sleep")
-def test_main_execution(mock_sleep, mock_restart, mock_clear_cache, mock_kill):
+def test_main_execution(
+    mock_sleep, mock_restart, mock_clear_cache, mock_kill, mock_stop
+):
     """Testet, ob die Hauptfunktionen im __main__ Block aufgerufen werden."""
     try:
         from src.restart_app import main